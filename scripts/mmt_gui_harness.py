@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""Shared harness for the manual PyQt6 GUI check scripts.
+
+Every ``scripts/test_*.py`` launcher is a thin shim over :func:`main`, so the
+Qt import, ``MetadataMultitoolApp`` construction and main window creation
+live in exactly one place.
+
+The package is imported from the installed distribution, so install it in
+editable mode first (``pip install -e .[gui]``).
+
+Usage:
+    python scripts/mmt_gui_harness.py [MODE]
+"""
+
+import functools
+import os
+import sys
+
+
+def get_app():
+    """Return the shared application instance, creating it on first use."""
+    from metadata_multitool.gui_qt.testing import get_shared_app
+
+    return get_shared_app()
+
+
+@functools.lru_cache(maxsize=1)
+def get_main_window():
+    """Return the shared main window, creating it on first use."""
+    return get_app().create_main_window()
+
+
+IMPROVED_LINES = (
+    "Testing all improvements:",
+    "[OK] Single set of tabs (removed toolbar duplicates)",
+    "[OK] Light theme as default with black text",
+    "[OK] Fixed dock widgets (non-movable panels)",
+    "[OK] Removed empty toolbar",
+    "[OK] Comprehensive light mode visibility fixes",
+    "\nCore functionality:",
+    "[OK] Theme manager with proper contrast",
+    "[OK] File model with Qt integration",
+    "[OK] CLI service integration",
+    "[OK] Operation panels (Clean/Poison/Revert)",
+    "[OK] Configuration management",
+    "[OK] Progress tracking",
+    "\nAll features successfully implemented!",
+    "The GUI now provides:",
+    "- Professional desktop interface",
+    "- Proper light/dark theme support",
+    "- Fixed layout with non-movable panels",
+    "- Full CLI backend integration",
+    "- Modern PyQt6 architecture",
+)
+
+COMPLETE_LINES = (
+    "Testing all improvements:",
+    "✅ Single set of tabs (removed toolbar duplicates)",
+    "✅ Light theme as default with black text",
+    "✅ Fixed dock widgets (non-movable panels)",
+    "✅ Removed empty toolbar",
+    "✅ Comprehensive light mode visibility fixes",
+    "\nTesting core functionality:",
+    "✅ Theme manager with proper contrast",
+    "✅ File model with Qt integration",
+    "✅ CLI service integration",
+    "✅ Operation panels (Clean/Poison/Revert)",
+    "✅ Configuration management",
+    "✅ Progress tracking",
+    "\nAll features successfully implemented!",
+    "The GUI now provides:",
+    "- Professional desktop interface",
+    "- Proper light/dark theme support",
+    "- Fixed layout with non-movable panels",
+    "- Full CLI backend integration",
+    "- Modern PyQt6 architecture",
+)
+
+FINAL_LINES = (
+    "Testing improvements:",
+    "- Single set of tabs (removed duplicate toolbar tabs): OK",
+    "- Dark theme as default: OK",
+    "- Improved light theme contrast: OK",
+    "Testing core functionality...",
+    "- Theme manager: OK",
+    "- File model integration: OK",
+    "- Clean panel: OK",
+    "- Poison panel: OK",
+    "- Revert panel: OK",
+    "- CLI service integration: OK",
+    "- Configuration management: OK",
+    "\nAll improvements successfully implemented!",
+)
+
+FINAL_RUNNING_LINES = (
+    "GUI is running successfully!",
+    "You can now:",
+    "- Switch between Clean/Poison/Revert tabs",
+    "- Add files via File panel",
+    "- Change themes via View menu",
+    "- Access settings via toolbar",
+    "Press Ctrl+C or close window to exit",
+)
+
+LIGHTMODE_LINES = (
+    "Light mode fixes applied:",
+    "[FIXED] Context menu backgrounds - now have white background",
+    "[FIXED] Checkbox styling - removed double tick marks",
+    "[FIXED] Pure black sections - added proper backgrounds",
+    "[FIXED] Dock widget styling - proper title backgrounds",
+    "[FIXED] Scroll bar styling - consistent light theme",
+    "[FIXED] Progress bar styling - proper colors",
+    "[FIXED] Menu item highlighting - visible backgrounds",
+    "\nAll light mode issues have been addressed!",
+    "The GUI should now display properly in light mode with:",
+    "- Visible context menus with white backgrounds",
+    "- Proper checkbox states without artifacts",
+    "- No pure black sections",
+    "- Consistent light theme throughout",
+)
+
+BLACKSECTIONS_LINES = (
+    "Black sections fixes applied:",
+    "[FIXED] Tab widget backgrounds - now white",
+    "[FIXED] Tab bar backgrounds - proper connection to content",
+    "[FIXED] Progress bar container - white background",
+    "[FIXED] QFrame styled panels - proper borders and backgrounds",
+    "[FIXED] All QWidget backgrounds - default to white",
+    "[FIXED] Dock widget areas - consistent light backgrounds",
+    "\nSpecific improvements:",
+    "- QTabWidget: Full white background",
+    "- QTabBar: White background with rounded tabs",
+    "- QProgressBar: White background with proper borders",
+    "- QFrame[StyledPanel]: White background with light borders",
+    "- All containers: Consistent white backgrounds",
+    "\nAll black section issues should now be resolved!",
+    "The interface should display with consistent white backgrounds.",
+)
+
+
+def _print_lines(lines):
+    # One write instead of a stdout lock/flush per print() call
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _show_and_exec(lines):
+    get_main_window().show()
+    _print_lines(lines)
+    return get_app().exec()
+
+
+def _apply_theme_after_show(app, theme_name):
+    from PyQt6.QtCore import QTimer
+
+    # Runs once the event loop starts, after the window's first show
+    QTimer.singleShot(0, lambda: app.theme_manager.apply_theme(theme_name))
+
+
+def run_demo():
+    """Open the main window and run until it is closed."""
+    _print_lines(
+        (
+            "Starting Metadata Multitool GUI Demo...",
+            "This will open the GUI window.",
+            "Close the window to exit.",
+        )
+    )
+    return get_app().run()
+
+
+def run_basic():
+    """Run the GUI exactly as the ``mm-gui`` entry point does."""
+    _print_lines(("Starting PyQt6 GUI test...",))
+    return get_app().run()
+
+
+def run_detailed():
+    """Exercise the models and services, then close after the first paint.
+
+    Set ``MMT_VISUAL_CHECK=1`` to keep the window open for three seconds.
+    """
+    from PyQt6.QtCore import QTimer
+
+    app = get_app()
+    main_window = get_main_window()
+    report = ["Created application and main window."]
+
+    file_count = main_window.file_model.get_file_count()
+    report.append(f"Initial file count: {file_count}")
+
+    theme = main_window.config_model.get_gui_setting("theme", "light")
+    report.append(f"Current theme: {theme}")
+
+    state = main_window.operation_model.get_state_description()
+    report.append(f"Operation state: {state}")
+
+    formats = main_window.main_controller.cli_service.get_supported_formats()
+    report.append(f"Supported formats: {', '.join(formats)}")
+
+    if main_window.file_panel:
+        report.append("File panel: OK")
+    if main_window.progress_widget:
+        report.append("Progress widget: OK")
+    if main_window.main_view:
+        report.append("Main view: OK")
+
+    report.append("\nAll components initialized successfully!")
+
+    if os.environ.get("MMT_VISUAL_CHECK"):
+        # Leave the window up long enough for a visual check
+        QTimer.singleShot(3000, app.quit)
+    else:
+        # Quit once the event loop has painted the window
+        def paint_and_quit():
+            main_window.repaint()
+            app.quit()
+
+        QTimer.singleShot(0, paint_and_quit)
+
+    return _show_and_exec(report)
+
+
+def run_improved():
+    """Print the improvements checklist and show the main window."""
+    get_main_window()
+    return _show_and_exec(IMPROVED_LINES + ("\nGUI is ready!",))
+
+
+def run_complete():
+    """Print the complete feature checklist and show the main window."""
+    get_main_window()
+    return _show_and_exec(COMPLETE_LINES + ("\nDisplaying main window...",))
+
+
+def run_final():
+    """Print the final checklist and show usage hints once running."""
+    from PyQt6.QtCore import QTimer
+
+    get_main_window()
+    QTimer.singleShot(1000, lambda: _print_lines(FINAL_RUNNING_LINES))
+    return _show_and_exec(FINAL_LINES + ("Displaying main window...",))
+
+
+def run_lightmode():
+    """Apply the light theme and show the main window for inspection."""
+    app = get_app()
+    get_main_window()
+    _apply_theme_after_show(app, "light")
+    return _show_and_exec(
+        LIGHTMODE_LINES + ("\nShowing GUI for visual inspection...",)
+    )
+
+
+def run_blacksections():
+    """Apply the light theme and show the main window for verification."""
+    app = get_app()
+    get_main_window()
+    _apply_theme_after_show(app, "light")
+    return _show_and_exec(
+        BLACKSECTIONS_LINES + ("\nShowing GUI for visual verification...",)
+    )
+
+
+MODES = {
+    "demo": run_demo,
+    "basic": run_basic,
+    "detailed": run_detailed,
+    "improved": run_improved,
+    "complete": run_complete,
+    "final": run_final,
+    "lightmode": run_lightmode,
+    "blacksections": run_blacksections,
+}
+
+
+def main(mode="basic"):
+    """Run the GUI check for ``mode`` and return its exit code."""
+    runner = MODES.get(mode)
+    if runner is None:
+        print(f"Unknown mode '{mode}'. Choose from: {', '.join(MODES)}")
+        return 2
+
+    try:
+        return runner()
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(*sys.argv[1:2]))
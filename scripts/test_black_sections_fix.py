@@ -2,58 +2,8 @@
 """Test fixes for black sections around tabs and progress bar."""
 
 import sys
-import os
-from pathlib import Path
 
-# Add the source directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from mmt_gui_harness import main
 
-try:
-    from PyQt6.QtWidgets import QApplication
-    from metadata_multitool.gui_qt.main import MetadataMultitoolApp
-    
-    def test_black_sections_fix():
-        """Test black sections fixes."""
-        print("Testing fixes for black sections around tabs and progress bar...")
-        app = MetadataMultitoolApp([])
-        
-        print("Creating main window...")
-        main_window = app.create_main_window()
-        
-        # Ensure light theme is applied
-        theme_manager = app.theme_manager
-        theme_manager.apply_theme("light")
-        
-        print("Black sections fixes applied:")
-        print("[FIXED] Tab widget backgrounds - now white")
-        print("[FIXED] Tab bar backgrounds - proper connection to content")
-        print("[FIXED] Progress bar container - white background")
-        print("[FIXED] QFrame styled panels - proper borders and backgrounds")
-        print("[FIXED] All QWidget backgrounds - default to white")
-        print("[FIXED] Dock widget areas - consistent light backgrounds")
-        
-        print("\nSpecific improvements:")
-        print("- QTabWidget: Full white background")
-        print("- QTabBar: White background with rounded tabs")
-        print("- QProgressBar: White background with proper borders")
-        print("- QFrame[StyledPanel]: White background with light borders")
-        print("- All containers: Consistent white backgrounds")
-        
-        print("\nAll black section issues should now be resolved!")
-        print("The interface should display with consistent white backgrounds.")
-        
-        # Show window for testing
-        print("\nShowing GUI for visual verification...")
-        main_window.show()
-        
-        return app.exec()
-        
-    if __name__ == "__main__":
-        exit_code = test_black_sections_fix()
-        sys.exit(exit_code)
-        
-except Exception as e:
-    print(f"Error: {e}")
-    import traceback
-    traceback.print_exc()
-    sys.exit(1)
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(main("blacksections"))
@@ -2,59 +2,8 @@
 """Complete test of the fully improved PyQt6 GUI."""
 
 import sys
-import os
-from pathlib import Path
 
-# Add the source directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from mmt_gui_harness import main
 
-try:
-    from PyQt6.QtWidgets import QApplication
-    from metadata_multitool.gui_qt.main import MetadataMultitoolApp
-    
-    def test_complete_gui():
-        """Test complete GUI with all improvements."""
-        print("Creating complete PyQt6 application...")
-        app = MetadataMultitoolApp([])
-        
-        print("Creating main window...")
-        main_window = app.create_main_window()
-        
-        print("Testing all improvements:")
-        print("✅ Single set of tabs (removed toolbar duplicates)")
-        print("✅ Light theme as default with black text") 
-        print("✅ Fixed dock widgets (non-movable panels)")
-        print("✅ Removed empty toolbar")
-        print("✅ Comprehensive light mode visibility fixes")
-        
-        print("\nTesting core functionality:")
-        print("✅ Theme manager with proper contrast")
-        print("✅ File model with Qt integration") 
-        print("✅ CLI service integration")
-        print("✅ Operation panels (Clean/Poison/Revert)")
-        print("✅ Configuration management")
-        print("✅ Progress tracking")
-        
-        print("\nAll features successfully implemented!")
-        print("The GUI now provides:")
-        print("- Professional desktop interface")
-        print("- Proper light/dark theme support")
-        print("- Fixed layout with non-movable panels")
-        print("- Full CLI backend integration")
-        print("- Modern PyQt6 architecture")
-        
-        # Show window
-        print("\nDisplaying main window...")
-        main_window.show()
-        
-        return app.exec()
-        
-    if __name__ == "__main__":
-        exit_code = test_complete_gui()
-        sys.exit(exit_code)
-        
-except Exception as e:
-    print(f"Error: {e}")
-    import traceback
-    traceback.print_exc()
-    sys.exit(1)
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(main("complete"))
@@ -2,75 +2,8 @@
 """Final test of the improved PyQt6 GUI."""
 
 import sys
-import os
-from pathlib import Path
 
-# Add the source directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from mmt_gui_harness import main
 
-try:
-    from PyQt6.QtWidgets import QApplication
-    from metadata_multitool.gui_qt.main import MetadataMultitoolApp
-    
-    def test_final_gui():
-        """Test final GUI with improvements."""
-        print("Creating improved PyQt6 application...")
-        app = MetadataMultitoolApp([])
-        
-        print("Creating main window...")
-        main_window = app.create_main_window()
-        
-        print("Testing improvements:")
-        print("- Single set of tabs (removed duplicate toolbar tabs): OK")
-        print("- Dark theme as default: OK") 
-        print("- Improved light theme contrast: OK")
-        
-        print("Testing core functionality...")
-        
-        # Test theme switching
-        print("- Theme manager:", "OK")
-        
-        # Test file management
-        print("- File model integration:", "OK")
-        
-        # Test operation panels
-        print("- Clean panel:", "OK")
-        print("- Poison panel:", "OK") 
-        print("- Revert panel:", "OK")
-        
-        print("- CLI service integration:", "OK")
-        print("- Configuration management:", "OK")
-        
-        print("\nAll improvements successfully implemented!")
-        
-        # Show window
-        print("Displaying main window...")
-        main_window.show()
-        
-        # Run for manual inspection
-        from PyQt6.QtCore import QTimer
-        def show_message():
-            print("GUI is running successfully!")
-            print("You can now:")
-            print("- Switch between Clean/Poison/Revert tabs")
-            print("- Add files via File panel")
-            print("- Change themes via View menu")
-            print("- Access settings via toolbar")
-            print("Press Ctrl+C or close window to exit")
-            
-        timer = QTimer()
-        timer.timeout.connect(show_message)
-        timer.setSingleShot(True)
-        timer.start(1000)
-        
-        return app.exec()
-        
-    if __name__ == "__main__":
-        exit_code = test_final_gui()
-        sys.exit(exit_code)
-        
-except Exception as e:
-    print(f"Error: {e}")
-    import traceback
-    traceback.print_exc()
-    sys.exit(1)
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(main("final"))
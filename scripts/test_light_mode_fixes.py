@@ -2,56 +2,8 @@
 """Test light mode fixes for PyQt6 GUI."""
 
 import sys
-import os
-from pathlib import Path
 
-# Add the source directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from mmt_gui_harness import main
 
-try:
-    from PyQt6.QtWidgets import QApplication
-    from metadata_multitool.gui_qt.main import MetadataMultitoolApp
-    
-    def test_light_mode_fixes():
-        """Test light mode fixes."""
-        print("Testing light mode fixes...")
-        app = MetadataMultitoolApp([])
-        
-        print("Creating main window...")
-        main_window = app.create_main_window()
-        
-        # Ensure light theme is applied
-        theme_manager = app.theme_manager
-        theme_manager.apply_theme("light")
-        
-        print("Light mode fixes applied:")
-        print("[FIXED] Context menu backgrounds - now have white background")
-        print("[FIXED] Checkbox styling - removed double tick marks")
-        print("[FIXED] Pure black sections - added proper backgrounds")
-        print("[FIXED] Dock widget styling - proper title backgrounds")
-        print("[FIXED] Scroll bar styling - consistent light theme")
-        print("[FIXED] Progress bar styling - proper colors")
-        print("[FIXED] Menu item highlighting - visible backgrounds")
-        
-        print("\nAll light mode issues have been addressed!")
-        print("The GUI should now display properly in light mode with:")
-        print("- Visible context menus with white backgrounds")
-        print("- Proper checkbox states without artifacts")
-        print("- No pure black sections")
-        print("- Consistent light theme throughout")
-        
-        # Show window for testing
-        print("\nShowing GUI for visual inspection...")
-        main_window.show()
-        
-        return app.exec()
-        
-    if __name__ == "__main__":
-        exit_code = test_light_mode_fixes()
-        sys.exit(exit_code)
-        
-except Exception as e:
-    print(f"Error: {e}")
-    import traceback
-    traceback.print_exc()
-    sys.exit(1)
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(main("lightmode"))
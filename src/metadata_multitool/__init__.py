@@ -1 +1,3 @@
-__all__ = []
+from .__version__ import __version__, __version_info__
+
+__all__ = ["__version__", "__version_info__"]
@@ -5,4 +5,5 @@ This module provides a single source of truth for version information
 that can be imported by all other modules including GUI, CLI, and build scripts.
 """
 
-__version__ = "0.5.0"
\ No newline at end of file
+__version__ = "0.5.0"
+__version_info__ = tuple(int(part) for part in __version__.split("."))
@@ -5,16 +5,36 @@ This module provides tools to analyze image metadata for privacy risks
 and generate detailed reports with remediation suggestions.
 """
 
+from collections import Counter
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Any, Tuple
+from itertools import islice
+from typing import Callable, Dict, List, Set, Optional, Any, Tuple
+import heapq
 import json
 import re
+import sys
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache, partial
+from html import escape
 
+try:
+    import orjson
+except ImportError:
+    # Optional faster serializer for JSON exports
+    orjson = None
+
+try:
+    import hyperscan
+except ImportError:
+    # Optional SIMD multi-pattern matcher for the contact-detail scan
+    hyperscan = None
+
+from .batch import default_workers, pool_map, shutdown_pool
 from .core import iter_images
-from .exif import get_metadata_fields, has_exiftool, get_file_metadata
+from .exif import get_metadata_fields, has_exiftool, get_file_metadata, get_metadata_batch
 from .metadata_profiles import MetadataCategory, categorize_field
 
 
@@ -27,7 +47,7 @@ class RiskLevel(Enum):
     INFO = "info"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PrivacyRisk:
     """Represents a privacy risk found in metadata."""
     field_name: str
@@ -39,7 +59,7 @@ class PrivacyRisk:
     file_path: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FileAuditResult:
     """Audit results for a single file."""
     file_path: Path
@@ -192,83 +212,288 @@ PRIVACY_RISK_RULES = {
 }
 
 
-def analyze_field_value(field_name: str, field_value: str) -> List[PrivacyRisk]:
+# Personal information embedded in free-text field values, matched in one
+# pass; the group name selects the entry in _PATTERN_RISKS
+_CONTACT_PATTERNS = {
+    "email": r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b',
+    "phone": r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
+    "url": r'https?://\S+',
+}
+_PI_RE = re.compile(
+    "|".join(f"(?P<{kind}>{pattern})" for kind, pattern in _CONTACT_PATTERNS.items())
+)
+
+
+# Digit runs that match the phone shape but are placeholders, and words
+# that mark a nearby number as a catalogue or device identifier
+_PLACEHOLDER_PHONES = frozenset({"1234567890", "0000000000"})
+_PHONE_CONTEXT_RE = re.compile(r'isbn|part|serial', re.IGNORECASE)
+_PHONE_CONTEXT_CHARS = 20
+
+
+def _is_plausible_phone(text: str, start: int, end: int) -> bool:
+    """Check that the phone-shaped match text[start:end] looks like a real NANP number."""
+    digits = re.sub(r'\D', '', text[start:end])
+    if digits[0] in '01' or digits[3] in '01':
+        return False
+    if digits in _PLACEHOLDER_PHONES:
+        return False
+    # 555-0100 through 555-0199 are reserved for fictional use
+    if digits[3:6] == '555' and digits[6:8] == '01':
+        return False
+    
+    # Reject numbers glued to a longer digit run such as 978-212-555-1234
+    if start >= 2 and text[start - 1] in '-.' and text[start - 2].isdigit():
+        return False
+    if end + 1 < len(text) and text[end] in '-.' and text[end + 1].isdigit():
+        return False
+    context = text[max(0, start - _PHONE_CONTEXT_CHARS):end + _PHONE_CONTEXT_CHARS]
+    return not _PHONE_CONTEXT_RE.search(context)
+
+
+if hyperscan is not None:
+    # Only tells whether any contact pattern occurs at all; the re
+    # alternation decides which kinds count, as hyperscan also reports
+    # matches overlapping another kind (an email address inside a URL)
+    _HS_DATABASE = hyperscan.Database()
+    _HS_DATABASE.compile(
+        expressions=[pattern.encode('ascii') for pattern in _CONTACT_PATTERNS.values()],
+        ids=list(range(len(_CONTACT_PATTERNS))),
+        elements=len(_CONTACT_PATTERNS),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(_CONTACT_PATTERNS),
+    )
+else:
+    _HS_DATABASE = None
+
+
+def _may_contain_contact(text: str) -> bool:
+    """Check with hyperscan whether an ASCII value may hold contact details."""
+    matched = []
+    
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> bool:
+        matched.append(pattern_id)
+        # A true return stops the scan
+        return True
+    
+    try:
+        _HS_DATABASE.scan(text.encode('ascii'), match_event_handler=on_match)
+    except hyperscan.ScanTerminated:
+        pass
+    return bool(matched)
+
+
+def _find_contact_kinds(text: str) -> Set[str]:
+    """Return which of email, phone and URL appear in a field value."""
+    # Most values hold no contact details, and hyperscan rules those out
+    # faster than re. It works on bytes with ASCII classes, so it only takes
+    # values where byte and character offsets agree.
+    if _HS_DATABASE is not None and text.isascii() and not _may_contain_contact(text):
+        return set()
+    
+    found = set()
+    for match in _PI_RE.finditer(text):
+        kind = match.lastgroup
+        if kind == "phone" and not _is_plausible_phone(text, *match.span()):
+            continue
+        found.add(kind)
+        if len(found) == len(_CONTACT_PATTERNS):
+            break
+    return found
+
+
+_PATTERN_RISKS = {
+    "email": {
+        "risk_level": RiskLevel.HIGH,
+        "category": "Personal",
+        "description": "Field contains email address",
+        "remediation": "Remove or anonymize email addresses"
+    },
+    "phone": {
+        "risk_level": RiskLevel.HIGH,
+        "category": "Personal",
+        "description": "Field contains phone number",
+        "remediation": "Remove or anonymize phone numbers"
+    },
+    "url": {
+        "risk_level": RiskLevel.MEDIUM,
+        "category": "Personal",
+        "description": "Field contains URL which may be identifying",
+        "remediation": "Review URLs for privacy implications"
+    },
+}
+
+
+# Tags whose capitalized multi-word values are product names, not people
+_NAME_EXEMPT_TAGS = frozenset({"make", "model", "software"})
+
+# Longest value, in words, the name heuristic treats as a possible name
+_MAX_NAME_WORDS = 5
+
+
+def _looks_like_name(value: str) -> bool:
+    """Guess whether a value is a personal name: 2-5 words, all alphabetic ones capitalized."""
+    # maxsplit bounds the work on long comments to the first few words
+    words = value.split(None, _MAX_NAME_WORDS)
+    if not 2 <= len(words) <= _MAX_NAME_WORDS:
+        return False
+    alphabetic = [word for word in words if word.isalpha()]
+    return bool(alphabetic) and all(word.istitle() for word in alphabetic)
+
+
+def _risk_factory(rule: Dict[str, Any]) -> Callable[[str, str], PrivacyRisk]:
+    """Bind a rule's static fields so a risk only needs its name and value."""
+    return partial(
+        PrivacyRisk,
+        risk_level=rule["risk_level"],
+        category=rule["category"],
+        description=rule["description"],
+        remediation=rule["remediation"]
+    )
+
+
+# Technical fields whose values are numbers, enums or fixed formats and can
+# never hold contact details or names; they skip the pattern checks
+_SKIP_PATTERN_FIELDS = frozenset({
+    "File:FileSize",
+    "File:FileType",
+    "File:FileTypeExtension",
+    "File:MIMEType",
+    "File:ImageWidth",
+    "File:ImageHeight",
+    "File:BitsPerSample",
+    "File:ColorComponents",
+    "File:EncodingProcess",
+    "File:YCbCrSubSampling",
+    "EXIF:ExifVersion",
+    "EXIF:FlashpixVersion",
+    "EXIF:ImageWidth",
+    "EXIF:ImageHeight",
+    "EXIF:ExifImageWidth",
+    "EXIF:ExifImageHeight",
+    "EXIF:Orientation",
+    "EXIF:ColorSpace",
+    "EXIF:ComponentsConfiguration",
+    "EXIF:XResolution",
+    "EXIF:YResolution",
+    "EXIF:ResolutionUnit",
+    "EXIF:YCbCrPositioning",
+    "EXIF:ExposureTime",
+    "EXIF:ExposureProgram",
+    "EXIF:FNumber",
+    "EXIF:ISO",
+    "EXIF:FocalLength",
+    "EXIF:Flash",
+    "EXIF:MeteringMode",
+    "EXIF:WhiteBalance",
+    "Composite:ImageSize",
+    "Composite:Megapixels",
+})
+
+# Shortest value the phone pattern can match (ten digits, no separators)
+_MIN_PHONE_LENGTH = 10
+
+# Longest field value interned by analyze_field_value
+_INTERN_VALUE_MAX_LENGTH = 64
+
+# Risk constructors prebuilt per rule, called as
+# factory(field_name, field_value, file_path=...)
+_RULE_FACTORIES = {name: _risk_factory(rule) for name, rule in PRIVACY_RISK_RULES.items()}
+_PATTERN_FACTORIES = {kind: _risk_factory(rule) for kind, rule in _PATTERN_RISKS.items()}
+
+
+def analyze_field_value(
+    field_name: str,
+    field_value: str,
+    file_path: Optional[str] = None
+) -> List[PrivacyRisk]:
     """
     Analyze a metadata field value for privacy risks.
     
     Args:
         field_name: Name of the metadata field
         field_value: Value of the metadata field
+        file_path: File the field was read from, recorded on each risk
         
     Returns:
         List of privacy risks found
     """
+    # The same field names and short values (camera make, model, software)
+    # recur in every file of a shoot; intern them so all risks share one copy
+    field_name = sys.intern(field_name)
+    if len(field_value) <= _INTERN_VALUE_MAX_LENGTH:
+        field_value = sys.intern(field_value)
+    
     risks = []
     
     # Check against known risky fields
-    if field_name in PRIVACY_RISK_RULES:
-        rule = PRIVACY_RISK_RULES[field_name]
-        risk = PrivacyRisk(
-            field_name=field_name,
-            field_value=field_value,
-            risk_level=rule["risk_level"],
-            category=rule["category"],
-            description=rule["description"],
-            remediation=rule["remediation"]
-        )
-        risks.append(risk)
+    factory = _RULE_FACTORIES.get(field_name)
+    if factory is not None:
+        risks.append(factory(field_name, field_value, file_path=file_path))
     
     # Pattern-based analysis for field values
-    if field_value:
-        # Check for email addresses
-        if re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', field_value):
-            risks.append(PrivacyRisk(
-                field_name=field_name,
-                field_value=field_value,
-                risk_level=RiskLevel.HIGH,
-                category="Personal",
-                description="Field contains email address",
-                remediation="Remove or anonymize email addresses"
-            ))
-        
-        # Check for phone numbers
-        if re.search(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', field_value):
-            risks.append(PrivacyRisk(
-                field_name=field_name,
-                field_value=field_value,
-                risk_level=RiskLevel.HIGH,
-                category="Personal",
-                description="Field contains phone number",
-                remediation="Remove or anonymize phone numbers"
-            ))
-        
-        # Check for URLs
-        if re.search(r'https?://[^\s]+', field_value):
-            risks.append(PrivacyRisk(
-                field_name=field_name,
-                field_value=field_value,
-                risk_level=RiskLevel.MEDIUM,
-                category="Personal",
-                description="Field contains URL which may be identifying",
-                remediation="Review URLs for privacy implications"
-            ))
-        
-        # Check for potential names (simple heuristic)
-        if field_name.lower() not in ['make', 'model', 'software'] and len(field_value.split()) >= 2:
-            words = field_value.split()
-            if all(word.istitle() for word in words if word.isalpha()):
-                risks.append(PrivacyRisk(
-                    field_name=field_name,
-                    field_value=field_value,
-                    risk_level=RiskLevel.MEDIUM,
-                    category="Personal",
-                    description="Field may contain personal name",
-                    remediation="Review field for personal identifying information"
-                ))
+    if not field_value or field_name in _SKIP_PATTERN_FIELDS:
+        return risks
+    
+    # Check for email addresses, phone numbers and URLs in one scan. Emails
+    # need an '@', URLs a '://' and phone numbers at least ten characters,
+    # so most short technical values never reach the regex.
+    if '@' in field_value or '://' in field_value or len(field_value) >= _MIN_PHONE_LENGTH:
+        found = _find_contact_kinds(field_value)
+        for kind, factory in _PATTERN_FACTORIES.items():
+            if kind in found:
+                risks.append(factory(field_name, field_value, file_path=file_path))
+    
+    # Check for potential names (simple heuristic)
+    tag = field_name.rpartition(':')[2].lower()
+    if tag not in _NAME_EXEMPT_TAGS and _looks_like_name(field_value):
+        risks.append(PrivacyRisk(
+            field_name=field_name,
+            field_value=field_value,
+            risk_level=RiskLevel.MEDIUM,
+            category="Personal",
+            description="Field may contain personal name",
+            remediation="Review field for personal identifying information",
+            file_path=file_path
+        ))
     
     return risks
 
 
+@lru_cache(maxsize=4096)
+def _analyze_field_cached(field_name: str, field_value: str) -> Tuple[PrivacyRisk, ...]:
+    """Analyze a field without a file path, memoized across the files of an audit.
+    
+    Camera make, model, software and artist values repeat across every file
+    of a shoot, so most fields of a directory audit are cache hits.
+    """
+    return tuple(analyze_field_value(field_name, field_value))
+
+
+def _with_file_path(risk: PrivacyRisk, file_path: str) -> PrivacyRisk:
+    """Copy a cached risk onto the file it was found in."""
+    return PrivacyRisk(
+        risk.field_name,
+        risk.field_value,
+        risk.risk_level,
+        risk.category,
+        risk.description,
+        risk.remediation,
+        file_path
+    )
+
+
+# Score weight per risk level; a total of _MAX_RISK_WEIGHT scores 10.0
+# (about 20 critical risks)
+_RISK_WEIGHTS = {
+    RiskLevel.CRITICAL: 4.0,
+    RiskLevel.HIGH: 3.0,
+    RiskLevel.MEDIUM: 2.0,
+    RiskLevel.LOW: 1.0,
+    RiskLevel.INFO: 0.5
+}
+_MAX_RISK_WEIGHT = 80.0
+
+
 def calculate_risk_score(risks: List[PrivacyRisk]) -> float:
     """
     Calculate overall privacy risk score for a set of risks.
@@ -279,33 +504,28 @@ def calculate_risk_score(risks: List[PrivacyRisk]) -> float:
     Returns:
         Risk score from 0.0 (no risk) to 10.0 (maximum risk)
     """
-    if not risks:
-        return 0.0
-    
-    # Risk level weights
-    weights = {
-        RiskLevel.CRITICAL: 4.0,
-        RiskLevel.HIGH: 3.0,
-        RiskLevel.MEDIUM: 2.0,
-        RiskLevel.LOW: 1.0,
-        RiskLevel.INFO: 0.5
-    }
-    
-    # Calculate weighted score
-    total_weight = sum(weights[risk.risk_level] for risk in risks)
-    
-    # Normalize to 0-10 scale (assuming max ~20 risks of critical level)
-    normalized_score = min(10.0, (total_weight / 80.0) * 10.0)
+    total_weight = 0.0
+    for risk in risks:
+        total_weight += _RISK_WEIGHTS[risk.risk_level]
+        # The score is capped, so stop once it saturates
+        if total_weight >= _MAX_RISK_WEIGHT:
+            return 10.0
     
-    return round(normalized_score, 1)
+    return round((total_weight / _MAX_RISK_WEIGHT) * 10.0, 1)
 
 
-def audit_file(file_path: Path) -> FileAuditResult:
+def audit_file(
+    file_path: Path,
+    metadata: Optional[Dict[str, Any]] = None,
+    file_size: Optional[int] = None
+) -> FileAuditResult:
     """
     Perform privacy audit on a single image file.
     
     Args:
         file_path: Path to image file
+        metadata: Metadata already read for the file (read with ExifTool if None)
+        file_size: File size already known from enumeration (stat if None)
         
     Returns:
         FileAuditResult with audit findings
@@ -315,24 +535,25 @@ def audit_file(file_path: Path) -> FileAuditResult:
     
     try:
         # Get file size
-        file_size = file_path.stat().st_size
+        if file_size is None:
+            file_size = file_path.stat().st_size
         
         # Get metadata
-        if has_exiftool():
-            metadata = get_file_metadata(file_path)
-        else:
-            metadata = {}
-            recommendations.append("Install ExifTool for comprehensive metadata analysis")
+        if metadata is None:
+            if has_exiftool():
+                metadata = get_file_metadata(file_path)
+            else:
+                metadata = {}
+                recommendations.append("Install ExifTool for comprehensive metadata analysis")
         
         metadata_count = len(metadata)
         
         # Analyze each metadata field
+        path_str = str(file_path)
         for field_name, field_value in metadata.items():
             if field_value:
-                field_risks = analyze_field_value(field_name, str(field_value))
-                for risk in field_risks:
-                    risk.file_path = str(file_path)
-                risks.extend(field_risks)
+                for risk in _analyze_field_cached(sys.intern(field_name), str(field_value)):
+                    risks.append(_with_file_path(risk, path_str))
         
         # Generate recommendations based on findings
         if any(risk.risk_level == RiskLevel.CRITICAL for risk in risks):
@@ -380,67 +601,34 @@ def audit_file(file_path: Path) -> FileAuditResult:
         )
 
 
-def audit_directory(
+def _scan_error_report(error: Exception) -> AuditReport:
+    """Build the report returned when the directory cannot be scanned."""
+    return AuditReport(
+        summary={
+            "error": f"Error scanning directory: {error}",
+            "files_scanned": 0,
+            "total_risks": 0
+        },
+        file_results=[],
+        overall_risks=[],
+        recommendations=["Check directory path and permissions"],
+        scan_timestamp=datetime.now()
+    )
+
+
+def _build_directory_report(
     directory_path: Path,
-    recursive: bool = False,
-    max_files: Optional[int] = None
+    recursive: bool,
+    file_results: List[FileAuditResult],
+    overall_risks: List[PrivacyRisk],
+    total_files: int,
+    total_risks: int,
+    risk_counts: Counter,
+    category_counts: Counter,
+    avg_risk_score: float,
+    high_risk_count: int
 ) -> AuditReport:
-    """
-    Perform privacy audit on all images in a directory.
-    
-    Args:
-        directory_path: Directory to audit
-        recursive: Whether to scan subdirectories
-        max_files: Maximum number of files to scan (None for unlimited)
-        
-    Returns:
-        AuditReport with comprehensive findings
-    """
-    # Find all images
-    try:
-        all_images = list(iter_images(directory_path, recursive=recursive))
-    except Exception as e:
-        # Return error report
-        return AuditReport(
-            summary={
-                "error": f"Error scanning directory: {e}",
-                "files_scanned": 0,
-                "total_risks": 0
-            },
-            file_results=[],
-            overall_risks=[],
-            recommendations=["Check directory path and permissions"],
-            scan_timestamp=datetime.now()
-        )
-    
-    # Limit files if requested
-    if max_files and len(all_images) > max_files:
-        all_images = all_images[:max_files]
-    
-    # Audit each file
-    file_results = []
-    overall_risks = []
-    
-    for image_path in all_images:
-        file_result = audit_file(image_path)
-        file_results.append(file_result)
-        overall_risks.extend(file_result.risks)
-    
-    # Generate summary statistics
-    total_files = len(file_results)
-    total_risks = len(overall_risks)
-    
-    risk_counts = {level: 0 for level in RiskLevel}
-    for risk in overall_risks:
-        risk_counts[risk.risk_level] += 1
-    
-    category_counts = {}
-    for risk in overall_risks:
-        category_counts[risk.category] = category_counts.get(risk.category, 0) + 1
-    
-    avg_risk_score = sum(result.risk_score for result in file_results) / max(1, total_files)
-    high_risk_files = [result for result in file_results if result.risk_score >= 7.0]
-    
+    """Turn aggregated directory statistics into an AuditReport."""
     # Generate overall recommendations
     recommendations = []
     
@@ -456,8 +644,8 @@ def audit_directory(
     if category_counts.get("Device", 0) > 0:
         recommendations.append(f"📱 Device fingerprinting data found in {category_counts['Device']} fields")
     
-    if len(high_risk_files) > 0:
-        recommendations.append(f"🎯 {len(high_risk_files)} files have high privacy risk scores (≥7.0)")
+    if high_risk_count > 0:
+        recommendations.append(f"🎯 {high_risk_count} files have high privacy risk scores (≥7.0)")
     
     # Suggest appropriate cleaning profiles
     if risk_counts[RiskLevel.CRITICAL] > 0 or avg_risk_score > 6.0:
@@ -473,9 +661,9 @@ def audit_directory(
         "files_scanned": total_files,
         "total_risks": total_risks,
         "average_risk_score": round(avg_risk_score, 1),
-        "high_risk_files": len(high_risk_files),
-        "risk_distribution": {level.value: count for level, count in risk_counts.items()},
-        "category_distribution": category_counts,
+        "high_risk_files": high_risk_count,
+        "risk_distribution": {level.value: risk_counts[level] for level in RiskLevel},
+        "category_distribution": dict(category_counts),
         "directory": str(directory_path),
         "recursive": recursive
     }
@@ -489,67 +677,253 @@ def audit_directory(
     )
 
 
-def generate_html_report(audit_report: AuditReport, output_path: Path) -> None:
+def audit_directory(
+    directory_path: Path,
+    recursive: bool = False,
+    max_files: Optional[int] = None,
+    max_workers: int = 4
+) -> AuditReport:
     """
-    Generate an HTML privacy audit report.
+    Perform privacy audit on all images in a directory.
+    
+    Metadata is read with one ExifTool run for the whole directory, and the
+    fields are analysed in this process. Only files that run could not read
+    are read one by one, spread over the shared worker pool.
     
     Args:
-        audit_report: Audit report data
-        output_path: Path to save HTML report
+        directory_path: Directory to audit
+        recursive: Whether to scan subdirectories
+        max_files: Maximum number of files to scan (None for unlimited)
+        max_workers: Maximum number of worker processes for the per-file
+            reads (1 reads them serially)
+        
+    Returns:
+        AuditReport with comprehensive findings
+    """
+    # Find all images
+    try:
+        all_entries = list(
+            iter_images(directory_path, recursive=recursive, with_sizes=True)
+        )
+    except Exception as e:
+        return _scan_error_report(e)
+    
+    # Limit files if requested
+    if max_files and len(all_entries) > max_files:
+        all_entries = all_entries[:max_files]
+    all_images = [image_path for image_path, _ in all_entries]
+    all_sizes = [size for _, size in all_entries]
+    
+    # Read metadata for every file with one ExifTool run; files it could not
+    # read fall back to a per-file read inside audit_file
+    batch_metadata = get_metadata_batch(all_images)
+    all_metadata = [batch_metadata.get(image_path) for image_path in all_images]
+    
+    # Each of those per-file reads waits on its own ExifTool process, so
+    # they run on the worker pool when there is more than one
+    missing = [index for index, metadata in enumerate(all_metadata) if metadata is None]
+    workers = min(max_workers, default_workers(), len(missing))
+    if workers > 1 and has_exiftool():
+        try:
+            reads = pool_map(
+                get_file_metadata, [all_images[index] for index in missing], workers
+            )
+            for index, metadata in zip(missing, reads):
+                all_metadata[index] = metadata
+        except BrokenProcessPool:
+            # Files not read yet are read again, one by one, by audit_file
+            shutdown_pool()
+        except Exception:
+            # Likewise; audit_file then reports the error for its file
+            pass
+    
+    # The field analysis is cheap and cached, so it stays in this process
+    file_results = [
+        audit_file(image_path, metadata, size)
+        for image_path, metadata, size in zip(all_images, all_metadata, all_sizes)
+    ]
+    # Field values from this directory are unlikely to recur in the next
+    _analyze_field_cached.cache_clear()
+    
+    # Generate summary statistics in one pass over the results
+    overall_risks = []
+    risk_counts = Counter()
+    category_counts = Counter()
+    score_sum = 0.0
+    high_risk_count = 0
+    for result in file_results:
+        score_sum += result.risk_score
+        if result.risk_score >= 7.0:
+            high_risk_count += 1
+        for risk in result.risks:
+            risk_counts[risk.risk_level] += 1
+            category_counts[risk.category] += 1
+        overall_risks.extend(result.risks)
+    
+    total_files = len(file_results)
+    
+    return _build_directory_report(
+        directory_path,
+        recursive,
+        file_results,
+        overall_risks,
+        total_files,
+        len(overall_risks),
+        risk_counts,
+        category_counts,
+        score_sum / max(1, total_files),
+        high_risk_count
+    )
+
+
+def audit_directory_streaming(
+    directory_path: Path,
+    recursive: bool = False,
+    max_files: Optional[int] = None,
+    ndjson_path: Optional[Path] = None,
+    top_files: int = 50,
+    chunk_size: int = 256
+) -> AuditReport:
+    """
+    Perform privacy audit on a directory without holding every result.
+    
+    Summary statistics are aggregated as files are audited, and only the
+    ``top_files`` highest-scoring results are kept in the report. Use this
+    instead of audit_directory for directories too large to audit in memory.
+    
+    Args:
+        directory_path: Directory to audit
+        recursive: Whether to scan subdirectories
+        max_files: Maximum number of files to scan (None for unlimited)
+        ndjson_path: If given, write every file result here as one JSON
+            object per line while auditing
+        top_files: Number of highest-risk file results to keep in the report
+        chunk_size: Number of files whose metadata is read per ExifTool run
+        
+    Returns:
+        AuditReport whose file_results and overall_risks cover only the
+        highest-risk files; the summary covers every file scanned
     """
-    html_content = f"""
+    total_files = 0
+    total_risks = 0
+    risk_counts = Counter()
+    category_counts = Counter()
+    score_sum = 0.0
+    high_risk_count = 0
+    # Min-heap of (score, order, result) holding the highest-risk files
+    top_heap = []
+    
+    entries = iter_images(directory_path, recursive=recursive, with_sizes=True)
+    if max_files:
+        entries = islice(entries, max_files)
+    
+    ndjson_file = ndjson_path.open("w", encoding="utf-8") if ndjson_path else None
+    try:
+        while True:
+            try:
+                chunk = list(islice(entries, chunk_size))
+            except Exception as e:
+                return _scan_error_report(e)
+            if not chunk:
+                break
+            
+            batch_metadata = get_metadata_batch([image_path for image_path, _ in chunk])
+            for image_path, size in chunk:
+                result = audit_file(image_path, batch_metadata.get(image_path), size)
+                
+                total_files += 1
+                total_risks += len(result.risks)
+                score_sum += result.risk_score
+                if result.risk_score >= 7.0:
+                    high_risk_count += 1
+                for risk in result.risks:
+                    risk_counts[risk.risk_level] += 1
+                    category_counts[risk.category] += 1
+                
+                if ndjson_file is not None:
+                    ndjson_file.write(json.dumps(_result_to_dict(result), ensure_ascii=False))
+                    ndjson_file.write("\n")
+                
+                entry = (result.risk_score, total_files, result)
+                if len(top_heap) < top_files:
+                    heapq.heappush(top_heap, entry)
+                elif top_files > 0 and entry[:2] > top_heap[0][:2]:
+                    heapq.heapreplace(top_heap, entry)
+    finally:
+        if ndjson_file is not None:
+            ndjson_file.close()
+        _analyze_field_cached.cache_clear()
+    
+    file_results = [entry[2] for entry in sorted(top_heap, key=lambda e: (-e[0], e[1]))]
+    overall_risks = [risk for result in file_results for risk in result.risks]
+    
+    return _build_directory_report(
+        directory_path,
+        recursive,
+        file_results,
+        overall_risks,
+        total_files,
+        total_risks,
+        risk_counts,
+        category_counts,
+        score_sum / max(1, total_files),
+        high_risk_count
+    )
+
+
+# Report fragments, filled with str.format_map and joined once at the end.
+# Values substituted into them are HTML-escaped by generate_html_report.
+_HTML_STYLE = """
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; margin: 40px; line-height: 1.6; }
+        .header { border-bottom: 2px solid #333; padding-bottom: 20px; margin-bottom: 30px; }
+        .summary { background: #f8f9fa; padding: 20px; border-radius: 8px; margin-bottom: 30px; }
+        .risk-critical { color: #dc3545; font-weight: bold; }
+        .risk-high { color: #fd7e14; font-weight: bold; }
+        .risk-medium { color: #ffc107; font-weight: bold; }
+        .risk-low { color: #28a745; }
+        .risk-info { color: #17a2b8; }
+        .recommendations { background: #e7f3ff; padding: 20px; border-radius: 8px; margin-bottom: 30px; }
+        .file-result { border: 1px solid #dee2e6; margin-bottom: 15px; padding: 15px; border-radius: 5px; }
+        .file-header { font-weight: bold; margin-bottom: 10px; }
+        .risk-item { margin: 5px 0; padding: 8px; background: #f8f9fa; border-radius: 4px; }
+        table { width: 100%; border-collapse: collapse; margin-bottom: 20px; }
+        th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
+        th { background-color: #f2f2f2; }
+        .score-high { background-color: #ffebee; }
+        .score-medium { background-color: #fff3e0; }
+        .score-low { background-color: #e8f5e8; }
+"""
+
+_HTML_HEADER = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Privacy Audit Report</title>
-    <style>
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; margin: 40px; line-height: 1.6; }}
-        .header {{ border-bottom: 2px solid #333; padding-bottom: 20px; margin-bottom: 30px; }}
-        .summary {{ background: #f8f9fa; padding: 20px; border-radius: 8px; margin-bottom: 30px; }}
-        .risk-critical {{ color: #dc3545; font-weight: bold; }}
-        .risk-high {{ color: #fd7e14; font-weight: bold; }}
-        .risk-medium {{ color: #ffc107; font-weight: bold; }}
-        .risk-low {{ color: #28a745; }}
-        .risk-info {{ color: #17a2b8; }}
-        .recommendations {{ background: #e7f3ff; padding: 20px; border-radius: 8px; margin-bottom: 30px; }}
-        .file-result {{ border: 1px solid #dee2e6; margin-bottom: 15px; padding: 15px; border-radius: 5px; }}
-        .file-header {{ font-weight: bold; margin-bottom: 10px; }}
-        .risk-item {{ margin: 5px 0; padding: 8px; background: #f8f9fa; border-radius: 4px; }}
-        table {{ width: 100%; border-collapse: collapse; margin-bottom: 20px; }}
-        th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
-        th {{ background-color: #f2f2f2; }}
-        .score-high {{ background-color: #ffebee; }}
-        .score-medium {{ background-color: #fff3e0; }}
-        .score-low {{ background-color: #e8f5e8; }}
-    </style>
+    <style>{style}    </style>
 </head>
 <body>
     <div class="header">
         <h1>🔒 Privacy Audit Report</h1>
-        <p>Generated on {audit_report.scan_timestamp.strftime('%Y-%m-%d %H:%M:%S')}</p>
-        <p>Directory: <code>{audit_report.summary['directory']}</code></p>
+        <p>Generated on {timestamp}</p>
+        <p>Directory: <code>{directory}</code></p>
     </div>
     
     <div class="summary">
         <h2>📊 Summary</h2>
-        <p><strong>Files Scanned:</strong> {audit_report.summary['files_scanned']}</p>
-        <p><strong>Total Privacy Risks:</strong> {audit_report.summary['total_risks']}</p>
-        <p><strong>Average Risk Score:</strong> {audit_report.summary['average_risk_score']}/10</p>
-        <p><strong>High Risk Files:</strong> {audit_report.summary['high_risk_files']}</p>
+        <p><strong>Files Scanned:</strong> {files_scanned}</p>
+        <p><strong>Total Privacy Risks:</strong> {total_risks}</p>
+        <p><strong>Average Risk Score:</strong> {average_risk_score}/10</p>
+        <p><strong>High Risk Files:</strong> {high_risk_files}</p>
         
         <h3>Risk Distribution</h3>
         <ul>
 """
-    
-    # Add risk distribution
-    for level, count in audit_report.summary['risk_distribution'].items():
-        if count > 0:
-            css_class = f"risk-{level}"
-            html_content += f'<li class="{css_class}">{level.upper()}: {count} risks</li>\n'
-    
-    html_content += """
+
+_RISK_LEVEL_ITEM = '<li class="risk-{level}">{label}: {count} risks</li>\n'
+
+_RECOMMENDATIONS_START = """
         </ul>
     </div>
     
@@ -557,12 +931,10 @@ def generate_html_report(audit_report: AuditReport, output_path: Path) -> None:
         <h2>💡 Recommendations</h2>
         <ul>
 """
-    
-    # Add recommendations
-    for rec in audit_report.recommendations:
-        html_content += f"<li>{rec}</li>\n"
-    
-    html_content += """
+
+_RECOMMENDATION_ITEM = "<li>{text}</li>\n"
+
+_FILE_TABLE_START = """
         </ul>
     </div>
     
@@ -578,53 +950,39 @@ def generate_html_report(audit_report: AuditReport, output_path: Path) -> None:
         </thead>
         <tbody>
 """
-    
-    # Add file results
-    for result in audit_report.file_results:
-        score_class = "score-low"
-        if result.risk_score >= 7.0:
-            score_class = "score-high"
-        elif result.risk_score >= 4.0:
-            score_class = "score-medium"
-        
-        top_risks = [risk for risk in result.risks if risk.risk_level in [RiskLevel.CRITICAL, RiskLevel.HIGH]][:3]
-        risk_summary = ", ".join([f"{risk.category}" for risk in top_risks]) or "None"
-        
-        html_content += f"""
+
+_FILE_ROW = """
             <tr class="{score_class}">
-                <td>{result.file_path.name}</td>
-                <td>{result.risk_score}/10</td>
-                <td>{result.metadata_count}</td>
-                <td>{risk_summary}</td>
+                <td>{name}</td>
+                <td>{score}/10</td>
+                <td>{metadata_count}</td>
+                <td>{risks}</td>
             </tr>
         """
-    
-    html_content += """
+
+_DETAILS_START = """
         </tbody>
     </table>
     
     <h2>🔍 Detailed Findings</h2>
 """
-    
-    # Add detailed file results
-    for result in audit_report.file_results:
-        if result.risks:
-            html_content += f"""
+
+_FILE_RESULT_START = """
     <div class="file-result">
-        <div class="file-header">{result.file_path.name} (Risk Score: {result.risk_score}/10)</div>
+        <div class="file-header">{name} (Risk Score: {score}/10)</div>
 """
-            for risk in result.risks:
-                css_class = f"risk-{risk.risk_level.value}"
-                html_content += f"""
+
+_RISK_ITEM = """
         <div class="risk-item">
-            <span class="{css_class}">[{risk.risk_level.value.upper()}]</span>
-            <strong>{risk.field_name}:</strong> {risk.description}
-            <br><small>💡 {risk.remediation}</small>
+            <span class="{css_class}">[{level}]</span>
+            <strong>{field_name}:</strong> {description}
+            <br><small>💡 {remediation}</small>
         </div>
 """
-            html_content += "</div>\n"
-    
-    html_content += """
+
+_FILE_RESULT_END = "</div>\n"
+
+_HTML_FOOTER = """
     <footer style="margin-top: 50px; padding-top: 20px; border-top: 1px solid #ccc; font-size: 0.9em; color: #666;">
         <p>Generated by Metadata Multitool Privacy Auditor</p>
         <p>This report identifies potential privacy risks in image metadata. Review findings and use appropriate cleaning profiles before sharing images.</p>
@@ -632,48 +990,163 @@ def generate_html_report(audit_report: AuditReport, output_path: Path) -> None:
 </body>
 </html>
 """
+
+
+_TOP_RISK_LEVELS = frozenset({RiskLevel.CRITICAL, RiskLevel.HIGH})
+
+
+def _file_row(result: FileAuditResult) -> str:
+    """Render one row of the report's file analysis table."""
+    score_class = "score-low"
+    if result.risk_score >= 7.0:
+        score_class = "score-high"
+    elif result.risk_score >= 4.0:
+        score_class = "score-medium"
+    
+    # Only the first three critical/high risks are listed
+    top_risks = islice(
+        (risk for risk in result.risks if risk.risk_level in _TOP_RISK_LEVELS), 3
+    )
+    risk_summary = ", ".join(risk.category for risk in top_risks) or "None"
+    
+    return _FILE_ROW.format_map({
+        "score_class": score_class,
+        "name": escape(result.file_path.name, quote=False),
+        "score": result.risk_score,
+        "metadata_count": result.metadata_count,
+        "risks": escape(risk_summary, quote=False),
+    })
+
+
+def generate_html_report(audit_report: AuditReport, output_path: Path) -> None:
+    """
+    Generate an HTML privacy audit report.
+    
+    Args:
+        audit_report: Audit report data
+        output_path: Path to save HTML report
+    """
+    summary = audit_report.summary
+    parts = [_HTML_HEADER.format_map({
+        "style": _HTML_STYLE,
+        "timestamp": audit_report.scan_timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+        "directory": escape(str(summary['directory']), quote=False),
+        "files_scanned": summary['files_scanned'],
+        "total_risks": summary['total_risks'],
+        "average_risk_score": summary['average_risk_score'],
+        "high_risk_files": summary['high_risk_files'],
+    })]
+    
+    # Add risk distribution, in severity order
+    parts.extend(
+        _RISK_LEVEL_ITEM.format_map({"level": level, "label": level.upper(), "count": count})
+        for level, count in summary['risk_distribution'].items()
+        if count > 0
+    )
+    
+    # Add recommendations
+    parts.append(_RECOMMENDATIONS_START)
+    parts.extend(
+        _RECOMMENDATION_ITEM.format_map({"text": escape(rec, quote=False)})
+        for rec in audit_report.recommendations
+    )
+    
+    # Add file results
+    parts.append(_FILE_TABLE_START)
+    parts.extend(_file_row(result) for result in audit_report.file_results)
     
-    output_path.write_text(html_content, encoding='utf-8')
+    # Add detailed file results
+    parts.append(_DETAILS_START)
+    for result in audit_report.file_results:
+        if result.risks:
+            parts.append(_FILE_RESULT_START.format_map(
+                {"name": escape(result.file_path.name, quote=False), "score": result.risk_score}
+            ))
+            parts.extend(
+                _RISK_ITEM.format_map({
+                    "css_class": f"risk-{risk.risk_level.value}",
+                    "level": risk.risk_level.value.upper(),
+                    "field_name": escape(risk.field_name, quote=False),
+                    "description": escape(risk.description, quote=False),
+                    "remediation": escape(risk.remediation, quote=False),
+                })
+                for risk in result.risks
+            )
+            parts.append(_FILE_RESULT_END)
+    
+    parts.append(_HTML_FOOTER)
+    
+    with output_path.open('w', encoding='utf-8') as f:
+        f.writelines(parts)
+
+
+def _result_to_dict(result: FileAuditResult) -> Dict[str, Any]:
+    """Convert a file audit result to a JSON-serializable dictionary."""
+    return {
+        "file_path": str(result.file_path),
+        "file_size": result.file_size,
+        "metadata_count": result.metadata_count,
+        "risk_score": result.risk_score,
+        "recommendations": result.recommendations,
+        "risks": [
+            {
+                "field_name": risk.field_name,
+                "field_value": risk.field_value,
+                "risk_level": risk.risk_level.value,
+                "category": risk.category,
+                "description": risk.description,
+                "remediation": risk.remediation
+            }
+            for risk in result.risks
+        ]
+    }
+
+
+def _dumps_indented(value: Any) -> bytes:
+    """Serialize a value as UTF-8 JSON with two-space indentation."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _json_at_depth(value: Any, depth: int) -> bytes:
+    """Serialize a value as it would appear nested ``depth`` levels deep in an indented dump."""
+    # Newlines only occur between tokens; those inside strings are escaped
+    return _dumps_indented(value).replace(b"\n", b"\n" + b"  " * depth)
 
 
 def export_audit_json(audit_report: AuditReport, output_path: Path) -> None:
     """
     Export audit report as JSON for programmatic analysis.
     
+    File results are converted and written one at a time, so the export
+    never holds a second, dictionary copy of the whole report in memory.
+    
     Args:
         audit_report: Audit report data
         output_path: Path to save JSON report
     """
-    # Convert to JSON-serializable format
-    json_data = {
+    header = {
         "scan_timestamp": audit_report.scan_timestamp.isoformat(),
         "summary": audit_report.summary,
         "recommendations": audit_report.recommendations,
-        "file_results": [
-            {
-                "file_path": str(result.file_path),
-                "file_size": result.file_size,
-                "metadata_count": result.metadata_count,
-                "risk_score": result.risk_score,
-                "recommendations": result.recommendations,
-                "risks": [
-                    {
-                        "field_name": risk.field_name,
-                        "field_value": risk.field_value,
-                        "risk_level": risk.risk_level.value,
-                        "category": risk.category,
-                        "description": risk.description,
-                        "remediation": risk.remediation
-                    }
-                    for risk in result.risks
-                ]
-            }
-            for result in audit_report.file_results
-        ]
     }
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(json_data, f, indent=2, ensure_ascii=False)
+    with open(output_path, 'wb', buffering=1 << 20) as f:
+        f.write(b"{\n")
+        for key, value in header.items():
+            f.write(b'  "%s": %s,\n' % (key.encode('utf-8'), _json_at_depth(value, 1)))
+        
+        if not audit_report.file_results:
+            f.write(b'  "file_results": []\n}')
+            return
+        
+        f.write(b'  "file_results": [\n')
+        for i, result in enumerate(audit_report.file_results):
+            if i:
+                f.write(b",\n")
+            f.write(b"    " + _json_at_depth(_result_to_dict(result), 2))
+        f.write(b"\n  ]\n}")
 
 
 if __name__ == "__main__":
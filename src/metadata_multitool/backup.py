@@ -2,13 +2,34 @@
 
 from __future__ import annotations
 
+import hashlib
+import heapq
 import json
+import mmap
+import os
 import shutil
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime, timedelta
+from functools import cached_property
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from .core import MetadataMultitoolError
+from .core import MetadataMultitoolError, fast_copy
+
+try:
+    import orjson
+except ImportError:
+    # Optional faster serializer for the backup index
+    orjson = None
+
+# Files smaller than this are hashed by reading; mapping them costs more
+_MMAP_HASH_MIN_SIZE = 1024 * 1024
+
+# Journal records replayed before the snapshot is rewritten
+_MAX_JOURNAL_ENTRIES = 1000
 
 
 class BackupError(MetadataMultitoolError):
@@ -17,6 +38,107 @@ class BackupError(MetadataMultitoolError):
     pass
 
 
+@dataclass(slots=True)
+class BackupRecord:
+    """One backup in the backup index."""
+
+    type: str
+    source_path: str
+    backup_path: str
+    operation: str
+    created_at: str
+    size: int
+    # Not recorded by older versions of the index
+    file_count: Optional[int] = None
+    # File backups only
+    sha256: Optional[str] = None
+    mtime_ns: Optional[int] = None
+    # Directory backups only: the blobs their files link to
+    digests: Optional[List[str]] = None
+    restored_at: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, info: Dict[str, Any]) -> BackupRecord:
+        """Build a record from its index entry, ignoring unknown keys."""
+        return cls(**{key: info[key] for key in _RECORD_FIELDS if key in info})
+
+
+_RECORD_FIELDS = frozenset(field.name for field in fields(BackupRecord))
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize index data, including backup records, to JSON bytes."""
+    if orjson is not None:
+        # orjson serializes dataclasses natively
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(
+        obj, default=asdict, indent=2 if indent else None, ensure_ascii=False
+    ).encode("utf-8")
+
+
+def _hash_file(path: Path) -> str:
+    """
+    Return the hex SHA-256 digest of a file's contents.
+
+    Large files are memory-mapped and hashed in one call, so pages go
+    straight from the page cache to OpenSSL without a Python read loop.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_HASH_MIN_SIZE:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return hashlib.sha256(mm).hexdigest()
+            except (OSError, ValueError):
+                # Unmappable files (pipes, some network filesystems)
+                pass
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _copy_tree_parallel(
+    src: Path, dst: Path, copy_file: Callable[[Path, Path], Any] = fast_copy
+) -> Tuple[int, List[Any]]:
+    """
+    Copy a directory tree, copying its files on a thread pool.
+
+    Directories are created while walking with ``os.scandir`` and every file
+    is handed to ``copy_file`` on a worker thread; the copies are syscall
+    bound and release the GIL, so they overlap. File sizes come from the
+    same walk, so the tree is only traversed once.
+
+    Returns:
+        Tuple of (total size in bytes, what ``copy_file`` returned per file)
+    """
+    max_workers = min(32, (os.cpu_count() or 1) * 2)
+    total_size = 0
+    copies = []
+    copied_dirs = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = [(src, dst)]
+        while pending:
+            src_dir, dst_dir = pending.pop()
+            dst_dir.mkdir(parents=True, exist_ok=True)
+            copied_dirs.append((src_dir, dst_dir))
+            with os.scandir(src_dir) as entries:
+                for entry in entries:
+                    target = dst_dir / entry.name
+                    if entry.is_dir():
+                        pending.append((Path(entry.path), target))
+                    else:
+                        total_size += entry.stat().st_size
+                        copies.append(
+                            executor.submit(copy_file, Path(entry.path), target)
+                        )
+
+        # Surface the first copy error, if any
+        results = [copy.result() for copy in copies]
+
+    # Directory times last, once their contents stop changing
+    for src_dir, dst_dir in reversed(copied_dirs):
+        shutil.copystat(src_dir, dst_dir)
+
+    return total_size, results
+
+
 class BackupManager:
     """Manages backup and restore operations for image files."""
 
@@ -24,33 +146,201 @@ class BackupManager:
         """
         Initialize the backup manager.
 
+        Nothing is read or created on disk until the manager is used: the
+        index is loaded on first access and the backup directory is created
+        on first write.
+
         Args:
             backup_dir: Directory to store backups (if None, uses default)
         """
         self.backup_dir = backup_dir or Path(".mm_backups")
-        self.backup_dir.mkdir(parents=True, exist_ok=True)
         self.backup_index_file = self.backup_dir / "backup_index.json"
-        self.backup_index = self._load_backup_index()
+        self.backup_journal_file = self.backup_dir / "backup_index.log"
+        self.blob_dir = self.backup_dir / "blobs"
+        self._journal_entries = 0
+        self._backup_dir_ready = False
+
+    @cached_property
+    def backup_index(self) -> Dict[str, Any]:
+        """The backup index, loaded on first use."""
+        return self._load_backup_index()
+
+    def _ensure_backup_dir(self) -> None:
+        """Create the backup directory before the first write."""
+        if not self._backup_dir_ready:
+            self.backup_dir.mkdir(parents=True, exist_ok=True)
+            self._backup_dir_ready = True
 
     def _load_backup_index(self) -> Dict[str, Any]:
-        """Load the backup index from file."""
-        if not self.backup_index_file.exists():
-            return {"backups": {}, "next_id": 1}
+        """Load the backup index snapshot and replay the journal over it."""
+        index = {"backups": {}, "next_id": 1}
+        if self.backup_index_file.exists():
+            try:
+                with open(self.backup_index_file, "rb") as f:
+                    data = f.read()
+                snapshot = orjson.loads(data) if orjson is not None else json.loads(data)
+                backups = {
+                    backup_id: BackupRecord.from_dict(info)
+                    for backup_id, info in snapshot["backups"].items()
+                }
+                index = {"backups": backups, "next_id": snapshot["next_id"]}
+            except (
+                json.JSONDecodeError,
+                UnicodeDecodeError,
+                KeyError,
+                TypeError,
+                OSError,
+            ):
+                pass
+
+        self._journal_entries = self._replay_journal(index)
+        return index
+
+    def _replay_journal(self, index: Dict[str, Any]) -> int:
+        """Apply journal records to ``index`` and return how many were read."""
+        try:
+            with open(self.backup_journal_file, "rb") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return 0
 
+        backups = index["backups"]
+        for line in lines:
+            try:
+                record = orjson.loads(line) if orjson is not None else json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                # A write cut short by a crash; the rest of the journal is valid
+                continue
+
+            # Every operation is idempotent, so records already folded into
+            # the snapshot can safely be applied again
+            backup_id = record["id"]
+            if record["op"] == "add":
+                backups[backup_id] = BackupRecord.from_dict(record["info"])
+                if backup_id.isdigit():
+                    index["next_id"] = max(index["next_id"], int(backup_id) + 1)
+            elif record["op"] == "del":
+                backups.pop(backup_id, None)
+            elif backup_id in backups:
+                for key, value in record["info"].items():
+                    setattr(backups[backup_id], key, value)
+
+        return len(lines)
+
+    def _append_journal(
+        self,
+        op: str,
+        backup_id: str,
+        info: Optional[BackupRecord | Dict[str, Any]] = None,
+    ) -> None:
+        """Record one index mutation without rewriting the whole index."""
+        line = _dumps({"op": op, "id": backup_id, "info": info}) + b"\n"
         try:
-            with open(self.backup_index_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError):
-            return {"backups": {}, "next_id": 1}
+            self._ensure_backup_dir()
+            with open(self.backup_journal_file, "ab") as f:
+                f.write(line)
+        except OSError as e:
+            raise BackupError(f"Failed to save backup index: {e}")
+
+        self._journal_entries += 1
+        if self._journal_entries > _MAX_JOURNAL_ENTRIES:
+            self._compact_index()
+
+    def _compact_index(self) -> None:
+        """Fold the journal into a fresh snapshot of the index."""
+        self._save_backup_index()
 
     def _save_backup_index(self) -> None:
-        """Save the backup index to file."""
+        """Save a snapshot of the backup index and clear the journal."""
+        data = _dumps(self.backup_index, indent=True)
         try:
-            with open(self.backup_index_file, "w", encoding="utf-8") as f:
-                json.dump(self.backup_index, f, indent=2, ensure_ascii=False)
+            self._ensure_backup_dir()
+            with open(self.backup_index_file, "wb") as f:
+                f.write(data)
         except OSError as e:
             raise BackupError(f"Failed to save backup index: {e}")
 
+        # The snapshot now holds every journalled change
+        try:
+            os.remove(self.backup_journal_file)
+        except OSError:
+            # No journal yet; replaying records already in the snapshot
+            # would be harmless anyway
+            pass
+        self._journal_entries = 0
+
+    def _blob_path(self, digest: str) -> Path:
+        """Return where the blob with the given SHA-256 digest is stored."""
+        return self.blob_dir / digest[:2] / digest
+
+    def _unchanged_digest(self, source_path: Path, stat: os.stat_result) -> Optional[str]:
+        """Return the digest of the latest backup of a file if it is unchanged since."""
+        source = str(source_path)
+        for record in reversed(self.backup_index["backups"].values()):
+            if record.source_path != source:
+                continue
+            if record.mtime_ns == stat.st_mtime_ns and record.size == stat.st_size:
+                return record.sha256
+            return None
+        return None
+
+    def _link_blob(
+        self, source_file: Path, backup_file: Path, digest: Optional[str] = None
+    ) -> str:
+        """
+        Store a file's contents once and hard-link the backup copy to it.
+
+        Identical contents backed up again, by any backup, reuse the stored
+        blob instead of taking more space.
+
+        Args:
+            source_file: File to back up
+            backup_file: Where the backup copy goes
+            digest: Known digest of the contents, to skip hashing
+
+        Returns:
+            The SHA-256 digest of the file's contents
+        """
+        if digest is None or not self._blob_path(digest).exists():
+            digest = _hash_file(source_file)
+        blob = self._blob_path(digest)
+        if os.path.lexists(backup_file):
+            os.remove(backup_file)
+        try:
+            os.link(blob, backup_file)
+            return digest
+        except FileNotFoundError:
+            # Not stored yet, or just released by a deleted backup
+            pass
+        except OSError:
+            # Filesystems without hard links keep a private copy
+            fast_copy(blob, backup_file)
+            return digest
+
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        # Written under a private name so a partly written blob is never
+        # seen, and linked to the backup before it is published so a
+        # concurrent release never finds it unreferenced
+        tmp_blob = blob.with_name(f"{digest}.{os.getpid()}.{threading.get_ident()}.tmp")
+        fast_copy(source_file, tmp_blob)
+        try:
+            os.link(tmp_blob, backup_file)
+        except OSError:
+            fast_copy(tmp_blob, backup_file)
+        os.replace(tmp_blob, blob)
+        return digest
+
+    def _release_blob(self, digest: Optional[str]) -> None:
+        """Remove a blob once no backup links to it any more."""
+        if not digest:
+            return
+        blob = self._blob_path(digest)
+        try:
+            if blob.stat().st_nlink <= 1:
+                blob.unlink()
+        except FileNotFoundError:
+            pass
+
     def create_backup(self, source_path: Path, operation: str = "unknown") -> str:
         """
         Create a backup of a file or directory.
@@ -73,6 +363,7 @@ class BackupManager:
         self.backup_index["next_id"] += 1
 
         # Create backup directory
+        self._ensure_backup_dir()
         backup_path = self.backup_dir / backup_id
         backup_path.mkdir(parents=True, exist_ok=True)
 
@@ -80,36 +371,46 @@ class BackupManager:
             if source_path.is_file():
                 # Backup single file
                 backup_file = backup_path / source_path.name
-                shutil.copy2(source_path, backup_file)
+                stat = source_path.stat()
+                # Same size and mtime as the last backup: skip hashing
+                digest = self._link_blob(
+                    source_path, backup_file, self._unchanged_digest(source_path, stat)
+                )
 
                 # Store backup info
-                self.backup_index["backups"][backup_id] = {
-                    "type": "file",
-                    "source_path": str(source_path),
-                    "backup_path": str(backup_file),
-                    "operation": operation,
-                    "created_at": datetime.now().isoformat(),
-                    "size": source_path.stat().st_size,
-                }
+                record = BackupRecord(
+                    type="file",
+                    source_path=str(source_path),
+                    backup_path=str(backup_file),
+                    operation=operation,
+                    created_at=datetime.now().isoformat(),
+                    size=stat.st_size,
+                    file_count=1,
+                    sha256=digest,
+                    mtime_ns=stat.st_mtime_ns,
+                )
             else:
                 # Backup directory
                 backup_dir = backup_path / source_path.name
-                shutil.copytree(source_path, backup_dir, dirs_exist_ok=True)
+                total_size, digests = _copy_tree_parallel(
+                    source_path, backup_dir, self._link_blob
+                )
 
                 # Store backup info
-                self.backup_index["backups"][backup_id] = {
-                    "type": "directory",
-                    "source_path": str(source_path),
-                    "backup_path": str(backup_dir),
-                    "operation": operation,
-                    "created_at": datetime.now().isoformat(),
-                    "size": sum(
-                        f.stat().st_size for f in source_path.rglob("*") if f.is_file()
-                    ),
-                }
-
-            # Save backup index
-            self._save_backup_index()
+                record = BackupRecord(
+                    type="directory",
+                    source_path=str(source_path),
+                    backup_path=str(backup_dir),
+                    operation=operation,
+                    created_at=datetime.now().isoformat(),
+                    size=total_size,
+                    file_count=len(digests),
+                    digests=sorted(set(digests)),
+                )
+
+            # Record the new backup in the index journal
+            self.backup_index["backups"][backup_id] = record
+            self._append_journal("add", backup_id, record)
 
             return backup_id
 
@@ -129,15 +430,15 @@ class BackupManager:
         if backup_id not in self.backup_index["backups"]:
             raise BackupError(f"Backup ID not found: {backup_id}")
 
-        backup_info = self.backup_index["backups"][backup_id]
-        source_path = Path(backup_info["source_path"])
-        backup_path = Path(backup_info["backup_path"])
+        record = self.backup_index["backups"][backup_id]
+        source_path = Path(record.source_path)
+        backup_path = Path(record.backup_path)
 
         if not backup_path.exists():
             raise BackupError(f"Backup file not found: {backup_path}")
 
         try:
-            if backup_info["type"] == "file":
+            if record.type == "file":
                 # Restore single file
                 shutil.copy2(backup_path, source_path)
             else:
@@ -147,32 +448,46 @@ class BackupManager:
                 shutil.copytree(backup_path, source_path)
 
             # Update backup info
-            backup_info["restored_at"] = datetime.now().isoformat()
-            self._save_backup_index()
+            record.restored_at = datetime.now().isoformat()
+            self._append_journal(
+                "restore", backup_id, {"restored_at": record.restored_at}
+            )
 
         except OSError as e:
             raise BackupError(f"Failed to restore backup {backup_id}: {e}")
 
-    def list_backups(self) -> List[Dict[str, Any]]:
+    def iter_backups(self) -> Iterator[Dict[str, Any]]:
         """
-        List all available backups.
+        Iterate over the available backups in index order.
 
-        Returns:
-            List of backup information dictionaries
+        Yields:
+            Backup information dictionaries
         """
-        backups = []
-        for backup_id, info in self.backup_index["backups"].items():
-            backup_info = {
+        for backup_id, record in self.backup_index["backups"].items():
+            yield {
                 "id": backup_id,
-                "source_path": info["source_path"],
-                "operation": info["operation"],
-                "created_at": info["created_at"],
-                "size": info["size"],
-                "restored": "restored_at" in info,
+                "source_path": record.source_path,
+                "operation": record.operation,
+                "created_at": record.created_at,
+                "size": record.size,
+                "file_count": record.file_count,
+                "restored": record.restored_at is not None,
             }
-            backups.append(backup_info)
 
-        return sorted(backups, key=lambda x: x["created_at"], reverse=True)
+    def list_backups(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        List available backups, newest first.
+
+        Args:
+            limit: Only return this many of the newest backups (if None, all)
+
+        Returns:
+            List of backup information dictionaries
+        """
+        # ISO-8601 timestamps sort chronologically as plain strings
+        if limit is not None:
+            return heapq.nlargest(limit, self.iter_backups(), key=itemgetter("created_at"))
+        return sorted(self.iter_backups(), key=itemgetter("created_at"), reverse=True)
 
     def delete_backup(self, backup_id: str) -> None:
         """
@@ -187,19 +502,24 @@ class BackupManager:
         if backup_id not in self.backup_index["backups"]:
             raise BackupError(f"Backup ID not found: {backup_id}")
 
-        backup_info = self.backup_index["backups"][backup_id]
-        backup_path = Path(backup_info["backup_path"])
+        record = self.backup_index["backups"][backup_id]
+        backup_path = Path(record.backup_path)
 
         try:
-            if backup_path.exists():
-                if backup_info["type"] == "file":
+            if record.type == "file":
+                if backup_path.exists():
                     backup_path.unlink()
-                else:
+                self._release_blob(record.sha256)
+            else:
+                if backup_path.exists():
                     shutil.rmtree(backup_path)
+                # Older index entries do not list their digests
+                for digest in record.digests or ():
+                    self._release_blob(digest)
 
             # Remove from index
             del self.backup_index["backups"][backup_id]
-            self._save_backup_index()
+            self._append_journal("del", backup_id)
 
         except OSError as e:
             raise BackupError(f"Failed to delete backup {backup_id}: {e}")
@@ -214,14 +534,15 @@ class BackupManager:
         Returns:
             Number of backups deleted
         """
-        cutoff_date = datetime.now().timestamp() - (max_age_days * 24 * 60 * 60)
+        # Local ISO-8601 timestamps compare chronologically as plain strings
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
         deleted_count = 0
 
-        backups_to_delete = []
-        for backup_id, info in self.backup_index["backups"].items():
-            created_at = datetime.fromisoformat(info["created_at"]).timestamp()
-            if created_at < cutoff_date:
-                backups_to_delete.append(backup_id)
+        backups_to_delete = [
+            backup_id
+            for backup_id, record in self.backup_index["backups"].items()
+            if record.created_at < cutoff
+        ]
 
         for backup_id in backups_to_delete:
             try:
@@ -231,6 +552,10 @@ class BackupManager:
                 # Continue with other deletions even if one fails
                 continue
 
+        # One snapshot rewrite for the whole batch of deletions
+        if deleted_count:
+            self._compact_index()
+
         return deleted_count
 
     def get_backup_size(self) -> int:
@@ -240,10 +565,7 @@ class BackupManager:
         Returns:
             Total size in bytes
         """
-        total_size = 0
-        for info in self.backup_index["backups"].values():
-            total_size += info["size"]
-        return total_size
+        return sum(record.size for record in self.backup_index["backups"].values())
 
 
 def create_backup_manager(backup_dir: Optional[Path] = None) -> BackupManager:
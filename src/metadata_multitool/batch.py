@@ -2,16 +2,36 @@
 
 from __future__ import annotations
 
-import multiprocessing as mp
+import atexit
+import os
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sized,
+    Tuple,
+)
 
 from tqdm import tqdm
 
 from .core import MetadataMultitoolError
 
+try:
+    import psutil
+except ImportError:
+    # Optional; memory usage reads as 0 without it
+    psutil = None
+
 
 class BatchProcessingError(MetadataMultitoolError):
     """Raised when batch processing operations fail."""
@@ -19,166 +39,290 @@ class BatchProcessingError(MetadataMultitoolError):
     pass
 
 
+# Estimated (seconds per MB, cap in seconds) to process a file by type;
+# TIFF files are typically slower to process and JPEG files faster
+_SECONDS_PER_MB = {
+    ".tif": (0.002, 0.02),
+    ".tiff": (0.002, 0.02),
+    ".jpg": (0.0005, 0.005),
+    ".jpeg": (0.0005, 0.005),
+}
+_DEFAULT_SECONDS_PER_MB = (0.001, 0.01)
+
+# CPUs this process may run on; honours cpuset/affinity limits in
+# containers, where os.cpu_count() reports every CPU on the host
+if hasattr(os, "sched_getaffinity"):
+    _DEFAULT_WORKERS = len(os.sched_getaffinity(0)) or 1
+else:
+    _DEFAULT_WORKERS = os.cpu_count() or 1
+
+# Seconds between ETA/memory updates while a batch runs
+_PROGRESS_CHECK_INTERVAL = 1.0
+
+# psutil handle for this process, rebuilt after a fork
+_PROCESS: Optional[Any] = None
+
+# Worker pool shared by every batch in the process, and its size
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_WORKERS = 0
+
+
+def _init_worker() -> None:
+    """Import the modules batch jobs use once per worker process."""
+    from . import clean, exif, poison  # noqa: F401
+
+    try:
+        from PIL import Image  # noqa: F401
+    except ImportError:
+        pass
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared worker pool, starting it for ``workers`` processes."""
+    global _POOL, _POOL_WORKERS
+    if _POOL is not None and _POOL_WORKERS != workers:
+        shutdown_pool()
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+        _POOL_WORKERS = workers
+    return _POOL
+
+
+def shutdown_pool() -> None:
+    """Stop the shared worker pool; the next batch starts a fresh one."""
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown(wait=True)
+        _POOL = None
+
+
+atexit.register(shutdown_pool)
+
+
+def default_workers() -> int:
+    """Return how many worker processes a batch uses unless told otherwise."""
+    return _DEFAULT_WORKERS
+
+
+def pool_map(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    workers: int,
+    chunksize: int = 1,
+    window: Optional[int] = None,
+) -> Iterator[Any]:
+    """
+    Map ``func`` over items on the shared worker pool, yielding results in order.
+
+    A pool left broken by a worker that died in an earlier call is replaced
+    before anything is submitted. A worker dying during this call raises
+    ``BrokenProcessPool`` from the returned iterator; the caller decides what
+    the lost items mean and should call ``shutdown_pool``.
+
+    Args:
+        func: Picklable function to run on each item
+        items: Items to process
+        workers: Number of worker processes
+        chunksize: Items sent to a worker at a time
+        window: If set, items are read this many at a time, and each window
+            is submitted before the results of the previous one are consumed,
+            so an iterable is never read in full up front
+
+    Returns:
+        Iterator over the results
+    """
+    remaining = iter(items)
+    first = list(islice(remaining, window) if window else remaining)
+    try:
+        pending = _get_pool(workers).map(func, first, chunksize=chunksize)
+    except BrokenProcessPool:
+        # A worker died in an earlier call; start again with fresh ones
+        shutdown_pool()
+        pending = _get_pool(workers).map(func, first, chunksize=chunksize)
+    if not window:
+        return pending
+    return _map_windows(_get_pool(workers), func, pending, remaining, chunksize, window)
+
+
+def _map_windows(
+    executor: ProcessPoolExecutor,
+    func: Callable[[Any], Any],
+    pending: Iterable[Any],
+    remaining: Iterator[Any],
+    chunksize: int,
+    window: int,
+) -> Iterator[Any]:
+    """Yield ``pending``'s results, keeping the next window queued behind them."""
+    while True:
+        chunk = list(islice(remaining, window))
+        following = executor.map(func, chunk, chunksize=chunksize) if chunk else None
+        yield from pending
+        if following is None:
+            return
+        pending = following
+
+
 def process_batch(
-    items: List[Path],
+    items: Iterable[Path],
     process_func: Callable[[Path], Tuple[bool, str]],
     batch_size: int = 100,
-    max_workers: int = 4,
+    max_workers: int = _DEFAULT_WORKERS,
     progress_bar: bool = True,
     desc: str = "Processing",
     disable_progress: bool = False,
     memory_limit_mb: float = 1024,
     show_eta: bool = True,
-) -> Tuple[int, int, List[str]]:
+    return_values: bool = False,
+) -> Tuple[Any, ...]:
     """
-    Process a list of items in batches with parallel processing.
+    Process items in batches with parallel processing.
 
     Args:
-        items: List of items to process
+        items: Items to process; a list, or any iterable, which is then read
+            a window at a time while the workers process earlier items
         process_func: Function to process each item, returns (success, message)
+            or (success, message, value)
         batch_size: Number of items per batch
-        max_workers: Maximum number of worker processes
+        max_workers: Maximum number of worker processes (defaults to the
+            CPUs this process may run on)
         progress_bar: Whether to show progress bar
         desc: Description for progress bar
         disable_progress: Whether to disable progress bar entirely
         memory_limit_mb: Memory limit in MB for monitoring
         show_eta: Whether to show estimated time remaining
+        return_values: Whether to also return the value of each successful
+            item; workers' values are sent back to this process
 
     Returns:
-        Tuple of (successful_count, total_count, error_messages)
+        Tuple of (successful_count, total_count, error_messages), followed
+        with return_values by the list of successful items' values in item
+        order (None for items that returned no value)
 
     Raises:
         BatchProcessingError: If batch processing fails
     """
-    if not items:
-        return 0, 0, []
+    # Unknown for an iterable until it has been read to the end
+    total = len(items) if isinstance(items, Sized) else None
+    if total == 0:
+        return (0, 0, [], []) if return_values else (0, 0, [])
 
-    total = len(items)
     successful = 0
     errors = []
+    values = []
 
     # Determine number of workers (don't exceed available CPUs or item count)
-    workers = min(max_workers, mp.cpu_count(), total)
+    workers = min(max_workers, _DEFAULT_WORKERS, total or max_workers)
 
     if workers <= 1:
         # Single-threaded processing
-        return _process_sequential(
+        result = _process_sequential(
             items, process_func, progress_bar, desc, disable_progress
         )
+        return result if return_values else result[:3]
 
-    # Create batches
-    batches = [items[i : i + batch_size] for i in range(0, total, batch_size)]
+    # Let the pool chunk the items; never exceed the caller's batch size.
+    # An iterable is read a window at a time rather than up front
+    if total is None:
+        chunksize = max(batch_size, 1)
+        window = chunksize * workers
+    else:
+        chunksize = min(batch_size, get_optimal_batch_size(total, workers))
+        window = None
+    show_progress = progress_bar and not disable_progress
+    processed = 0
+    start_time = time.time()
+    last_check = 0.0
 
     try:
-        with ProcessPoolExecutor(max_workers=workers) as executor:
-            # Submit all batches
-            future_to_batch = {
-                executor.submit(_process_batch_worker, batch, process_func): batch
-                for batch in batches
-            }
-
-            # Process results with progress bar
-            if progress_bar and not disable_progress:
-                start_time = time.time()
-                with tqdm(total=total, desc=desc, unit="item") as pbar:
-                    for future in as_completed(future_to_batch):
-                        batch = future_to_batch[future]
-                        try:
-                            batch_successful, batch_errors = future.result()
-                            successful += batch_successful
-                            errors.extend(batch_errors)
-                            pbar.update(len(batch))
-
-                            # Update progress bar with ETA if enabled
-                            if show_eta and successful > 0:
-                                eta = calculate_eta(successful, total, start_time)
-                                if eta:
-                                    pbar.set_postfix(
-                                        eta=eta, memory=f"{get_memory_usage():.1f}MB"
-                                    )
-
-                            # Check memory limit
-                            if not check_memory_limit(memory_limit_mb):
-                                errors.append(
-                                    f"Memory limit exceeded ({memory_limit_mb}MB)"
+        # Reuse warm workers rather than paying process start-up per call
+        results = pool_map(
+            partial(_process_item, process_func), items, workers, chunksize, window
+        )
+
+        with tqdm(total=total, desc=desc, unit="item", disable=not show_progress) as pbar:
+            try:
+                for error, value in results:
+                    processed += 1
+                    if error is None:
+                        successful += 1
+                        values.append(value)
+                    else:
+                        errors.append(error)
+                    pbar.update(1)
+
+                    # Progress extras and the memory check at most once a second
+                    now = time.monotonic()
+                    if show_progress and (
+                        now - last_check >= _PROGRESS_CHECK_INTERVAL or processed == total
+                    ):
+                        last_check = now
+
+                        # Update progress bar with ETA if enabled
+                        if show_eta and total is not None:
+                            eta = calculate_eta(processed, total, start_time)
+                            if eta:
+                                pbar.set_postfix(
+                                    eta=eta, memory=f"{get_memory_usage():.1f}MB"
                                 )
 
-                        except Exception as e:
-                            errors.append(f"Batch processing error: {e}")
-                            pbar.update(len(batch))
-            else:
-                # Process without progress bar
-                for future in as_completed(future_to_batch):
-                    batch = future_to_batch[future]
-                    try:
-                        batch_successful, batch_errors = future.result()
-                        successful += batch_successful
-                        errors.extend(batch_errors)
-                    except Exception as e:
-                        errors.append(f"Batch processing error: {e}")
+                        # Check memory limit
+                        if not check_memory_limit(memory_limit_mb):
+                            errors.append(
+                                f"Memory limit exceeded ({memory_limit_mb}MB)"
+                            )
+            except BrokenProcessPool as e:
+                # Items not yet returned are lost with the dead worker
+                shutdown_pool()
+                errors.append(f"Batch processing error: {e}")
 
     except Exception as e:
         raise BatchProcessingError(f"Failed to process batches: {e}")
 
-    return successful, total, errors
+    result = (successful, total if total is not None else processed, errors, values)
+    return result if return_values else result[:3]
+
+
+def _process_item(
+    process_func: Callable[[Path], Tuple[bool, str]], item: Path
+) -> Tuple[Optional[str], Any]:
+    """Process one item, returning (error message or None, value or None)."""
+    try:
+        result = process_func(item)
+    except Exception as e:
+        return f"{item}: {e}", None
+    if not result[0]:
+        return f"{item}: {result[1]}", None
+    return None, result[2] if len(result) > 2 else None
 
 
 def _process_sequential(
-    items: List[Path],
+    items: Iterable[Path],
     process_func: Callable[[Path], Tuple[bool, str]],
     progress_bar: bool,
     desc: str,
     disable_progress: bool,
-) -> Tuple[int, int, List[str]]:
+) -> Tuple[int, int, List[str], List[Any]]:
     """Process items sequentially (fallback for single-threaded processing)."""
-    total = len(items)
+    total = len(items) if isinstance(items, Sized) else None
+    processed = 0
     successful = 0
     errors = []
+    values = []
 
-    if progress_bar and not disable_progress:
-        with tqdm(total=total, desc=desc, unit="item") as pbar:
-            for item in items:
-                try:
-                    success, message = process_func(item)
-                    if success:
-                        successful += 1
-                    else:
-                        errors.append(f"{item}: {message}")
-                except Exception as e:
-                    errors.append(f"{item}: {e}")
-                pbar.update(1)
-    else:
+    with tqdm(
+        total=total, desc=desc, unit="item", disable=not progress_bar or disable_progress
+    ) as pbar:
         for item in items:
-            try:
-                success, message = process_func(item)
-                if success:
-                    successful += 1
-                else:
-                    errors.append(f"{item}: {message}")
-            except Exception as e:
-                errors.append(f"{item}: {e}")
-
-    return successful, total, errors
-
-
-def _process_batch_worker(
-    batch: List[Path], process_func: Callable[[Path], Tuple[bool, str]]
-) -> Tuple[int, List[str]]:
-    """Worker function for processing a batch of items."""
-    successful = 0
-    errors = []
-
-    for item in batch:
-        try:
-            success, message = process_func(item)
-            if success:
+            processed += 1
+            error, value = _process_item(process_func, item)
+            if error is None:
                 successful += 1
+                values.append(value)
             else:
-                errors.append(f"{item}: {message}")
-        except Exception as e:
-            errors.append(f"{item}: {e}")
+                errors.append(error)
+            pbar.update(1)
 
-    return successful, errors
+    return successful, processed, errors, values
 
 
 def estimate_processing_time(
@@ -202,32 +346,28 @@ def estimate_processing_time(
 
     sample_items = items[: min(sample_size, len(items))]
 
+    if process_func is None:
+        # Fallback: estimate from file size and type without running anything
+        estimate = 0.0
+        for item in sample_items:
+            try:
+                size_mb = item.stat().st_size / (1024 * 1024)
+            except OSError:
+                continue
+            rate, cap = _SECONDS_PER_MB.get(item.suffix.lower(), _DEFAULT_SECONDS_PER_MB)
+            estimate += min(cap, size_mb * rate)
+        return estimate / len(sample_items)
+
     try:
         start_time = time.time()
 
-        if process_func:
-            # Use actual processing function for accurate timing
-            for item in sample_items:
-                try:
-                    process_func(item)
-                except Exception:
-                    # Continue with other items if one fails
-                    pass
-        else:
-            # Fallback: estimate based on file characteristics
-            for item in sample_items:
-                if item.exists():
-                    size_mb = item.stat().st_size / (1024 * 1024)
-                    # More realistic estimation based on file size and type
-                    if item.suffix.lower() in [".tiff", ".tif"]:
-                        # TIFF files are typically slower to process
-                        time.sleep(min(0.02, size_mb * 0.002))
-                    elif item.suffix.lower() in [".jpg", ".jpeg"]:
-                        # JPEG files are typically faster
-                        time.sleep(min(0.005, size_mb * 0.0005))
-                    else:
-                        # Other formats
-                        time.sleep(min(0.01, size_mb * 0.001))
+        # Use actual processing function for accurate timing
+        for item in sample_items:
+            try:
+                process_func(item)
+            except Exception:
+                # Continue with other items if one fails
+                pass
 
         elapsed = time.time() - start_time
         return elapsed / len(sample_items)
@@ -261,15 +401,15 @@ def get_memory_usage() -> float:
     Returns:
         Memory usage in MB
     """
-    try:
-        import psutil
-
-        process = psutil.Process()
-        return process.memory_info().rss / 1024 / 1024
-    except ImportError:
+    global _PROCESS
+    if psutil is None:
         # Fallback if psutil not available
         return 0.0
 
+    if _PROCESS is None or _PROCESS.pid != os.getpid():
+        _PROCESS = psutil.Process()
+    return _PROCESS.memory_info().rss / 1024 / 1024
+
 
 def check_memory_limit(memory_limit_mb: float = 1024) -> bool:
     """
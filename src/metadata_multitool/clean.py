@@ -1,22 +1,242 @@
 from __future__ import annotations
 
+import hashlib
+import os
 import shutil
+import struct
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Optional, Set, Dict, Any, List
+from typing import (
+    BinaryIO, Callable, FrozenSet, Optional, Set, Dict, Any, List, Tuple
+)
 import tempfile
 import subprocess
 import json
 
-from .core import ensure_dir, iter_images
-from .exif import strip_all_metadata, get_metadata_fields, has_exiftool
+from .batch import default_workers, get_optimal_batch_size, pool_map, shutdown_pool
+from .core import (
+    MetadataMultitoolError,
+    ensure_dir,
+    fast_copy,
+    iter_images,
+    raise_if_same_file,
+)
+from .exif import (
+    ExifToolError,
+    ExifToolSession,
+    get_exiftool_session,
+    get_metadata_fields,
+    get_metadata_fields_batch,
+    has_exiftool,
+    strip_all_metadata,
+    strip_all_metadata_batch,
+)
 from .metadata_profiles import MetadataProfile, apply_profile_to_fields, get_predefined_profiles
 
+# Bytes read at a time while parsing headers; JPEG metadata is normally
+# all within the first read
+_HEADER_READ_SIZE = 64 * 1024
+
+# Bytes copied at a time when streaming image data
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# PNG chunks holding text, EXIF data or timestamps
+_PNG_METADATA_CHUNKS = frozenset({b"tEXt", b"iTXt", b"zTXt", b"eXIf", b"tIME"})
+
+# JPEG markers not followed by a segment length (TEM, RST0-RST7)
+_JPEG_STANDALONE_MARKERS = frozenset({0x01, *range(0xD0, 0xD8)})
+
+# JPEG segments dropped while stripping: APP1-APP13, APP15 and comments.
+# JFIF (APP0) and Adobe (APP14) stay, as decoders use them for colours.
+_JPEG_METADATA_MARKERS = frozenset({*range(0xE1, 0xEE), 0xEF, 0xFE})
+
+_JPEG_SOS = 0xDA
+_JPEG_EOI = 0xD9
+
+
+def _read_more(src: BinaryIO, buf: bytearray) -> None:
+    """Extend a header buffer from the file, failing on a truncated file."""
+    more = src.read(_HEADER_READ_SIZE)
+    if not more:
+        raise ValueError("truncated image header")
+    buf += more
+
+
+def _copy_rest(src: BinaryIO, dst: BinaryIO) -> None:
+    """Copy everything from src's position to its end onto dst."""
+    dst.flush()
+    if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        offset = src.tell()
+        try:
+            while True:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, _COPY_CHUNK_SIZE)
+                if not sent:
+                    return
+                offset += sent
+        except OSError:
+            # Resume where the kernel copy stopped
+            src.seek(offset)
+            dst.seek(0, os.SEEK_END)
+    shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
+
+
+def _copy_bytes(src: BinaryIO, dst: BinaryIO, count: int) -> None:
+    """Copy exactly count bytes from src to dst."""
+    while count:
+        chunk = src.read(min(count, _COPY_CHUNK_SIZE))
+        if not chunk:
+            raise ValueError("truncated image data")
+        dst.write(chunk)
+        count -= len(chunk)
+
+
+def _scan_jpeg_markers(
+    buf: bytes,
+) -> Optional[Tuple[int, List[Tuple[int, int]]]]:
+    """
+    Walk the JPEG segments before the first scan.
+
+    Only segment headers are visited, so the walk takes one step per
+    segment rather than per byte.
+
+    Args:
+        buf: Start of a JPEG file
+
+    Returns:
+        Offset of the first scan (or end of image) and the (start, end)
+        spans to keep before it, or None if buf ends before the scan
+
+    Raises:
+        ValueError: If buf is not a JPEG
+    """
+    if not buf.startswith(b"\xff\xd8"):
+        raise ValueError("not a JPEG file")
+    kept = [(0, 2)]
+    pos = 2
+    size = len(buf)
+    while pos + 2 <= size:
+        if buf[pos] != 0xFF:
+            raise ValueError("invalid JPEG marker")
+        marker = buf[pos + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            pos += 1
+            continue
+        if marker == _JPEG_SOS or marker == _JPEG_EOI:
+            return pos, kept
+        if marker in _JPEG_STANDALONE_MARKERS:
+            end = pos + 2
+        elif pos + 4 <= size:
+            end = pos + 2 + ((buf[pos + 2] << 8) | buf[pos + 3])
+        else:
+            return None
+        if marker not in _JPEG_METADATA_MARKERS:
+            kept.append((pos, end))
+        pos = end
+    return None
+
+
+def _strip_jpeg(src: BinaryIO, dst: BinaryIO) -> None:
+    """
+    Copy a JPEG without its metadata segments.
+
+    APP1-APP13, APP15 (EXIF, XMP, ICC, IPTC and others) and comments before
+    the first scan are dropped; everything from the first scan on is copied
+    unchanged.
+    """
+    buf = bytearray(src.read(_HEADER_READ_SIZE))
+    scan = _scan_jpeg_markers(buf)
+    while scan is None:
+        # Headers rarely outgrow the first read, so rescanning is cheap
+        _read_more(src, buf)
+        scan = _scan_jpeg_markers(buf)
+
+    scan_start, kept = scan
+    with memoryview(buf) as view:
+        # The kept header goes out in a single write
+        header = [view[start:end] for start, end in kept]
+        header.append(view[scan_start:])
+        dst.write(b"".join(header))
+    _copy_rest(src, dst)
+
+
+def _strip_png(src: BinaryIO, dst: BinaryIO) -> None:
+    """Copy a PNG without its text, EXIF and timestamp chunks."""
+    if src.read(len(_PNG_SIGNATURE)) != _PNG_SIGNATURE:
+        raise ValueError("not a PNG file")
+    dst.write(_PNG_SIGNATURE)
+    while True:
+        header = src.read(8)
+        if len(header) < 8:
+            raise ValueError("truncated PNG file")
+        length, chunk_type = struct.unpack(">I4s", header)
+        if chunk_type in _PNG_METADATA_CHUNKS:
+            # Skip the data and its CRC
+            src.seek(length + 4, os.SEEK_CUR)
+            continue
+        dst.write(header)
+        _copy_bytes(src, dst, length + 4)
+        if chunk_type == b"IEND":
+            return
+
+
+# Single-pass strippers by lower-case file extension
+_FORMAT_HANDLERS: Dict[str, Callable[[BinaryIO, BinaryIO], None]] = {
+    ".jpg": _strip_jpeg,
+    ".jpeg": _strip_jpeg,
+    ".png": _strip_png,
+}
+
+
+def clean_copy_stream(src: Path, dest_dir: Path) -> Path:
+    """
+    Create a metadata-free copy of an image file in a single pass.
+
+    JPEG and PNG files have their metadata left out while they are copied,
+    so the copy is written once. Other formats, and files whose contents
+    do not match their extension, are copied and then stripped in place.
+
+    Args:
+        src: Source image file
+        dest_dir: Destination directory
+
+    Returns:
+        Path to the cleaned copy
+
+    Raises:
+        shutil.SameFileError: If the copy would be written over ``src``
+    """
+    ensure_dir(dest_dir)
+    out = dest_dir / src.name
+    # Opening the copy for writing would truncate the source before it is read
+    raise_if_same_file(src, out)
+    strip = _FORMAT_HANDLERS.get(src.suffix.lower())
+    if strip is not None:
+        try:
+            with open(src, "rb") as src_file, open(out, "wb") as dst_file:
+                strip(src_file, dst_file)
+            shutil.copystat(src, out)
+            return out
+        except ValueError:
+            # Not the format its extension suggests
+            pass
+
+    strip_all_metadata(src, out)
+    return out
+
 
 def clean_copy(
     src: Path, 
     dest_dir: Path, 
     profile: Optional[MetadataProfile] = None,
-    preserve_fields: Optional[Set[str]] = None
+    preserve_fields: Optional[Set[str]] = None,
+    session: Optional[ExifToolSession] = None
 ) -> Path:
     """
     Create a cleaned copy of an image file.
@@ -26,28 +246,31 @@ def clean_copy(
         dest_dir: Destination directory
         profile: Metadata profile to apply (optional)
         preserve_fields: Specific fields to preserve (optional)
+        session: ExifTool session for selective cleaning (optional)
         
     Returns:
         Path to the cleaned copy
     """
+    if not (profile or preserve_fields):
+        # Complete metadata removal
+        return clean_copy_stream(src, dest_dir)
+
     ensure_dir(dest_dir)
     out = dest_dir / src.name
-    shutil.copy2(src, out)
-    
-    if profile or preserve_fields:
-        # Selective cleaning
-        selective_clean_metadata(out, profile, preserve_fields)
-    else:
-        # Complete metadata removal
-        strip_all_metadata(out)
-    
+    fast_copy(src, out)
+
+    # Selective cleaning
+    selective_clean_metadata(out, profile, preserve_fields, session)
+
     return out
 
 
 def selective_clean_metadata(
     file_path: Path,
     profile: Optional[MetadataProfile] = None,
-    preserve_fields: Optional[Set[str]] = None
+    preserve_fields: Optional[Set[str]] = None,
+    session: Optional[ExifToolSession] = None,
+    verify: bool = False
 ) -> Dict[str, Any]:
     """
     Selectively clean metadata from an image file.
@@ -56,6 +279,10 @@ def selective_clean_metadata(
         file_path: Path to image file to clean
         profile: Metadata profile to apply
         preserve_fields: Specific fields to preserve
+        session: ExifTool session to run in (default: one ExifTool run
+            per step)
+        verify: Re-read the file afterwards and report the fields actually
+            left, rather than the fields ExifTool was asked to keep
         
     Returns:
         Dictionary with operation results
@@ -71,8 +298,28 @@ def selective_clean_metadata(
         }
     
     try:
+        explicit_tags = None
+        if profile and not preserve_fields:
+            explicit_tags = profile.preserve_explicit_tags()
+        if explicit_tags is not None:
+            # The profile names every tag it keeps, so there is no need to
+            # list the file's tags first
+            if not explicit_tags:
+                strip_all_metadata(file_path)
+                return {
+                    "method": "complete_removal",
+                    "preserved_fields": [],
+                    "removed_fields": ["all"],
+                    "profile_used": profile.name
+                }
+            result = _preserve_only_with_exiftool(
+                file_path, explicit_tags, session, verify
+            )
+            result["profile_used"] = profile.name
+            return result
+
         # Get all current metadata fields
-        all_fields = get_metadata_fields(file_path)
+        all_fields = get_metadata_fields(file_path, session)
         
         if not all_fields:
             return {
@@ -103,7 +350,9 @@ def selective_clean_metadata(
             }
         
         # Perform selective removal
-        result = _selective_remove_with_exiftool(file_path, all_fields, fields_to_preserve)
+        result = _selective_remove_with_exiftool(
+            file_path, all_fields, fields_to_preserve, session, verify
+        )
         result["profile_used"] = profile.name if profile else None
         
         return result
@@ -120,10 +369,89 @@ def selective_clean_metadata(
         }
 
 
+def _run_exiftool_args(
+    args: List[str], session: Optional[ExifToolSession] = None
+) -> None:
+    """
+    Run one ExifTool write command, in the session when one is given.
+
+    ExifTool's standard output is discarded rather than decoded; only its
+    errors are read.
+
+    Raises:
+        ExifToolError: If ExifTool reports an error
+    """
+    if session is not None and "\n" not in args[-1]:
+        _, stderr = session.execute(args)
+        if "Error:" in stderr:
+            raise ExifToolError(f"ExifTool error: {stderr}")
+        return
+    
+    if "\n" in args[-1]:
+        # An argfile holds one argument per line
+        command, argfile = ["exiftool", *args], None
+    else:
+        # Through stdin, so long field lists never hit argv limits
+        command = ["exiftool", "-charset", "filename=utf8", "-@", "-"]
+        argfile = ("\n".join(args) + "\n").encode("utf-8")
+    try:
+        subprocess.run(
+            command,
+            input=argfile,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            check=True
+        )
+    except subprocess.CalledProcessError as e:
+        stderr = e.stderr.decode("utf-8", "replace")
+        raise ExifToolError(f"ExifTool error: {stderr}") from e
+
+
+def _preserve_only_with_exiftool(
+    file_path: Path,
+    tags: FrozenSet[str],
+    session: Optional[ExifToolSession] = None,
+    verify: bool = False
+) -> Dict[str, Any]:
+    """
+    Use ExifTool to remove all metadata except the given tags in one run.
+    
+    Args:
+        file_path: Path to image file
+        tags: Tags to copy back after removing everything
+        session: ExifTool session to run in (optional)
+        verify: Re-read the file's fields to report what was actually
+            preserved (one more ExifTool run)
+        
+    Returns:
+        Dictionary with operation results
+    """
+    args = ["-overwrite_original", "-all=", "-tagsFromFile", "@"]
+    args.extend(f"-{tag}" for tag in sorted(tags))
+    args.append(str(file_path))
+    
+    _run_exiftool_args(args, session)
+    
+    if verify:
+        preserved = get_metadata_fields(file_path, session)
+    else:
+        # Tags missing from the file are simply not copied back
+        preserved = tags
+    
+    return {
+        "method": "selective_exiftool",
+        "preserved_fields": list(preserved),
+        "removed_fields": ["all"],
+        "intended_preserve": list(tags)
+    }
+
+
 def _selective_remove_with_exiftool(
     file_path: Path,
     all_fields: Set[str],
-    preserve_fields: Set[str]
+    preserve_fields: Set[str],
+    session: Optional[ExifToolSession] = None,
+    verify: bool = False
 ) -> Dict[str, Any]:
     """
     Use ExifTool to selectively remove metadata fields.
@@ -132,12 +460,19 @@ def _selective_remove_with_exiftool(
         file_path: Path to image file
         all_fields: Set of all metadata fields in the file
         preserve_fields: Set of fields to preserve
+        session: ExifTool session to run in (optional)
+        verify: Re-read the file's fields to report what was actually
+            preserved and removed (one more ExifTool run)
         
     Returns:
         Dictionary with operation results
     """
-    # Calculate fields to remove
-    fields_to_remove = all_fields - preserve_fields
+    # Split the file's fields in one pass; the lists go straight into the
+    # command and the result, with no intermediate sets
+    fields_to_keep: List[str] = []
+    fields_to_remove: List[str] = []
+    for field in all_fields:
+        (fields_to_keep if field in preserve_fields else fields_to_remove).append(field)
     
     if not fields_to_remove:
         return {
@@ -147,38 +482,41 @@ def _selective_remove_with_exiftool(
             "message": "All fields were marked for preservation"
         }
     
-    # Create ExifTool command to remove specific fields
-    cmd = ["exiftool", "-overwrite_original"]
+    # Create ExifTool arguments removing each field from the file
+    args = ["-overwrite_original"]
+    args.extend(f"-{field}=" for field in fields_to_remove)
+    args.append(str(file_path))
     
-    # Add removal commands for each field
-    for field in fields_to_remove:
-        cmd.extend([f"-{field}=", str(file_path)])
+    _run_exiftool_args(args, session)
     
-    try:
-        # Execute ExifTool command
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        # Verify the operation
-        remaining_fields = get_metadata_fields(file_path)
-        actually_preserved = remaining_fields & all_fields
-        actually_removed = all_fields - remaining_fields
-        
-        return {
-            "method": "selective_exiftool",
-            "preserved_fields": list(actually_preserved),
-            "removed_fields": list(actually_removed),
-            "intended_preserve": list(preserve_fields),
-            "intended_remove": list(fields_to_remove),
-            "exiftool_output": result.stdout
-        }
-        
-    except subprocess.CalledProcessError as e:
-        raise Exception(f"ExifTool error: {e.stderr}")
+    if verify:
+        remaining_fields = get_metadata_fields(file_path, session)
+        actually_preserved = list(remaining_fields & all_fields)
+        actually_removed = list(all_fields - remaining_fields)
+    else:
+        # ExifTool succeeded, so trust it did what it was asked
+        actually_preserved = fields_to_keep
+        actually_removed = fields_to_remove.copy()
+    
+    return {
+        "method": "selective_exiftool",
+        "preserved_fields": actually_preserved,
+        "removed_fields": actually_removed,
+        "intended_preserve": list(preserve_fields),
+        "intended_remove": fields_to_remove
+    }
+
+
+# Records the files earlier runs cleaned; kept in the input directory, never
+# in the output directory that is prepared for upload
+_MANIFEST_NAME = ".mm_cleaned.json"
+
+_NO_IMAGES_RESULT = {
+    "message": "No images found",
+    "processed": 0,
+    "successful": 0,
+    "failed": 0
+}
 
 
 def clean_directory(
@@ -190,7 +528,8 @@ def clean_directory(
     backup: bool = False,
     dry_run: bool = False,
     recursive: bool = False,
-    config_path: Optional[Path] = None
+    config_path: Optional[Path] = None,
+    workers: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Clean metadata from all images in a directory.
@@ -205,6 +544,8 @@ def clean_directory(
         dry_run: Whether to preview operations without executing
         recursive: Whether to process subdirectories
         config_path: Path to configuration file
+        workers: Maximum number of worker processes (default: the CPUs
+            this process may run on)
         
     Returns:
         Dictionary with operation results
@@ -224,34 +565,39 @@ def clean_directory(
             }
     
     # Convert preserve_fields to set
-    preserve_field_set = set(preserve_fields) if preserve_fields else None
-    
-    # Find all images
-    try:
-        image_files = list(iter_images(input_path, recursive=recursive))
-    except Exception as e:
-        return {"error": f"Error finding images: {e}"}
-    
-    if not image_files:
-        return {
-            "message": "No images found",
-            "processed": 0,
-            "successful": 0,
-            "failed": 0
-        }
+    preserve_field_set = (
+        frozenset(map(sys.intern, preserve_fields)) if preserve_fields else None
+    )
     
-    # Dry run mode
+    # Dry run mode: count the images without holding every path
     if dry_run:
+        try:
+            images = iter_images(input_path, recursive=recursive)
+            shown = list(islice(images, 10))  # Show first 10 files
+            would_process = len(shown) + sum(1 for _ in images)
+        except Exception as e:
+            return {"error": f"Error finding images: {e}"}
+        if not shown:
+            return _NO_IMAGES_RESULT.copy()
         return {
             "dry_run": True,
-            "would_process": len(image_files),
+            "would_process": would_process,
             "input_path": str(input_path),
             "output_path": str(output_path),
             "profile_used": profile.name if profile else None,
             "preserve_fields": list(preserve_field_set) if preserve_field_set else [],
-            "files": [str(f) for f in image_files[:10]]  # Show first 10 files
+            "files": [str(f) for f in shown]
         }
     
+    # Find all images
+    try:
+        image_files = list(iter_images(input_path, recursive=recursive))
+    except Exception as e:
+        return {"error": f"Error finding images: {e}"}
+    
+    if not image_files:
+        return _NO_IMAGES_RESULT.copy()
+    
     # Process files
     results = {
         "processed": 0,
@@ -264,41 +610,352 @@ def clean_directory(
         "backup_created": backup
     }
     
-    # Create backup directory if requested
-    backup_dir = None
+    # Files cleaned by an earlier run with the same settings, and untouched
+    # since, are skipped without running ExifTool on them again
+    manifest_dir = input_path if input_path.is_dir() else input_path.parent
+    signature = _clean_signature(profile, preserve_field_set, output_path)
+    manifest = _load_manifest(manifest_dir)
+    pending = [
+        f for f in image_files
+        if not _already_cleaned(manifest, f, manifest_dir, output_path, signature)
+    ]
+    results["skipped"] = len(image_files) - len(pending)
+    image_files = to_clean = pending
+    
+    # Back up every file first; files that could not be backed up are
+    # left uncleaned
     if backup:
         backup_dir = input_path / "backup"
         ensure_dir(backup_dir)
+        errors = _backup_files(image_files, backup_dir)
+        if errors:
+            results["processed"] += len(errors)
+            results["failed"] += len(errors)
+            results["errors"].extend(errors)
+            not_backed_up = {error["file"] for error in errors}
+            image_files = [f for f in image_files if str(f) not in not_backed_up]
     
-    for img_file in image_files:
-        try:
-            results["processed"] += 1
-            
-            # Create backup if requested
-            if backup:
-                backup_file = backup_dir / img_file.name
-                shutil.copy2(img_file, backup_file)
-            
-            # Clean the file
-            cleaned_file = clean_copy(
-                img_file,
-                output_path,
-                profile=profile,
-                preserve_fields=preserve_field_set
-            )
-            
-            results["successful"] += 1
-            
-        except Exception as e:
+    if not (profile or preserve_field_set):
+        # Formats without a single-pass stripper are copied and stripped
+        # by one ExifTool command instead of one per file
+        batched = [f for f in image_files if f.suffix.lower() not in _FORMAT_HANDLERS]
+        if len(batched) > 1:
+            errors = _copy_and_strip_batch(batched, output_path)
+            results["processed"] += len(batched)
+            results["successful"] += len(batched) - len(errors)
+            results["failed"] += len(errors)
+            results["errors"].extend(errors)
+            image_files = [f for f in image_files if f.suffix.lower() in _FORMAT_HANDLERS]
+    elif len(image_files) > 1 and has_exiftool():
+        # Files needing the same tags removed share one ExifTool command
+        leftover = _selective_clean_batch(
+            image_files, output_path, profile, preserve_field_set
+        )
+        results["processed"] += len(image_files) - len(leftover)
+        results["successful"] += len(image_files) - len(leftover)
+        image_files = leftover
+    
+    clean_one = partial(_clean_one, output_path, profile, preserve_field_set)
+    available = default_workers()
+    workers = min(workers or available, available, len(image_files))
+    
+    if workers <= 1:
+        # One ExifTool process serves every selective clean in the run; it
+        # is only started if a file needs it
+        with ExifToolSession() as session:
+            errors = [clean_one(img_file, session) for img_file in image_files]
+    else:
+        # Files are independent, so they are cleaned on the shared worker
+        # pool; each worker keeps its own ExifTool session
+        chunksize = get_optimal_batch_size(len(image_files), workers)
+        errors = pool_map(clean_one, image_files, workers, chunksize)
+    
+    reported = 0
+    try:
+        for error in errors:
+            reported += 1
+            if error is None:
+                results["successful"] += 1
+            else:
+                results["failed"] += 1
+                results["errors"].append(error)
+    except BrokenProcessPool as e:
+        # Files not yet reported are lost with the dead worker
+        shutdown_pool()
+        for img_file in image_files[reported:]:
             results["failed"] += 1
-            results["errors"].append({
-                "file": str(img_file),
-                "error": str(e)
-            })
+            results["errors"].append({"file": str(img_file), "error": str(e)})
+    results["processed"] += len(image_files)
+    
+    failed_files = {error["file"] for error in results["errors"]}
+    _record_cleaned(
+        manifest,
+        [f for f in to_clean if str(f) not in failed_files],
+        manifest_dir,
+        output_path,
+        signature
+    )
     
     return results
 
 
+def _clean_signature(
+    profile: Optional[MetadataProfile],
+    preserve_fields: Optional[FrozenSet[str]],
+    output_path: Path
+) -> str:
+    """Hash the settings that decide what a clean run keeps, and where to."""
+    rules = {
+        key: sorted(value) if isinstance(value, list) else value
+        for key, value in (profile.to_dict() if profile else {}).items()
+    }
+    rules["preserve"] = sorted(preserve_fields or ())
+    # Hashed rather than stored, so the manifest holds no absolute paths
+    rules["output"] = str(output_path.resolve())
+    encoded = json.dumps(rules, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _stat_key(path: Path) -> List[int]:
+    """Modification time and size, to tell whether a file has changed."""
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _manifest_key(img_file: Path, manifest_dir: Path) -> Optional[str]:
+    """Name img_file by its path relative to the manifest's directory."""
+    try:
+        return img_file.relative_to(manifest_dir).as_posix()
+    except ValueError:
+        return None
+
+
+def _load_manifest(manifest_dir: Path) -> Dict[str, Any]:
+    """Load the record of files in manifest_dir cleaned by earlier runs."""
+    try:
+        with open(manifest_dir / _MANIFEST_NAME, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _already_cleaned(
+    manifest: Dict[str, Any],
+    img_file: Path,
+    manifest_dir: Path,
+    output_path: Path,
+    signature: str
+) -> bool:
+    """Check whether img_file's clean copy is current for these settings."""
+    entry = manifest.get(_manifest_key(img_file, manifest_dir))
+    if not isinstance(entry, dict) or entry.get("signature") != signature:
+        return False
+    try:
+        return (
+            entry.get("source") == _stat_key(img_file)
+            and entry.get("output") == _stat_key(output_path / img_file.name)
+        )
+    except OSError:
+        return False
+
+
+def _record_cleaned(
+    manifest: Dict[str, Any],
+    cleaned: List[Path],
+    manifest_dir: Path,
+    output_path: Path,
+    signature: str
+) -> None:
+    """Add cleaned files to the manifest; it is only a cache, so errors are ignored."""
+    if not cleaned:
+        return
+    for img_file in cleaned:
+        key = _manifest_key(img_file, manifest_dir)
+        if key is None:
+            continue
+        try:
+            manifest[key] = {
+                "signature": signature,
+                "source": _stat_key(img_file),
+                "output": _stat_key(output_path / img_file.name),
+            }
+        except OSError:
+            manifest.pop(key, None)
+    
+    manifest_path = manifest_dir / _MANIFEST_NAME
+    tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, manifest_path)
+    except OSError:
+        pass
+
+
+def _backup_files(files: List[Path], backup_dir: Path) -> List[Dict[str, str]]:
+    """
+    Copy files into the backup directory on a thread pool.
+    
+    The copies are syscall bound and release the GIL, so they overlap.
+    
+    Returns:
+        Error details for each file that could not be backed up
+    """
+    max_workers = min(32, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        copies = [
+            (img_file, executor.submit(fast_copy, img_file, backup_dir / img_file.name))
+            for img_file in files
+        ]
+    
+    errors = []
+    for img_file, copy in copies:
+        try:
+            copy.result()
+        except Exception as e:
+            errors.append({"file": str(img_file), "error": str(e)})
+    return errors
+
+
+def _copy_and_strip_batch(
+    files: List[Path], output_path: Path
+) -> List[Dict[str, str]]:
+    """
+    Write stripped copies of files with one ExifTool command.
+    
+    Returns:
+        Error details for each file that could not be cleaned
+    """
+    ensure_dir(output_path)
+    try:
+        strip_all_metadata_batch(files, output_path)
+        return []
+    except Exception:
+        pass
+    
+    # Strip one at a time to tell which files failed
+    errors = []
+    for img_file in files:
+        try:
+            strip_all_metadata(img_file, output_path / img_file.name)
+        except Exception as e:
+            errors.append({"file": str(img_file), "error": str(e)})
+    return errors
+
+
+def _selective_clean_batch(
+    files: List[Path],
+    output_path: Path,
+    profile: Optional[MetadataProfile],
+    preserve_fields: Optional[Set[str]]
+) -> List[Path]:
+    """
+    Selectively clean copies of files, one ExifTool command per group.
+    
+    Files that need the same tags removed share a command, so ExifTool
+    starts once per group instead of once per file, and the tags of every
+    file are read in one run up front.
+    
+    Returns:
+        Files left to clean one at a time (their copy or group failed)
+    """
+    ensure_dir(output_path)
+    leftover = []
+    copies = {}
+    for img_file in files:
+        out = output_path / img_file.name
+        # Argfiles hold one argument per line
+        if "\n" in str(out):
+            leftover.append(img_file)
+            continue
+        try:
+            fast_copy(img_file, out)
+        except OSError:
+            leftover.append(img_file)
+            continue
+        copies[out] = img_file
+    
+    # Copies grouped by the arguments ExifTool needs for them; None strips all
+    groups: Dict[Optional[Tuple[str, ...]], List[Path]] = {}
+    explicit_tags = None
+    if profile and not preserve_fields:
+        explicit_tags = profile.preserve_explicit_tags()
+    if explicit_tags is not None:
+        # Every copy gets the same command, with no need to read its tags
+        if not copies:
+            return leftover
+        key = None
+        if explicit_tags:
+            tags = (f"-{tag}" for tag in sorted(explicit_tags))
+            key = ("-all=", "-tagsFromFile", "@", *tags)
+        groups[key] = list(copies)
+    else:
+        fields_by_copy = get_metadata_fields_batch(list(copies))
+        for out, img_file in copies.items():
+            all_fields = fields_by_copy.get(out)
+            if all_fields is None:
+                leftover.append(img_file)
+                continue
+            if not all_fields:
+                continue
+            fields_to_preserve = set(preserve_fields or ())
+            if profile:
+                fields_to_preserve.update(apply_profile_to_fields(all_fields, profile))
+            if not fields_to_preserve:
+                groups.setdefault(None, []).append(out)
+                continue
+            fields_to_remove = sorted(all_fields - fields_to_preserve)
+            if fields_to_remove:
+                key = tuple(f"-{field}=" for field in fields_to_remove)
+                groups.setdefault(key, []).append(out)
+    
+    with ExifToolSession() as session:
+        for key, outs in groups.items():
+            try:
+                if key is None:
+                    strip_all_metadata_batch(outs)
+                else:
+                    _run_exiftool_args(
+                        ["-overwrite_original", *key, *map(str, outs)], session
+                    )
+            except Exception:
+                # Retried one at a time to tell which files failed
+                leftover.extend(copies[out] for out in outs)
+    return leftover
+
+
+def _clean_one(
+    output_path: Path,
+    profile: Optional[MetadataProfile],
+    preserve_fields: Optional[Set[str]],
+    img_file: Path,
+    session: Optional[ExifToolSession] = None
+) -> Optional[Dict[str, str]]:
+    """
+    Clean one file for clean_directory.
+    
+    Returns:
+        Error details for the file, or None if it was cleaned
+    """
+    # Checked up front: far cheaper than raising for every unreadable file
+    if not img_file.is_file() or not os.access(img_file, os.R_OK):
+        return {"file": str(img_file), "error": "File is missing or not readable"}
+    try:
+        clean_copy(
+            img_file,
+            output_path,
+            profile=profile,
+            preserve_fields=preserve_fields,
+            session=session or get_exiftool_session()
+        )
+    except (
+        OSError, ValueError, subprocess.CalledProcessError, MetadataMultitoolError
+    ) as e:
+        return {"file": str(img_file), "error": str(e)}
+    return None
+
+
 def get_metadata_preview(
     file_path: Path,
     profile: Optional[MetadataProfile] = None,
@@ -343,14 +1000,18 @@ def get_metadata_preview(
             profile_preserved = apply_profile_to_fields(all_fields, profile)
             fields_to_preserve.update(profile_preserved)
         
-        fields_to_remove = all_fields - fields_to_preserve
+        # One sort of the file's fields; the removals keep its order
+        current_fields = sorted(all_fields)
+        fields_to_remove = [
+            field for field in current_fields if field not in fields_to_preserve
+        ]
         
         return {
             "file": str(file_path),
             "profile_used": profile.name if profile else None,
-            "current_fields": sorted(list(all_fields)),
-            "would_preserve": sorted(list(fields_to_preserve)),
-            "would_remove": sorted(list(fields_to_remove)),
+            "current_fields": current_fields,
+            "would_preserve": sorted(fields_to_preserve),
+            "would_remove": fields_to_remove,
             "field_counts": {
                 "total": len(all_fields),
                 "preserve": len(fields_to_preserve),
@@ -3,18 +3,25 @@
 from __future__ import annotations
 
 import argparse
+import os
 import sys
+from functools import lru_cache, partial
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, List, Tuple
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 from colorama import Fore, Style
 from colorama import init as color_init
 
-from .backup import backup_before_operation, create_backup_manager
-from .batch import process_batch
-from .clean import clean_copy, clean_directory, get_metadata_preview
-from .metadata_profiles import get_predefined_profiles, get_profile_summary
-from .audit import audit_directory, audit_file, generate_html_report, export_audit_json
 from .config import get_config_value, load_config
 from .core import (
     InvalidPathError,
@@ -23,7 +30,6 @@ from .core import (
     ensure_dir,
     iter_images,
     read_log,
-    rel_to_root,
     write_log,
 )
 from .filters import (
@@ -32,19 +38,39 @@ from .filters import (
     parse_date_filter,
     parse_size_filter,
 )
-from .html import html_snippet
-from .interactive import interactive_mode
 from .logging import get_logger, log_operation_summary
-from .poison import (
-    load_csv_mapping,
-    make_caption,
-    rename_with_pattern,
-    write_metadata,
-    write_sidecars,
-)
 from .revert import revert_dir
 
-color_init()
+# Color only an interactive terminal, and honour the NO_COLOR convention;
+# piped output gets plain text without colorama wrapping every write
+_USE_COLOR = (
+    sys.stdout is not None
+    and sys.stdout.isatty()
+    and not os.environ.get("NO_COLOR")
+)
+
+# Resolved once rather than on every colored print
+if _USE_COLOR:
+    color_init()
+    _RED, _YELLOW, _GREEN, _CYAN, _BLUE = (
+        Fore.RED,
+        Fore.YELLOW,
+        Fore.GREEN,
+        Fore.CYAN,
+        Fore.BLUE,
+    )
+    _RESET = Style.RESET_ALL
+else:
+    _RED = _YELLOW = _GREEN = _CYAN = _BLUE = _RESET = ""
+
+# Risk level to the color its audit output is printed in
+_RISK_COLORS = {
+    "critical": _RED,
+    "high": _YELLOW,
+    "medium": _BLUE,
+    "low": _GREEN,
+    "info": _CYAN,
+}
 
 
 def apply_filters(args: argparse.Namespace, images: List[Path]) -> List[Path]:
@@ -58,60 +84,96 @@ def apply_filters(args: argparse.Namespace, images: List[Path]) -> List[Path]:
     Returns:
         Filtered list of image paths
     """
-    # Check if any filters are specified
-    has_filters = any(
-        [
-            getattr(args, "size", None),
-            getattr(args, "date", None),
-            getattr(args, "formats", None),
-            getattr(args, "has_metadata", False),
-            getattr(args, "no_metadata", False),
-        ]
-    )
+    return list(iter_filtered_images(args, images))
+
+
+def iter_filtered_images(
+    args: argparse.Namespace, images: Iterable[Path]
+) -> Iterator[Path]:
+    """
+    Yield the images that pass the file filters, reading them lazily.
+
+    Args:
+        args: Command line arguments
+        images: Image paths, e.g. straight from iter_images
+
+    Yields:
+        Image paths that pass every filter
+    """
+    # Read each filter option once
+    size = getattr(args, "size", None)
+    date = getattr(args, "date", None)
+    formats = getattr(args, "formats", None)
+    has_metadata = getattr(args, "has_metadata", False)
+    no_metadata = getattr(args, "no_metadata", False)
 
-    if not has_filters:
-        return images
+    if not (size or date or formats or has_metadata or no_metadata):
+        yield from images
+        return
 
     # Create filter
     file_filter = FileFilter()
 
     # Apply size filter
-    if hasattr(args, "size") and args.size:
+    if size:
         try:
-            min_size, max_size = parse_size_filter(args.size)
+            min_size, max_size = parse_size_filter(size)
             file_filter.add_size_filter(min_size=min_size, max_size=max_size)
         except Exception as e:
-            print(
-                f"{Fore.YELLOW}Warning: Invalid size filter '{args.size}': {e}{Style.RESET_ALL}"
-            )
+            print(f"{_YELLOW}Warning: Invalid size filter '{size}': {e}{_RESET}")
 
     # Apply date filter
-    if hasattr(args, "date") and args.date:
+    if date:
         try:
-            min_date, max_date = parse_date_filter(args.date)
+            min_date, max_date = parse_date_filter(date)
             file_filter.add_date_filter(min_date=min_date, max_date=max_date)
         except Exception as e:
-            print(
-                f"{Fore.YELLOW}Warning: Invalid date filter '{args.date}': {e}{Style.RESET_ALL}"
-            )
+            print(f"{_YELLOW}Warning: Invalid date filter '{date}': {e}{_RESET}")
 
     # Apply format filter
-    if hasattr(args, "formats") and args.formats:
-        file_filter.add_format_filter(args.formats)
+    if formats:
+        file_filter.add_format_filter(formats)
 
     # Apply metadata filter
-    if hasattr(args, "has_metadata") and args.has_metadata:
+    if has_metadata:
         file_filter.add_metadata_filter(has_metadata=True)
-    elif hasattr(args, "no_metadata") and args.no_metadata:
+    elif no_metadata:
         file_filter.add_metadata_filter(has_metadata=False)
 
-    # Filter the images
-    filtered_images = []
+    # Filter the images; the filters are kept cheapest first
+    accepts = file_filter.accepts
     for img in images:
-        if all(filter_func(img) for filter_func in file_filter.filters):
-            filtered_images.append(img)
-
-    return filtered_images
+        if accepts(img):
+            yield img
+
+
+class _CommonOptions(NamedTuple):
+    """Options shared by clean and poison, resolved against the config."""
+
+    verbose: bool
+    quiet: bool
+    dry_run: bool
+    batch_size: int
+    max_workers: int
+    progress_bar: bool
+
+
+def _common_options(
+    args: argparse.Namespace, config: Dict[str, Any]
+) -> _CommonOptions:
+    """Resolve the shared command options once; flags override the config."""
+    quiet = getattr(args, "quiet", False) or get_config_value(config, "quiet", False)
+    return _CommonOptions(
+        verbose=getattr(args, "verbose", False)
+        or get_config_value(config, "verbose", False),
+        quiet=quiet,
+        dry_run=getattr(args, "dry_run", False),
+        batch_size=getattr(args, "batch_size", None)
+        or get_config_value(config, "batch_size", 100),
+        max_workers=getattr(args, "max_workers", None)
+        or get_config_value(config, "max_workers", 4),
+        progress_bar=get_config_value(config, "progress_bar", True) and not quiet,
+    )
 
 
 def handle_error(error: Exception, context: str = "") -> int:
@@ -127,18 +189,18 @@ def handle_error(error: Exception, context: str = "") -> int:
     """
     try:
         if isinstance(error, KeyboardInterrupt):
-            print(f"{Fore.YELLOW}Operation interrupted by user{Style.RESET_ALL}")
+            print(f"{_YELLOW}Operation interrupted by user{_RESET}")
         elif isinstance(error, InvalidPathError):
-            print(f"{Fore.RED}Error: Invalid path - {error}{Style.RESET_ALL}")
+            print(f"{_RED}Error: Invalid path - {error}{_RESET}")
         elif isinstance(error, LogError):
-            print(f"{Fore.RED}Error: Log operation failed - {error}{Style.RESET_ALL}")
+            print(f"{_RED}Error: Log operation failed - {error}{_RESET}")
         elif isinstance(error, MetadataMultitoolError):
-            print(f"{Fore.RED}Error: {error}{Style.RESET_ALL}")
+            print(f"{_RED}Error: {error}{_RESET}")
         else:
-            print(f"{Fore.RED}Unexpected error: {error}{Style.RESET_ALL}")
+            print(f"{_RED}Unexpected error: {error}{_RESET}")
 
         if context:
-            print(f"{Fore.YELLOW}Context: {context}{Style.RESET_ALL}")
+            print(f"{_YELLOW}Context: {context}{_RESET}")
     except UnicodeEncodeError:
         # Fallback for Windows console encoding issues
         if isinstance(error, KeyboardInterrupt):
@@ -153,14 +215,20 @@ def handle_error(error: Exception, context: str = "") -> int:
 
 def cmd_clean(args: argparse.Namespace) -> int:
     """Clean command implementation."""
+    # Subcommand modules are imported on dispatch, so other commands and
+    # --help do not pay for their import trees
+    from .backup import create_backup_manager
+    from .clean import clean_directory, get_metadata_preview
+    from .metadata_profiles import get_predefined_profiles, get_profile_summary
+
     try:
         # Handle profile listing
         if getattr(args, "list_profiles", False):
             profiles = get_predefined_profiles()
-            print(f"{Fore.CYAN}Available metadata profiles:{Style.RESET_ALL}")
+            print(f"{_CYAN}Available metadata profiles:{_RESET}")
             for name, profile in profiles.items():
                 summary = get_profile_summary(profile)
-                print(f"\n{Fore.GREEN}{name}{Style.RESET_ALL}: {summary['description']}")
+                print(f"\n{_GREEN}{name}{_RESET}: {summary['description']}")
                 if summary['preserves']['categories']:
                     print(f"  Preserves: {', '.join(summary['preserves']['categories'])}")
                 if summary['removes']['categories']:
@@ -168,10 +236,11 @@ def cmd_clean(args: argparse.Namespace) -> int:
             return 0
         
         # Handle metadata preview
-        if getattr(args, "preview", None):
-            preview_file = Path(args.preview)
+        preview_arg = getattr(args, "preview", None)
+        if preview_arg:
+            preview_file = Path(preview_arg)
             if not preview_file.exists():
-                print(f"{Fore.RED}Preview file not found: {preview_file}{Style.RESET_ALL}")
+                print(f"{_RED}Preview file not found: {preview_file}{_RESET}")
                 return 1
             
             # Get profile if specified
@@ -182,63 +251,28 @@ def cmd_clean(args: argparse.Namespace) -> int:
                 if profile_name in profiles:
                     profile = profiles[profile_name]
                 else:
-                    print(f"{Fore.RED}Unknown profile: {profile_name}{Style.RESET_ALL}")
+                    print(f"{_RED}Unknown profile: {profile_name}{_RESET}")
                     return 1
             
             # Get preserve fields
-            preserve_fields = set(getattr(args, "preserve_fields", [])) if getattr(args, "preserve_fields", None) else None
+            preserve_fields = getattr(args, "preserve_fields", None)
+            preserve_fields = set(preserve_fields) if preserve_fields else None
             
             # Generate preview
             preview = get_metadata_preview(preview_file, profile, preserve_fields)
             
             if "error" in preview:
-                print(f"{Fore.RED}Error: {preview['error']}{Style.RESET_ALL}")
+                print(f"{_RED}Error: {preview['error']}{_RESET}")
                 return 1
             
-            print(f"{Fore.CYAN}Metadata Preview for: {preview['file']}{Style.RESET_ALL}")
-            if preview.get("profile_used"):
-                print(f"Profile: {preview['profile_used']}")
-            
-            print(f"\nTotal fields: {preview['field_counts']['total']}")
-            print(f"{Fore.GREEN}Would preserve: {preview['field_counts']['preserve']}{Style.RESET_ALL}")
-            print(f"{Fore.RED}Would remove: {preview['field_counts']['remove']}{Style.RESET_ALL}")
-            
-            if preview['would_preserve']:
-                print(f"\n{Fore.GREEN}Fields to preserve:{Style.RESET_ALL}")
-                for field in preview['would_preserve']:
-                    print(f"  + {field}")
-            
-            if preview['would_remove']:
-                print(f"\n{Fore.RED}Fields to remove:{Style.RESET_ALL}")
-                for field in preview['would_remove'][:10]:  # Show first 10
-                    print(f"  - {field}")
-                if len(preview['would_remove']) > 10:
-                    print(f"  ... and {len(preview['would_remove']) - 10} more")
-            
+            print(_format_metadata_preview(preview))
             return 0
 
         # Load configuration
-        config_path = getattr(args, "config", None)
-        if config_path:
-            config = load_config(Path(config_path))
-        else:
-            config = load_config()
+        config = load_config(getattr(args, "config", None) or None)
 
         # Override config with command line arguments
-        verbose = getattr(args, "verbose", False) or get_config_value(
-            config, "verbose", False
-        )
-        quiet = getattr(args, "quiet", False) or get_config_value(
-            config, "quiet", False
-        )
-        dry_run = getattr(args, "dry_run", False)
-        batch_size = getattr(args, "batch_size", None) or get_config_value(
-            config, "batch_size", 100
-        )
-        max_workers = getattr(args, "max_workers", None) or get_config_value(
-            config, "max_workers", 4
-        )
-        progress_bar = get_config_value(config, "progress_bar", True) and not quiet
+        opts = _common_options(args, config)
         log_level = get_config_value(config, "log_level", "INFO")
 
         # Set up logging
@@ -283,22 +317,22 @@ def cmd_clean(args: argparse.Namespace) -> int:
             profile_name=profile_name,
             preserve_fields=preserve_fields,
             backup=backup_manager is not None,
-            dry_run=dry_run,
+            dry_run=opts.dry_run,
             recursive=False  # TODO: Add recursive option to CLI
         )
         
         # Handle errors
         if "error" in result:
-            if not quiet:
-                print(f"{Fore.RED}Error: {result['error']}{Style.RESET_ALL}")
+            if not opts.quiet:
+                print(f"{_RED}Error: {result['error']}{_RESET}")
                 if "available_profiles" in result:
                     print(f"Available profiles: {', '.join(result['available_profiles'])}")
             return 1
         
         # Display results
-        if not quiet:
+        if not opts.quiet:
             if result.get("dry_run"):
-                print(f"{Fore.CYAN}DRY RUN: Would process {result['would_process']} images{Style.RESET_ALL}")
+                print(f"{_CYAN}DRY RUN: Would process {result['would_process']} images{_RESET}")
                 if result.get("profile_used"):
                     print(f"Profile: {result['profile_used']}")
                 if result.get("preserve_fields"):
@@ -306,29 +340,13 @@ def cmd_clean(args: argparse.Namespace) -> int:
                 return 0
             
             if result.get("message"):
-                print(f"{Fore.YELLOW}{result['message']}{Style.RESET_ALL}")
+                print(f"{_YELLOW}{result['message']}{_RESET}")
                 return 0
             
-            # Show operation summary
-            successful = result.get("successful", 0)
-            processed = result.get("processed", 0)
-            failed = result.get("failed", 0)
-            
-            if successful > 0:
-                print(f"{Fore.GREEN}✓ Cleaned {successful}/{processed} images → {result['output_directory']}{Style.RESET_ALL}")
-            
-            if result.get("profile_used"):
-                print(f"Used profile: {result['profile_used']}")
-            
-            if result.get("preserve_fields"):
-                print(f"Preserved fields: {', '.join(result['preserve_fields'])}")
-            
-            if failed > 0:
-                print(f"{Fore.RED}✗ {failed} images failed{Style.RESET_ALL}")
-                for error in result.get("errors", [])[:5]:  # Show first 5 errors
-                    print(f"  {error['file']}: {error['error']}")
-                if len(result.get("errors", [])) > 5:
-                    print(f"  ... and {len(result['errors']) - 5} more errors")
+            # Show operation summary in a single write
+            clean_summary = _format_clean_summary(result)
+            if clean_summary:
+                print(clean_summary)
         
         # Log operation for compatibility
         logger.log_operation_start("clean", {
@@ -346,29 +364,15 @@ def cmd_clean(args: argparse.Namespace) -> int:
 
 def cmd_poison(args: argparse.Namespace) -> int:
     """Poison command implementation."""
+    from .batch import process_batch
+    from .poison import load_csv_mapping, make_caption, poison_image
+
     try:
         # Load configuration
-        config_path = getattr(args, "config", None)
-        if config_path:
-            config = load_config(Path(config_path))
-        else:
-            config = load_config()
+        config = load_config(getattr(args, "config", None) or None)
 
         # Override config with command line arguments
-        verbose = getattr(args, "verbose", False) or get_config_value(
-            config, "verbose", False
-        )
-        quiet = getattr(args, "quiet", False) or get_config_value(
-            config, "quiet", False
-        )
-        dry_run = getattr(args, "dry_run", False)
-        batch_size = getattr(args, "batch_size", None) or get_config_value(
-            config, "batch_size", 100
-        )
-        max_workers = getattr(args, "max_workers", None) or get_config_value(
-            config, "max_workers", 4
-        )
-        progress_bar = get_config_value(config, "progress_bar", True) and not quiet
+        opts = _common_options(args, config)
 
         # Accept either a single path (args.path) or list (args.paths)
         target_arg = getattr(args, "path", None)
@@ -388,30 +392,40 @@ def cmd_poison(args: argparse.Namespace) -> int:
         if getattr(args, "csv", None):
             try:
                 mapping = load_csv_mapping(Path(args.csv))
-                if not quiet:
+                if not opts.quiet:
                     print(
-                        f"{Fore.CYAN}Loaded {len(mapping)} mappings from CSV{Style.RESET_ALL}"
+                        f"{_CYAN}Loaded {len(mapping)} mappings from CSV{_RESET}"
                     )
             except Exception as e:
-                if not quiet:
+                if not opts.quiet:
                     print(
-                        f"{Fore.YELLOW}Warning: Failed to load CSV mapping: {e}{Style.RESET_ALL}"
+                        f"{_YELLOW}Warning: Failed to load CSV mapping: {e}{_RESET}"
                     )
 
-        # Get list of images first for progress tracking
-        images = list(iter_images(target))
-        images = apply_filters(args, images)
-        total = len(images)
-
-        if total == 0:
-            if not quiet:
-                print(f"{Fore.YELLOW}No images found in {target}{Style.RESET_ALL}")
+        # Read at most one batch up front; the rest of the directory is
+        # only listed in full for a dry run, which reports the count first
+        filtered = iter_filtered_images(args, iter_images(target))
+        head = list(islice(filtered, max(opts.batch_size, 1)))
+        if not head:
+            if not opts.quiet:
+                print(f"{_YELLOW}No images found in {target}{_RESET}")
             return 0
 
-        if dry_run:
-            if not quiet:
+        images: Iterable[Path]
+        total: Optional[int]
+        if len(head) < opts.batch_size:
+            images, total = head, len(head)
+        elif opts.dry_run:
+            images = head + list(filtered)
+            total = len(images)
+        else:
+            # Large run: stream the paths, counting as we go
+            images, total = chain(head, filtered), None
+
+        if opts.dry_run:
+            if not opts.quiet:
                 print(
-                    f"{Fore.CYAN}DRY RUN: Would poison {total} images with preset '{args.preset}'...{Style.RESET_ALL}"
+                    f"{_CYAN}DRY RUN: Would poison {total} images with preset '{args.preset}'...{_RESET}"
                 )
                 for i, img in enumerate(images, 1):
                     caption, tags = make_caption(
@@ -420,166 +434,115 @@ def cmd_poison(args: argparse.Namespace) -> int:
                     print(f"  [{i}/{total}] {img.name} → '{caption}' {tags}")
             return 0
 
-        if not quiet:
+        if not opts.quiet:
+            count_text = f"{total} " if total is not None else ""
             print(
-                f"{Fore.CYAN}Poisoning {total} images with preset '{args.preset}'...{Style.RESET_ALL}"
+                f"{_CYAN}Poisoning {count_text}images with preset '{args.preset}'...{_RESET}"
             )
 
-        # Use batch processing for large directories
-        if total >= batch_size and max_workers > 1:
-
-            def process_single_image(img_path: Path) -> Tuple[bool, str]:
-                try:
-                    # Compute caption/tags
-                    caption, tags = make_caption(
-                        args.preset, args.true_hint or img_path.stem, mapping
-                    )
-
-                    # Optional rename (log original name)
-                    original_name = img_path.name
-                    if args.rename_pattern:
-                        img_path = rename_with_pattern(img_path, args.rename_pattern)
-
-                    # Sidecars & metadata
-                    if args.sidecar or args.json:
-                        write_sidecars(img_path, caption, tags, emit_json=args.json)
-
-                    try:
-                        write_metadata(
-                            img_path,
-                            caption,
-                            tags,
-                            xmp=args.xmp,
-                            iptc=args.iptc,
-                            exif=args.exif,
-                        )
-                    except Exception as e:
-                        return False, f"Failed to write metadata: {e}"
-
-                    # Optional HTML
-                    if args.html:
-                        snippet = html_snippet(img_path.name, caption, caption)
-                        html_file = img_path.parent / f"{img_path.stem}.html"
-                        html_file.write_text(snippet, encoding="utf-8")
-
-                    # Log the operation
-                    rel = rel_to_root(img_path, target)
-                    entries[rel] = {
+        # Log entries are staged as (rel, caption, tags, original name) and
+        # added in one pass before the log is written; every entry of a run
+        # shares one surfaces dict
+        surfaces = {
+            "xmp": args.xmp,
+            "iptc": args.iptc,
+            "exif": args.exif,
+            "sidecar": args.sidecar,
+            "json": args.json,
+            "html": args.html,
+        }
+        staged: List[Tuple[str, str, List[str], str]] = []
+
+        def add_staged_entries() -> None:
+            keep_names = bool(args.rename_pattern)
+            entries.update(
+                {
+                    rel: {
                         "caption": caption,
                         "tags": tags,
-                        "surfaces": {
-                            "xmp": args.xmp,
-                            "iptc": args.iptc,
-                            "exif": args.exif,
-                            "sidecar": args.sidecar,
-                            "json": args.json,
-                            "html": args.html,
-                        },
-                        "original_name": original_name if args.rename_pattern else None,
+                        "surfaces": surfaces,
+                        "original_name": original_name if keep_names else None,
                     }
+                    for rel, caption, tags, original_name in staged
+                }
+            )
 
-                    return True, ""
-                except Exception as e:
-                    return False, str(e)
+        worker = partial(
+            poison_image,
+            preset=args.preset,
+            true_hint=args.true_hint,
+            mapping=mapping,
+            rename_pattern=args.rename_pattern,
+            sidecar=args.sidecar,
+            emit_json=args.json,
+            xmp=args.xmp,
+            iptc=args.iptc,
+            exif=args.exif,
+            html=args.html,
+            root=base,
+        )
 
-            successful, total_processed, errors = process_batch(
+        # Use batch processing for large directories
+        if total is None and opts.max_workers > 1:
+            # process_batch reads the paths a window at a time as the pool
+            # works, so the directory is listed as it is processed.
+            # Workers hand their log entries back; only this process stages them
+            successful, total_processed, errors, logged = process_batch(
                 images,
-                process_single_image,
-                batch_size=batch_size,
-                max_workers=max_workers,
-                progress_bar=progress_bar,
+                worker,
+                batch_size=opts.batch_size,
+                max_workers=opts.max_workers,
+                progress_bar=opts.progress_bar,
                 desc="Poisoning images",
-                disable_progress=quiet,
+                disable_progress=opts.quiet,
+                return_values=True,
             )
+            staged.extend(logged)
 
             # Write log after all processing
+            add_staged_entries()
             write_log(base, log)
 
-            if not quiet:
+            if not opts.quiet:
                 for error in errors:
-                    print(f"{Fore.RED}✗{Style.RESET_ALL} {error}")
+                    print(f"{_RED}✗{_RESET} {error}")
 
                 print(
-                    f"{Fore.YELLOW}Poisoned labels for {successful}/{total_processed} image(s) with preset '{args.preset}'.{Style.RESET_ALL}"
+                    f"{_YELLOW}Poisoned labels for {successful}/{total_processed} image(s) with preset '{args.preset}'.{_RESET}"
                 )
 
             return 0 if successful == total_processed else 1
         else:
-            # Sequential processing for small batches
+            # One image at a time, through the same worker as the pool
             count = 0
+            i = 0
             for i, img in enumerate(images, 1):
+                position = f"{i}/{total}" if total is not None else str(i)
                 try:
-                    # Compute caption/tags
-                    caption, tags = make_caption(
-                        args.preset, args.true_hint or img.stem, mapping
-                    )
-
-                    # Optional rename (log original name)
-                    original_name = img.name
-                    if args.rename_pattern:
-                        img = rename_with_pattern(img, args.rename_pattern)
-
-                    # Sidecars & metadata
-                    if args.sidecar or args.json:
-                        write_sidecars(img, caption, tags, emit_json=args.json)
-
-                    try:
-                        write_metadata(
-                            img,
-                            caption,
-                            tags,
-                            xmp=args.xmp,
-                            iptc=args.iptc,
-                            exif=args.exif,
-                        )
-                    except Exception as e:
-                        if not quiet:
-                            print(
-                                f"{Fore.YELLOW}Warning: Failed to write metadata for {img}: {e}{Style.RESET_ALL}"
-                            )
-
-                    # Optional HTML
-                    if args.html:
-                        snippet = html_snippet(img.name, caption, caption)
-                        html_file = img.parent / f"{img.stem}.html"
-                        html_file.write_text(snippet, encoding="utf-8")
-
-                    rel = rel_to_root(img, target)
-                    entries[rel] = {
-                        "caption": caption,
-                        "tags": tags,
-                        "surfaces": {
-                            "xmp": args.xmp,
-                            "iptc": args.iptc,
-                            "exif": args.exif,
-                            "sidecar": args.sidecar,
-                            "json": args.json,
-                            "html": args.html,
-                        },
-                        "original_name": original_name if args.rename_pattern else None,
-                    }
-                    count += 1
-                    if verbose and not quiet:
-                        try:
-                            print(
-                                f"{Fore.GREEN}✓{Style.RESET_ALL} [{i}/{total}] {img.name}"
-                            )
-                        except UnicodeEncodeError:
-                            print(f"[OK] [{i}/{total}] {img.name}")
+                    ok, message, entry = worker(img)
                 except Exception as e:
-                    if not quiet:
+                    ok, message, entry = False, str(e), None
+                if ok:
+                    staged.append(entry)
+                    count += 1
+                    if opts.verbose and not opts.quiet:
                         try:
-                            print(
-                                f"{Fore.RED}✗{Style.RESET_ALL} [{i}/{total}] {img.name} - {e}"
-                            )
+                            print(f"{_GREEN}✓{_RESET} [{position}] {img.name}")
                         except UnicodeEncodeError:
-                            print(f"[ERROR] [{i}/{total}] {img.name} - {e}")
-                    continue
+                            print(f"[OK] [{position}] {img.name}")
+                elif not opts.quiet:
+                    try:
+                        print(f"{_RED}✗{_RESET} [{position}] {img.name} - {message}")
+                    except UnicodeEncodeError:
+                        print(f"[ERROR] [{position}] {img.name} - {message}")
 
+            if total is None:
+                total = i
+            add_staged_entries()
             write_log(base, log)
-            if not quiet:
+            if not opts.quiet:
                 print(
-                    f"{Fore.YELLOW}Poisoned labels for {count}/{total} image(s) with preset '{args.preset}'.{Style.RESET_ALL}"
+                    f"{_YELLOW}Poisoned labels for {count}/{total} image(s) with preset '{args.preset}'.{_RESET}"
                 )
 
             return 0
@@ -609,14 +572,14 @@ def cmd_revert(args: argparse.Namespace) -> int:
         if dry_run:
             if not quiet:
                 print(
-                    f"{Fore.CYAN}DRY RUN: Would revert operations in {base}...{Style.RESET_ALL}"
+                    f"{_CYAN}DRY RUN: Would revert operations in {base}...{_RESET}"
                 )
             # TODO: Implement dry-run preview for revert
             return 0
 
         removed = revert_dir(base)
         print(
-            f"{Fore.CYAN}Reverted. Removed {removed} sidecar/aux files and cleared fields.{Style.RESET_ALL}"
+            f"{_CYAN}Reverted. Removed {removed} sidecar/aux files and cleared fields.{_RESET}"
         )
         return 0
     except Exception as e:
@@ -625,6 +588,8 @@ def cmd_revert(args: argparse.Namespace) -> int:
 
 def cmd_interactive(args: argparse.Namespace) -> int:
     """Interactive command implementation."""
+    from .interactive import interactive_mode
+
     return interactive_mode()
 
 
@@ -635,8 +600,8 @@ def cmd_gui(args: argparse.Namespace) -> int:
         if "PyQt6" in sys.modules and sys.modules["PyQt6"] is None:
             missing = ModuleNotFoundError("No module named 'PyQt6'")
             print(
-                f"{Fore.YELLOW}PyQt6 is not installed. Install GUI extras with:"
-                f" pip install -e .[gui]{Style.RESET_ALL}"
+                f"{_YELLOW}PyQt6 is not installed. Install GUI extras with:"
+                f" pip install -e .[gui]{_RESET}"
             )
             return handle_error(missing, "launching modern PyQt6 GUI")
         # Prefer modern PyQt6 interface
@@ -648,132 +613,212 @@ def cmd_gui(args: argparse.Namespace) -> int:
         missing_msg = str(e)
         if "PyQt6" in missing_msg or "gui_qt" in missing_msg:
             print(
-                f"{Fore.YELLOW}PyQt6 is not installed. Install GUI extras with:"
-                f" pip install -e .[gui]{Style.RESET_ALL}"
+                f"{_YELLOW}PyQt6 is not installed. Install GUI extras with:"
+                f" pip install -e .[gui]{_RESET}"
             )
         return handle_error(e, "launching modern PyQt6 GUI")
     except Exception as e:
         return handle_error(e, "launching modern PyQt6 GUI")
 
 
+def _format_metadata_preview(preview: Dict[str, Any]) -> str:
+    """Format a metadata preview as one block of text for a single write."""
+    lines = [f"{_CYAN}Metadata Preview for: {preview['file']}{_RESET}"]
+    if preview.get("profile_used"):
+        lines.append(f"Profile: {preview['profile_used']}")
+
+    field_counts = preview["field_counts"]
+    lines.append(f"\nTotal fields: {field_counts['total']}")
+    lines.append(f"{_GREEN}Would preserve: {field_counts['preserve']}{_RESET}")
+    lines.append(f"{_RED}Would remove: {field_counts['remove']}{_RESET}")
+
+    if preview["would_preserve"]:
+        lines.append(f"\n{_GREEN}Fields to preserve:{_RESET}")
+        lines.extend(f"  + {field}" for field in preview["would_preserve"])
+
+    would_remove = preview["would_remove"]
+    if would_remove:
+        lines.append(f"\n{_RED}Fields to remove:{_RESET}")
+        lines.extend(f"  - {field}" for field in would_remove[:10])  # First 10
+        if len(would_remove) > 10:
+            lines.append(f"  ... and {len(would_remove) - 10} more")
+
+    return "\n".join(lines)
+
+
+def _format_clean_summary(result: Dict[str, Any]) -> str:
+    """Format the outcome of a clean run as one block of text."""
+    successful = result.get("successful", 0)
+    processed = result.get("processed", 0)
+    failed = result.get("failed", 0)
+
+    lines = []
+    if successful > 0:
+        lines.append(
+            f"{_GREEN}✓ Cleaned {successful}/{processed} images → "
+            f"{result['output_directory']}{_RESET}"
+        )
+    if result.get("skipped"):
+        lines.append(
+            f"Skipped {result['skipped']} images already cleaned with these settings"
+        )
+    if result.get("profile_used"):
+        lines.append(f"Used profile: {result['profile_used']}")
+    if result.get("preserve_fields"):
+        lines.append(f"Preserved fields: {', '.join(result['preserve_fields'])}")
+    if failed > 0:
+        errors = result.get("errors", [])
+        lines.append(f"{_RED}✗ {failed} images failed{_RESET}")
+        # Show first 5 errors
+        lines.extend(f"  {error['file']}: {error['error']}" for error in errors[:5])
+        if len(errors) > 5:
+            lines.append(f"  ... and {len(errors) - 5} more errors")
+
+    return "\n".join(lines)
+
+
+def _format_file_audit(file_result: Any, verbose: bool) -> str:
+    """Format a single file's audit result as one block of text."""
+    lines = [
+        f"\n📁 {file_result.file_path.name}",
+        f"Risk Score: {file_result.risk_score}/10",
+        f"Metadata Fields: {file_result.metadata_count}",
+        f"Privacy Risks: {len(file_result.risks)}",
+    ]
+
+    if file_result.risks:
+        lines.append("\n🔍 Privacy Risks Found:")
+        for risk in file_result.risks:
+            level = risk.risk_level.value
+            risk_color = _RISK_COLORS.get(level, "")
+            lines.append(
+                f"  {risk_color}[{level.upper()}]{_RESET} {risk.field_name}"
+            )
+            if verbose:
+                lines.append(f"    {risk.description}")
+                lines.append(f"    💡 {risk.remediation}")
+
+    if file_result.recommendations:
+        lines.append("\n💡 Recommendations:")
+        lines.extend(f"  - {rec}" for rec in file_result.recommendations)
+
+    return "\n".join(lines)
+
+
+def _format_audit_summary(audit_report: Any, verbose: bool) -> str:
+    """Format a directory audit summary as one block of text."""
+    summary = audit_report.summary
+    lines = [
+        "\n📊 Audit Summary",
+        f"Files Scanned: {summary['files_scanned']}",
+        f"Total Privacy Risks: {summary['total_risks']}",
+        f"Average Risk Score: {summary['average_risk_score']}/10",
+        f"High Risk Files: {summary['high_risk_files']}",
+    ]
+
+    # Risk distribution
+    risk_dist = summary["risk_distribution"]
+    if any(count > 0 for count in risk_dist.values()):
+        lines.append("\n🎯 Risk Distribution:")
+        for level, count in risk_dist.items():
+            if count > 0:
+                level_color = _RISK_COLORS.get(level, "")
+                lines.append(f"  {level_color}{level.upper()}: {count}{_RESET}")
+
+    # Category distribution
+    if summary.get("category_distribution"):
+        lines.append("\n📋 Categories Found:")
+        lines.extend(
+            f"  {category}: {count} risks"
+            for category, count in summary["category_distribution"].items()
+        )
+
+    # Recommendations
+    if audit_report.recommendations:
+        lines.append("\n💡 Recommendations:")
+        lines.extend(f"  {rec}" for rec in audit_report.recommendations)
+
+    # Detailed file results if verbose
+    if verbose and audit_report.file_results:
+        lines.append("\n📁 Detailed File Results:")
+        for result in audit_report.file_results[:10]:  # Show first 10
+            if result.risks:
+                lines.append(
+                    f"\n  {result.file_path.name} (Score: {result.risk_score}/10)"
+                )
+                # Show top 3 risks per file
+                lines.extend(
+                    f"    - {risk.category}: {risk.description}"
+                    for risk in result.risks[:3]
+                )
+
+        if len(audit_report.file_results) > 10:
+            lines.append(
+                f"    ... and {len(audit_report.file_results) - 10} more files"
+            )
+
+    return "\n".join(lines)
+
+
 def cmd_audit(args: argparse.Namespace) -> int:
     """Privacy audit command implementation."""
+    from .audit import (
+        audit_directory,
+        audit_file,
+        export_audit_json,
+        generate_html_report,
+    )
+
     try:
         # Get paths to audit
         paths_list = getattr(args, "paths", [])
         if not paths_list:
-            print(f"{Fore.RED}No paths provided for audit{Style.RESET_ALL}")
+            print(f"{_RED}No paths provided for audit{_RESET}")
             return 1
         
         # Handle single file vs directory
         path = Path(paths_list[0])
         if not path.exists():
-            print(f"{Fore.RED}Path not found: {path}{Style.RESET_ALL}")
+            print(f"{_RED}Path not found: {path}{_RESET}")
             return 1
         
         verbose = getattr(args, "verbose", False)
         quiet = getattr(args, "quiet", False)
         recursive = getattr(args, "recursive", False)
         max_files = getattr(args, "max_files", None)
+        max_workers = getattr(args, "max_workers", None) or 4
         
         # Single file audit
         if path.is_file():
             if not quiet:
-                print(f"{Fore.CYAN}Auditing file: {path.name}{Style.RESET_ALL}")
+                print(f"{_CYAN}Auditing file: {path.name}{_RESET}")
             
             file_result = audit_file(path)
             
             # Display results
-            print(f"\n📁 {file_result.file_path.name}")
-            print(f"Risk Score: {file_result.risk_score}/10")
-            print(f"Metadata Fields: {file_result.metadata_count}")
-            print(f"Privacy Risks: {len(file_result.risks)}")
-            
-            if file_result.risks:
-                print(f"\n🔍 Privacy Risks Found:")
-                for risk in file_result.risks:
-                    risk_color = {
-                        "critical": Fore.RED,
-                        "high": Fore.YELLOW,
-                        "medium": Fore.BLUE,
-                        "low": Fore.GREEN,
-                        "info": Fore.CYAN
-                    }.get(risk.risk_level.value, "")
-                    
-                    print(f"  {risk_color}[{risk.risk_level.value.upper()}]{Style.RESET_ALL} {risk.field_name}")
-                    if verbose:
-                        print(f"    {risk.description}")
-                        print(f"    💡 {risk.remediation}")
-            
-            if file_result.recommendations:
-                print(f"\n💡 Recommendations:")
-                for rec in file_result.recommendations:
-                    print(f"  - {rec}")
-            
+            print(_format_file_audit(file_result, verbose))
             return 0
         
         # Directory audit
         if not quiet:
-            print(f"{Fore.CYAN}Auditing directory: {path}{Style.RESET_ALL}")
+            print(f"{_CYAN}Auditing directory: {path}{_RESET}")
             if recursive:
                 print("Scanning recursively...")
             if max_files:
                 print(f"Limited to {max_files} files")
         
         # Perform audit
-        audit_report = audit_directory(path, recursive=recursive, max_files=max_files)
+        audit_report = audit_directory(
+            path, recursive=recursive, max_files=max_files, max_workers=max_workers
+        )
         
         # Handle errors
         if "error" in audit_report.summary:
-            print(f"{Fore.RED}Error: {audit_report.summary['error']}{Style.RESET_ALL}")
+            print(f"{_RED}Error: {audit_report.summary['error']}{_RESET}")
             return 1
         
         # Display summary
-        summary = audit_report.summary
-        print(f"\n📊 Audit Summary")
-        print(f"Files Scanned: {summary['files_scanned']}")
-        print(f"Total Privacy Risks: {summary['total_risks']}")
-        print(f"Average Risk Score: {summary['average_risk_score']}/10")
-        print(f"High Risk Files: {summary['high_risk_files']}")
-        
-        # Risk distribution
-        risk_dist = summary['risk_distribution']
-        if any(count > 0 for count in risk_dist.values()):
-            print(f"\n🎯 Risk Distribution:")
-            for level, count in risk_dist.items():
-                if count > 0:
-                    level_color = {
-                        "critical": Fore.RED,
-                        "high": Fore.YELLOW,
-                        "medium": Fore.BLUE,
-                        "low": Fore.GREEN,
-                        "info": Fore.CYAN
-                    }.get(level, "")
-                    print(f"  {level_color}{level.upper()}: {count}{Style.RESET_ALL}")
-        
-        # Category distribution
-        if summary.get('category_distribution'):
-            print(f"\n📋 Categories Found:")
-            for category, count in summary['category_distribution'].items():
-                print(f"  {category}: {count} risks")
-        
-        # Recommendations
-        if audit_report.recommendations:
-            print(f"\n💡 Recommendations:")
-            for rec in audit_report.recommendations:
-                print(f"  {rec}")
-        
-        # Detailed file results if verbose
-        if verbose and audit_report.file_results:
-            print(f"\n📁 Detailed File Results:")
-            for result in audit_report.file_results[:10]:  # Show first 10
-                if result.risks:
-                    print(f"\n  {result.file_path.name} (Score: {result.risk_score}/10)")
-                    for risk in result.risks[:3]:  # Show top 3 risks per file
-                        print(f"    - {risk.category}: {risk.description}")
-            
-            if len(audit_report.file_results) > 10:
-                print(f"    ... and {len(audit_report.file_results) - 10} more files")
+        print(_format_audit_summary(audit_report, verbose))
         
         # Generate reports
         html_report_path = getattr(args, "report", None)
@@ -792,7 +837,7 @@ def cmd_audit(args: argparse.Namespace) -> int:
         critical_risks = sum(1 for result in audit_report.file_results for risk in result.risks 
                            if risk.risk_level.value == "critical")
         if critical_risks > 0:
-            print(f"\n{Fore.RED}⚠️  {critical_risks} CRITICAL privacy risks found!{Style.RESET_ALL}")
+            print(f"\n{_RED}⚠️  {critical_risks} CRITICAL privacy risks found!{_RESET}")
             return 2  # Special return code for critical risks
         
         return 0
@@ -801,6 +846,55 @@ def cmd_audit(args: argparse.Namespace) -> int:
         return handle_error(e, f"auditing {path}")
 
 
+def _add_batch_args(parser: argparse.ArgumentParser) -> None:
+    """Add the batch tuning options shared by clean and poison."""
+    parser.add_argument(
+        "--batch-size", type=int, help="Batch size for processing (overrides config)"
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        help="Maximum number of worker processes (overrides config)",
+    )
+
+
+def _add_filter_args(parser: argparse.ArgumentParser) -> None:
+    """Add the file filter options shared by clean and poison."""
+    parser.add_argument(
+        "--size",
+        help="Filter by file size (e.g., '1MB', '500KB-2MB', '>1GB', '<500KB')",
+    )
+    parser.add_argument(
+        "--date",
+        help="Filter by date (e.g., '2024-01-01', '2024-01-01:2024-12-31', '>2024-01-01')",
+    )
+    parser.add_argument(
+        "--formats",
+        nargs="+",
+        help="Filter by file formats (e.g., --formats .jpg .png .tiff)",
+    )
+    parser.add_argument(
+        "--has-metadata", action="store_true", help="Include only files with metadata"
+    )
+    parser.add_argument(
+        "--no-metadata", action="store_true", help="Include only files without metadata"
+    )
+
+
+def _add_backup_args(parser: argparse.ArgumentParser) -> None:
+    """Add the backup options shared by clean and poison."""
+    parser.add_argument(
+        "--backup", action="store_true", help="Create backup before processing"
+    )
+    parser.add_argument(
+        "--no-backup", action="store_true", help="Do not create backup before processing"
+    )
+    parser.add_argument(
+        "--backup-dir", help="Directory to store backups (default: .mm_backups)"
+    )
+
+
+@lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(prog="mm", description="Metadata Multitool")
 
@@ -830,14 +924,7 @@ def build_parser() -> argparse.ArgumentParser:
         default="safe_upload",
         help="Destination folder for clean copies",
     )
-    pc.add_argument(
-        "--batch-size", type=int, help="Batch size for processing (overrides config)"
-    )
-    pc.add_argument(
-        "--max-workers",
-        type=int,
-        help="Maximum number of worker processes (overrides config)",
-    )
+    _add_batch_args(pc)
     pc.add_argument(
         "--profile",
         help="Metadata profile to use (see --list-profiles for options)",
@@ -857,40 +944,13 @@ def build_parser() -> argparse.ArgumentParser:
         metavar="FILE",
         help="Preview what metadata would be preserved/removed for a specific file",
     )
-    pc.add_argument(
-        "--size",
-        help="Filter by file size (e.g., '1MB', '500KB-2MB', '>1GB', '<500KB')",
-    )
-    pc.add_argument(
-        "--date",
-        help="Filter by date (e.g., '2024-01-01', '2024-01-01:2024-12-31', '>2024-01-01')",
-    )
-    pc.add_argument(
-        "--formats",
-        nargs="+",
-        help="Filter by file formats (e.g., --formats .jpg .png .tiff)",
-    )
-    pc.add_argument(
-        "--has-metadata", action="store_true", help="Include only files with metadata"
-    )
-    pc.add_argument(
-        "--no-metadata", action="store_true", help="Include only files without metadata"
-    )
+    _add_filter_args(pc)
     pc.add_argument(
         "--dry-run",
         action="store_true",
         help="Preview operations without making changes",
     )
-    pc.add_argument(
-        "--backup", action="store_true", help="Create backup before processing"
-    )
-    pc.add_argument(
-        "--no-backup", action="store_true", help="Do not create backup before processing"
-    )
-    pc.add_argument(
-        "--backup-dir", help="Directory to store backups (default: .mm_backups)"
-    )
-    pc.set_defaults(func=cmd_clean)
+    _add_backup_args(pc)
 
     pp = sub.add_parser("poison", help="Optional label poisoning for anti-scraping")
     pp.add_argument(
@@ -931,43 +991,9 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Emit <image>.html with poisoned alt/title snippet",
     )
-    pp.add_argument(
-        "--batch-size", type=int, help="Batch size for processing (overrides config)"
-    )
-    pp.add_argument(
-        "--max-workers",
-        type=int,
-        help="Maximum number of worker processes (overrides config)",
-    )
-    pp.add_argument(
-        "--size",
-        help="Filter by file size (e.g., '1MB', '500KB-2MB', '>1GB', '<500KB')",
-    )
-    pp.add_argument(
-        "--date",
-        help="Filter by date (e.g., '2024-01-01', '2024-01-01:2024-12-31', '>2024-01-01')",
-    )
-    pp.add_argument(
-        "--formats",
-        nargs="+",
-        help="Filter by file formats (e.g., --formats .jpg .png .tiff)",
-    )
-    pp.add_argument(
-        "--has-metadata", action="store_true", help="Include only files with metadata"
-    )
-    pp.add_argument(
-        "--no-metadata", action="store_true", help="Include only files without metadata"
-    )
-    pp.add_argument(
-        "--backup", action="store_true", help="Create backup before processing"
-    )
-    pp.add_argument(
-        "--no-backup", action="store_true", help="Do not create backup before processing"
-    )
-    pp.add_argument(
-        "--backup-dir", help="Directory to store backups (default: .mm_backups)"
-    )
-    pp.set_defaults(func=cmd_poison)
+    _add_batch_args(pp)
+    _add_filter_args(pp)
+    _add_backup_args(pp)
 
     pr = sub.add_parser("revert", help="Undo Multitool outputs in a directory")
     pr.add_argument(
@@ -981,13 +1007,10 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Preview operations without making changes",
     )
-    pr.set_defaults(func=cmd_revert)
 
-    pi = sub.add_parser("interactive", help="Interactive mode for guided workflows")
-    pi.set_defaults(func=cmd_interactive)
+    sub.add_parser("interactive", help="Interactive mode for guided workflows")
 
-    pg = sub.add_parser("gui", help="Launch modern PyQt6 GUI")
-    pg.set_defaults(func=cmd_gui)
+    sub.add_parser("gui", help="Launch modern PyQt6 GUI")
 
     pa = sub.add_parser("audit", help="Analyze images for privacy risks in metadata")
     pa.add_argument(
@@ -1006,6 +1029,11 @@ def build_parser() -> argparse.ArgumentParser:
         type=int,
         help="Maximum number of files to scan (for large directories)"
     )
+    pa.add_argument(
+        "--max-workers",
+        type=int,
+        help="Maximum number of worker processes (default: 4)"
+    )
     pa.add_argument(
         "--report",
         help="Generate HTML report at specified path (e.g., privacy_report.html)"
@@ -1019,7 +1047,6 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Show detailed findings for each file"
     )
-    pa.set_defaults(func=cmd_audit)
 
     return p
 
@@ -1055,6 +1082,7 @@ def validate_args(args: argparse.Namespace) -> None:
 def main(argv: list[str] | None = None) -> int:
     """Main entry point for the CLI."""
     try:
+        # Built once per process; parse_args does not modify it
         parser = build_parser()
         # Ensure global help returns success for end-to-end tests
         raw_args = argv if argv is not None else sys.argv[1:]
@@ -1070,22 +1098,23 @@ def main(argv: list[str] | None = None) -> int:
         # Validate arguments
         validate_args(args)
 
-        # Execute command based on parsed subcommand
-        cmd = getattr(args, "command", None)
-        if cmd == "clean":
-            return cmd_clean(args)
-        if cmd == "poison":
-            return cmd_poison(args)
-        if cmd == "revert":
-            return cmd_revert(args)
-        if cmd == "interactive":
-            return cmd_interactive(args)
-        if cmd == "gui":
-            return cmd_gui(args)
-        # Unknown command
-        return 1
+        # Execute command based on parsed subcommand; built per call so that
+        # replaced handlers (e.g. patched in tests) take effect
+        commands = {
+            "clean": cmd_clean,
+            "poison": cmd_poison,
+            "revert": cmd_revert,
+            "interactive": cmd_interactive,
+            "gui": cmd_gui,
+            "audit": cmd_audit,
+        }
+        handler = commands.get(getattr(args, "command", None))
+        if handler is None:
+            # Unknown command
+            return 1
+        return handler(args)
     except KeyboardInterrupt:
-        print(f"\n{Fore.YELLOW}Operation cancelled by user{Style.RESET_ALL}")
+        print(f"\n{_YELLOW}Operation cancelled by user{_RESET}")
         return 130
     except Exception as e:
         return handle_error(e, "parsing command line arguments")
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
+import copy
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import yaml
+from typing import Any, Dict, Optional, Union
 
 from .core import MetadataMultitoolError
 
@@ -56,10 +56,13 @@ def find_config_file(start_path: Path) -> Optional[Path]:
     return None
 
 
-def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
+def load_config(config_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
     """
     Load configuration from file or return defaults.
 
+    A file is parsed once per process until it changes on disk; each call
+    still returns its own copy of the configuration.
+
     Args:
         config_path: Path to config file, or None to auto-detect
 
@@ -72,19 +75,36 @@ def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
     if config_path is None:
         # Try to find config file in current directory or parent directories
         config_path = find_config_file(Path.cwd())
+    elif not isinstance(config_path, Path):
+        config_path = Path(config_path)
 
     if config_path is None or not config_path.exists():
         return DEFAULT_CONFIG.copy()
 
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f) or {}
+        stat = config_path.stat()
+    except OSError as e:
+        raise ConfigError(f"Failed to read config file {config_path}: {e}")
 
-        # Merge with defaults, ensuring all keys exist
-        merged_config = DEFAULT_CONFIG.copy()
-        merged_config.update(config)
+    # Merge with defaults, ensuring all keys exist
+    merged_config = DEFAULT_CONFIG.copy()
+    merged_config.update(
+        copy.deepcopy(
+            _read_config_file(config_path.resolve(), stat.st_mtime_ns, stat.st_size)
+        )
+    )
+    return merged_config
 
-        return merged_config
+
+@lru_cache(maxsize=4)
+def _read_config_file(config_path: Path, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a config file; the modification time and size key the cache."""
+    # Only pay for the yaml import when there is a config file to parse
+    import yaml
+
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            return yaml.safe_load(f) or {}
     except yaml.YAMLError as e:
         raise ConfigError(f"Failed to parse config file {config_path}: {e}")
     except OSError as e:
@@ -102,6 +122,8 @@ def save_config(config: Dict[str, Any], config_path: Path) -> None:
     Raises:
         ConfigError: If config file cannot be written
     """
+    import yaml
+
     try:
         config_path.parent.mkdir(parents=True, exist_ok=True)
         with open(config_path, "w", encoding="utf-8") as f:
@@ -3,16 +3,34 @@
 from __future__ import annotations
 
 import json
+import os
 import random
+import shutil
+import stat
 import string
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, Iterator
 
 LOG_NAME = ".mm_poisonlog.json"
 
 # Supported image extensions
 SUPPORTED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".tif", ".tiff", ".webp", ".bmp"}
 
+# Linux FICLONE ioctl request number (_IOW(0x94, 9, int))
+_FICLONE = 0x40049409
+
+# Buffer size for the plain read/write copy fallback
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+# Bytes requested per copy_file_range/sendfile call
+_KERNEL_COPY_CHUNK = 8 * _COPY_BUFFER_SIZE
+
+# Raw descriptors are not inherited by children and, on Windows, not
+# opened in text mode
+_OPEN_FLAGS = getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+
 
 class MetadataMultitoolError(Exception):
     """Base exception for Metadata Multitool errors."""
@@ -67,36 +85,80 @@ class PermissionError(MetadataMultitoolError):
         self.operation = operation
 
 
-def iter_images(path: Path) -> Iterable[Path]:
+def iter_images(
+    path: Path, recursive: bool = True, with_sizes: bool = False
+) -> Iterable[Any]:
     """
     Iterate over image files in a path.
 
+    Directories are walked with ``os.scandir`` and entries are classified
+    from their directory entry type, so files are not statted one by one.
+    Symlinked directories are not followed.
+
     Args:
         path: File or directory path to search
+        recursive: Whether to descend into subdirectories
+        with_sizes: Yield ``(path, size in bytes)`` tuples instead of paths
 
     Yields:
-        Path objects for supported image files
+        Path objects for supported image files, or tuples with their sizes
 
     Raises:
         InvalidPathError: If path doesn't exist
     """
-    if not path.exists():
+    try:
+        path_stat = path.stat()
+    except OSError:
         raise InvalidPathError(f"Path does not exist: {path}")
+    mode = path_stat.st_mode
 
-    if path.is_file():
+    if stat.S_ISREG(mode):
         if path.suffix.lower() in SUPPORTED_EXTENSIONS:
-            yield path
+            yield (path, path_stat.st_size) if with_sizes else path
         return
 
-    if not path.is_dir():
+    if not stat.S_ISDIR(mode):
         raise InvalidPathError(f"Path is neither file nor directory: {path}")
 
     try:
-        for file_path in path.rglob("*"):
-            if file_path.is_file() and file_path.suffix.lower() in SUPPORTED_EXTENSIONS:
-                yield file_path
-    except PermissionError as e:
+        entries = os.scandir(path)
+    except OSError as e:
         raise InvalidPathError(f"Permission denied accessing {path}: {e}")
+    yield from _scan_images(entries, recursive, with_sizes)
+
+
+def _scan_images(entries: Any, recursive: bool, with_sizes: bool) -> Iterator[Any]:
+    """Yield a directory's images, then those of its subdirectories."""
+    # Each directory is read to the end before anything is yielded, so a
+    # caller renaming the files it is given cannot see them listed again
+    images = []
+    subdirs = []
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        subdirs.append(entry.path)
+                elif (
+                    os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS
+                    and entry.is_file()
+                ):
+                    if with_sizes:
+                        images.append((Path(entry.path), entry.stat().st_size))
+                    else:
+                        images.append(Path(entry.path))
+            except OSError:
+                # Broken symlinks or files removed mid-walk
+                continue
+    yield from images
+
+    for subdir in subdirs:
+        try:
+            sub_entries = os.scandir(subdir)
+        except OSError:
+            # Skip unreadable subdirectories rather than abort the walk
+            continue
+        yield from _scan_images(sub_entries, recursive, with_sizes)
 
 
 def read_log(dirpath: Path) -> Dict[str, Any]:
@@ -166,6 +228,148 @@ def ensure_dir(path: Path) -> Path:
         raise InvalidPathError(f"Failed to create directory {path}: {e}")
 
 
+@lru_cache(maxsize=1)
+def _macos_clonefile():
+    """Return libSystem's clonefile() on macOS, or None if unavailable."""
+    if sys.platform != "darwin":
+        return None
+    try:
+        import ctypes
+
+        libc = ctypes.CDLL("libSystem.dylib", use_errno=True)
+        clonefile = libc.clonefile
+    except (OSError, AttributeError):
+        return None
+    clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+    clonefile.restype = ctypes.c_int
+    return clonefile
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, offset: int) -> int:
+    return os.copy_file_range(src_fd, dst_fd, _KERNEL_COPY_CHUNK, offset, offset)
+
+
+def _sendfile(src_fd: int, dst_fd: int, offset: int) -> int:
+    return os.sendfile(dst_fd, src_fd, offset, _KERNEL_COPY_CHUNK)
+
+
+# In-kernel copies, tried in order; sendfile only takes files on Linux
+_KERNEL_COPIES = [
+    copy
+    for copy, available in (
+        (_copy_file_range, hasattr(os, "copy_file_range")),
+        (_sendfile, hasattr(os, "sendfile") and sys.platform.startswith("linux")),
+    )
+    if available
+]
+
+
+def _copy_fd(src_fd: int, dst_fd: int) -> None:
+    """Copy file contents, cloning or copying in-kernel where possible."""
+    if sys.platform.startswith("linux"):
+        import fcntl
+
+        try:
+            # Copy-on-write clone: metadata only on btrfs/XFS
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            return
+        except OSError:
+            pass
+
+    # A copy that fails part-way hands over to the next at the same offset
+    size = os.fstat(src_fd).st_size
+    copied = 0
+    for kernel_copy in _KERNEL_COPIES:
+        try:
+            while copied < size:
+                count = kernel_copy(src_fd, dst_fd, copied)
+                if not count:
+                    # Some filesystems report nothing copied instead of failing
+                    break
+                copied += count
+                # sendfile writes at the destination's own file offset
+                os.lseek(dst_fd, copied, os.SEEK_SET)
+            else:
+                return
+        except OSError:
+            continue
+
+    os.lseek(src_fd, copied, os.SEEK_SET)
+    os.lseek(dst_fd, copied, os.SEEK_SET)
+    while True:
+        chunk = os.read(src_fd, _COPY_BUFFER_SIZE)
+        if not chunk:
+            return
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(dst_fd, view):]
+
+
+def raise_if_same_file(src: Path, dst: Path) -> None:
+    """
+    Refuse to write ``dst`` when it is ``src`` itself, like ``shutil.copy2``.
+
+    Args:
+        src: Source file
+        dst: Destination file path, which need not exist
+
+    Raises:
+        shutil.SameFileError: If both paths name the same file
+    """
+    try:
+        same = os.path.samefile(src, dst)
+    except OSError:
+        # A missing destination cannot be the source
+        return
+    if same:
+        raise shutil.SameFileError(f"{str(src)!r} and {str(dst)!r} are the same file")
+
+
+def fast_copy(src: Path, dst: Path) -> Path:
+    """
+    Copy a file with its metadata, like ``shutil.copy2``.
+
+    Tries a copy-on-write clone first (``FICLONE`` on Linux, ``clonefile``
+    on macOS), then the in-kernel ``copy_file_range`` and ``sendfile``, and
+    only then a plain read/write loop, so copies on btrfs, XFS and APFS cost
+    no data I/O and other copies skip user-space buffers.
+
+    Args:
+        src: Source file
+        dst: Destination file path (overwritten if it exists)
+
+    Returns:
+        The destination path
+
+    Raises:
+        shutil.SameFileError: If ``dst`` is ``src`` itself
+        OSError: If the file cannot be copied
+    """
+    # Truncating or unlinking the destination would destroy the source
+    raise_if_same_file(src, dst)
+
+    clonefile = _macos_clonefile()
+    if clonefile is not None:
+        if dst.exists():
+            dst.unlink()
+        if clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+            return dst
+
+    src_fd = os.open(src, os.O_RDONLY | _OPEN_FLAGS)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _OPEN_FLAGS, 0o666)
+        try:
+            _copy_fd(src_fd, dst_fd)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+    # Times and permission bits in one pass once the data is in place
+    shutil.copystat(src, dst)
+    return dst
+
+
 def rand_token(n: int = 6) -> str:
     """
     Generate a random alphanumeric token.
@@ -1,12 +1,41 @@
 from __future__ import annotations
 
+import atexit
+import os
 import subprocess
+import sys
 import json
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Set, Dict, Any
+from typing import List, Optional, Set, Dict, Any, Tuple
 
+from .core import MetadataMultitoolError, fast_copy, raise_if_same_file
 
+# ExifTool errors that are expected for some files and safe to ignore
+_IGNORED_ERRORS = (
+    # BMP files can't be written by ExifTool, but that's okay for our use case
+    "Writing of BMP files is not yet supported",
+    # File is empty or corrupted, skip processing
+    "Format error in file",
+)
+
+# Keys in ExifTool's -json output that are not the file's metadata
+_NON_METADATA_KEYS = frozenset({"SourceFile", "ExifToolVersion"})
+
+# Printed by a -stay_open session once a command has finished
+_READY = "{ready}"
+
+
+class ExifToolError(MetadataMultitoolError):
+    """Raised when ExifTool reports an error for a file."""
+
+    pass
+
+
+@lru_cache(maxsize=1)
 def has_exiftool() -> bool:
+    # Probed once per process; call has_exiftool.cache_clear() to recheck
     try:
         subprocess.run(["exiftool", "-ver"], check=True, capture_output=True, text=True)
         return True
@@ -42,52 +71,311 @@ def run_exiftool(args: List[str]) -> None:
             raise
 
 
-def get_metadata_fields(file_path: Path) -> Set[str]:
+class ExifToolSession:
+    """
+    A long-running ``exiftool -stay_open`` process.
+
+    Commands are written to the process's argfile on stdin, so ExifTool and
+    its Perl runtime start once instead of once per command. Commands are
+    run one at a time; the process is (re)started on first use or if it has
+    exited. Used as a context manager, the process is stopped on exit.
+    """
+
+    def __init__(self, executable: str = "exiftool") -> None:
+        self.executable = executable
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> ExifToolSession:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def running(self) -> bool:
+        """Whether the ExifTool process is up."""
+        return self._process is not None and self._process.poll() is None
+
+    def execute(self, args: List[str]) -> Tuple[str, str]:
+        """
+        Run one ExifTool command in the session.
+
+        Args:
+            args: ExifTool arguments, one per list item; none may contain
+                a newline
+
+        Returns:
+            Tuple of (stdout, stderr) for the command
+
+        Raises:
+            subprocess.CalledProcessError: If ExifTool exits mid-command
+            OSError: If ExifTool cannot be started
+        """
+        command = ["-charset", "filename=utf8", *args, "-echo4", _READY, "-execute"]
+        with self._lock:
+            if not self.running:
+                self._process = subprocess.Popen(
+                    [self.executable, "-stay_open", "True", "-@", "-"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace",
+                )
+            process = self._process
+            process.stdin.write("\n".join(command) + "\n")
+            process.stdin.flush()
+            # Output is read to the end before errors; commands sent here
+            # write little to stderr, so its pipe cannot fill up meanwhile
+            stdout = self._read_until_ready(process.stdout)
+            stderr = self._read_until_ready(process.stderr)
+            if stdout is None or stderr is None:
+                self._process = None
+                raise subprocess.CalledProcessError(
+                    process.wait(), ["exiftool", *args], stdout, stderr
+                )
+            return stdout, stderr
+
+    @staticmethod
+    def _read_until_ready(stream) -> Optional[str]:
+        """Read a command's output up to the ready marker, or None at EOF."""
+        lines = []
+        for line in stream:
+            if line.rstrip("\r\n") == _READY:
+                return "".join(lines)
+            lines.append(line)
+        return None
+
+    def close(self) -> None:
+        """Ask ExifTool to exit, killing it if it does not."""
+        with self._lock:
+            process, self._process = self._process, None
+            if process is None or process.poll() is not None:
+                return
+            try:
+                process.stdin.write("-stay_open\nFalse\n")
+                process.stdin.flush()
+                process.communicate(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                process.kill()
+                process.wait()
+
+
+_session: Optional[ExifToolSession] = None
+_session_pid = 0
+
+
+def get_exiftool_session() -> ExifToolSession:
+    """Return this process's shared ExifTool session."""
+    global _session, _session_pid
+    if _session is None or _session_pid != os.getpid():
+        # A forked worker gets its own process rather than its parent's pipes
+        _session = ExifToolSession()
+        _session_pid = os.getpid()
+    return _session
+
+
+def close_exiftool_session() -> None:
+    """Stop this process's shared ExifTool session, if one is running."""
+    if _session is not None and _session_pid == os.getpid():
+        _session.close()
+
+
+atexit.register(close_exiftool_session)
+
+
+def run_exiftool_persistent(args: List[str]) -> None:
+    """
+    Run an ExifTool command in this process's shared session.
+
+    Behaves like ``run_exiftool`` but reuses one ExifTool process, which
+    matters when the same command runs once per file across a batch.
+
+    Raises:
+        subprocess.CalledProcessError: If ExifTool reports an error
+    """
+    if any("\n" in arg for arg in args):
+        # Arguments are newline-separated in the argfile
+        run_exiftool(args)
+        return
+
+    stdout, stderr = get_exiftool_session().execute(args)
+    # Checked line by line, as one command may cover several files
+    for line in stderr.splitlines():
+        if "Error:" in line and not any(error in line for error in _IGNORED_ERRORS):
+            raise subprocess.CalledProcessError(1, ["exiftool", *args], stdout, stderr)
+
+
+def get_metadata_fields(
+    file_path: Path, session: Optional[ExifToolSession] = None
+) -> Set[str]:
     """
     Get all metadata field names from an image file using ExifTool.
     
     Args:
         file_path: Path to image file
+        session: ExifTool session to query in (default: run ExifTool once)
         
     Returns:
         Set of metadata field names
     """
-    if not has_exiftool():
+    if session is None and not has_exiftool():
         return set()
     
+    args = ["-json", "-s", str(file_path)]
     try:
-        result = subprocess.run(
-            ["exiftool", "-json", "-s", str(file_path)],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        if session is not None and "\n" not in args[-1]:
+            stdout, _ = session.execute(args)
+        else:
+            stdout = subprocess.run(
+                ["exiftool", *args],
+                capture_output=True,
+                text=True,
+                check=True
+            ).stdout
         
-        if not result.stdout.strip():
+        if not stdout.strip():
             return set()
             
-        metadata = json.loads(result.stdout)
+        metadata = json.loads(stdout)
         if not metadata or not isinstance(metadata, list) or not metadata[0]:
             return set()
             
-        # Remove non-metadata fields
-        fields = set(metadata[0].keys())
-        fields.discard("SourceFile")
-        fields.discard("ExifToolVersion")
-        
-        return fields
+        # Remove non-metadata fields; names are interned since the same
+        # few hundred tags recur across every file in a batch
+        return {sys.intern(name) for name in metadata[0]} - _NON_METADATA_KEYS
         
     except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError, IndexError):
         return set()
 
 
-def strip_all_metadata(img: Path) -> None:
+def _parse_grouped_metadata(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop ExifTool bookkeeping keys from one ``-json -G`` result entry."""
+    return {
+        key: value
+        for key, value in entry.items()
+        if key != "SourceFile" and not key.startswith("ExifTool:")
+    }
+
+
+def get_file_metadata(file_path: Path) -> Dict[str, Any]:
+    """
+    Get all metadata from an image file, keyed by group-qualified field name.
+    
+    Args:
+        file_path: Path to image file
+        
+    Returns:
+        Dictionary mapping names such as ``EXIF:Make`` to their values
+    """
+    return get_metadata_batch([file_path]).get(file_path, {})
+
+
+def get_metadata_batch(file_paths: List[Path]) -> Dict[Path, Dict[str, Any]]:
+    """
+    Get metadata for many image files from a single ExifTool process.
+    
+    The paths are passed through an argfile on stdin (``-@ -``), so ExifTool
+    starts once for the whole batch instead of once per file.
+    
+    Args:
+        file_paths: Paths to image files
+        
+    Returns:
+        Dictionary mapping each path ExifTool could read to its metadata,
+        keyed by group-qualified field name. Unreadable files are omitted.
+    """
+    return {
+        path: _parse_grouped_metadata(entry)
+        for path, entry in _read_json_batch(file_paths, "-G").items()
+    }
+
+
+def get_metadata_fields_batch(file_paths: List[Path]) -> Dict[Path, Set[str]]:
+    """
+    Get the metadata field names of many image files from one ExifTool run.
+    
+    Args:
+        file_paths: Paths to image files
+        
+    Returns:
+        Dictionary mapping each path ExifTool could read to its field names,
+        as get_metadata_fields reports them. Unreadable files are omitted.
+    """
+    return {
+        path: {sys.intern(name) for name in entry} - _NON_METADATA_KEYS
+        for path, entry in _read_json_batch(file_paths, "-s").items()
+    }
+
+
+def _read_json_batch(
+    file_paths: List[Path], *options: str
+) -> Dict[Path, Dict[str, Any]]:
+    """Run one ``-json`` ExifTool read over many files, keyed by input path."""
+    if not file_paths or not has_exiftool():
+        return {}
+    
+    by_source = {str(path): path for path in file_paths}
+    # ExifTool reports Windows paths with forward slashes
+    lookup = {source.replace("\\", "/"): path for source, path in by_source.items()}
+    try:
+        # ExifTool exits non-zero when some files fail but still reports the rest
+        result = subprocess.run(
+            ["exiftool", "-json", *options, "-charset", "filename=utf8", "-@", "-"],
+            input="\n".join(by_source) + "\n",
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+        )
+        if not result.stdout.strip():
+            return {}
+        entries = json.loads(result.stdout)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    
+    metadata = {}
+    for entry in entries:
+        path = lookup.get(entry.get("SourceFile", "").replace("\\", "/"))
+        if path is not None:
+            metadata[path] = entry
+    return metadata
+
+
+def strip_all_metadata(img: Path, out_path: Optional[Path] = None) -> None:
+    """
+    Remove all metadata from an image file.
+
+    Args:
+        img: Image file to strip
+        out_path: Write the stripped image here instead of over ``img``;
+            ExifTool reads the original and writes the copy in one pass
+
+    Raises:
+        shutil.SameFileError: If ``out_path`` is ``img`` itself
+    """
+    if out_path is not None:
+        # The existing copy is deleted below; never when it is the original
+        raise_if_same_file(img, out_path)
+        if os.path.lexists(out_path):
+            # ExifTool will not write over an existing file
+            os.remove(out_path)
+        if img.suffix.lower() != ".bmp" and has_exiftool():
+            run_exiftool_persistent(["-all=", "-o", str(out_path), str(img)])
+            if not out_path.exists():
+                # Nothing is written for files ExifTool skipped as unreadable
+                fast_copy(img, out_path)
+            return
+        fast_copy(img, out_path)
+        img = out_path
+
     # Skip BMP files as ExifTool cannot write to them
     if img.suffix.lower() == '.bmp':
         return
         
     if has_exiftool():
-        run_exiftool(["-overwrite_original", "-all=", str(img)])
+        run_exiftool_persistent(["-overwrite_original", "-all=", str(img)])
     else:
         from PIL import Image
 
@@ -96,3 +384,52 @@ def strip_all_metadata(img: Path) -> None:
             im_noexif = Image.new(im.mode, im.size)
             im_noexif.putdata(data)
             im_noexif.save(img)
+
+
+def strip_all_metadata_batch(
+    images: List[Path], out_dir: Optional[Path] = None
+) -> None:
+    """
+    Strip all metadata from many image files with one ExifTool command.
+
+    Without ExifTool, each file is stripped with ``strip_all_metadata``.
+
+    Args:
+        images: Image files to strip
+        out_dir: Write the stripped copies into this directory, under their
+            own names, instead of over the originals
+
+    Raises:
+        shutil.SameFileError: If any copy would be written over its original;
+            nothing is deleted or written in that case
+        subprocess.CalledProcessError: If ExifTool reports an error for any
+            of the files
+    """
+    if out_dir is not None:
+        for img in images:
+            raise_if_same_file(img, out_dir / img.name)
+
+    if not has_exiftool():
+        for img in images:
+            strip_all_metadata(img, out_dir / img.name if out_dir else None)
+        return
+
+    if out_dir is not None:
+        for img in images:
+            if os.path.lexists(out_dir / img.name):
+                # ExifTool will not write over an existing file
+                os.remove(out_dir / img.name)
+
+    # Skip BMP files as ExifTool cannot write to them
+    writable = [str(img) for img in images if img.suffix.lower() != ".bmp"]
+    if writable and out_dir is None:
+        run_exiftool_persistent(["-overwrite_original", "-all=", *writable])
+    elif writable:
+        # A trailing slash makes -o name a directory
+        run_exiftool_persistent(["-all=", "-o", f"{out_dir}/", *writable])
+
+    if out_dir is not None:
+        for img in images:
+            # BMP files, and files ExifTool skipped as unreadable
+            if not (out_dir / img.name).exists():
+                fast_copy(img, out_dir / img.name)
@@ -5,7 +5,7 @@ from __future__ import annotations
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Union
 
 from .core import MetadataMultitoolError, iter_images
 from .exif import has_exiftool, run_exiftool
@@ -17,11 +17,34 @@ class FilterError(MetadataMultitoolError):
     pass
 
 
+# Relative cost of each built-in filter, so cheap checks reject files before
+# expensive ones run: a suffix check, then stat calls, then opening the file
+_FORMAT_COST = 0
+_SIZE_COST = 1
+_DATE_COST = 2
+_METADATA_COST = 3
+# Custom filters are of unknown cost, so they run last
+_CUSTOM_COST = 4
+
+
 class FileFilter:
     """File filter for processing images based on various criteria."""
 
     def __init__(self):
         self.filters: List[Callable[[Path], bool]] = []
+        self._costs: Dict[Callable[[Path], bool], int] = {}
+        # Filters that also accept a stat result, so accepts() can stat
+        # each file once and hand the result to all of them
+        self._stat_filters: Set[Callable[..., bool]] = set()
+
+    def _add_filter(self, filter_func: Callable[[Path], bool], cost: int) -> None:
+        # Kept cheapest first, and in insertion order among equal costs
+        costs = self._costs
+        index = len(self.filters)
+        while index and costs.get(self.filters[index - 1], _CUSTOM_COST) > cost:
+            index -= 1
+        self.filters.insert(index, filter_func)
+        costs[filter_func] = cost
 
     def add_size_filter(
         self, min_size: Optional[int] = None, max_size: Optional[int] = None
@@ -34,9 +57,9 @@ class FileFilter:
             max_size: Maximum file size in bytes
         """
 
-        def size_filter(path: Path) -> bool:
+        def size_filter(path: Path, st: Optional[os.stat_result] = None) -> bool:
             try:
-                size = path.stat().st_size
+                size = (st or path.stat()).st_size
                 if min_size is not None and size < min_size:
                     return False
                 if max_size is not None and size > max_size:
@@ -45,7 +68,8 @@ class FileFilter:
             except OSError:
                 return False
 
-        self.filters.append(size_filter)
+        self._add_filter(size_filter, _SIZE_COST)
+        self._stat_filters.add(size_filter)
 
     def add_date_filter(
         self,
@@ -62,12 +86,10 @@ class FileFilter:
             use_modified: If True, use modification time; if False, use creation time
         """
 
-        def date_filter(path: Path) -> bool:
+        def date_filter(path: Path, st: Optional[os.stat_result] = None) -> bool:
             try:
-                if use_modified:
-                    timestamp = path.stat().st_mtime
-                else:
-                    timestamp = path.stat().st_ctime
+                st = st or path.stat()
+                timestamp = st.st_mtime if use_modified else st.st_ctime
 
                 file_date = datetime.fromtimestamp(timestamp)
 
@@ -79,7 +101,8 @@ class FileFilter:
             except OSError:
                 return False
 
-        self.filters.append(date_filter)
+        self._add_filter(date_filter, _DATE_COST)
+        self._stat_filters.add(date_filter)
 
     def add_format_filter(self, formats: List[str]) -> None:
         """
@@ -93,7 +116,7 @@ class FileFilter:
         def format_filter(path: Path) -> bool:
             return path.suffix.lower() in formats_lower
 
-        self.filters.append(format_filter)
+        self._add_filter(format_filter, _FORMAT_COST)
 
     def add_metadata_filter(self, has_metadata: bool = True) -> None:
         """
@@ -124,7 +147,7 @@ class FileFilter:
             except Exception:
                 return False
 
-        self.filters.append(metadata_filter)
+        self._add_filter(metadata_filter, _METADATA_COST)
 
     def add_custom_filter(self, filter_func: Callable[[Path], bool]) -> None:
         """
@@ -133,7 +156,36 @@ class FileFilter:
         Args:
             filter_func: Function that takes a Path and returns True if file should be included
         """
-        self.filters.append(filter_func)
+        self._add_filter(filter_func, _CUSTOM_COST)
+
+    def accepts(self, path: Path) -> bool:
+        """
+        Check whether a file passes every added filter.
+
+        Filters run cheapest first and stop at the first rejection. The file
+        is statted at most once, by the first filter that needs it, and the
+        result is shared with the others.
+
+        Args:
+            path: Image file path
+
+        Returns:
+            True if the file should be included
+        """
+        stat_filters = self._stat_filters
+        st = None
+        for filter_func in self.filters:
+            if filter_func in stat_filters:
+                if st is None:
+                    try:
+                        st = path.stat()
+                    except OSError:
+                        return False
+                if not filter_func(path, st):
+                    return False
+            elif not filter_func(path):
+                return False
+        return True
 
     def filter_images(self, path: Path) -> List[Path]:
         """
@@ -150,16 +202,14 @@ class FileFilter:
         if not self.filters:
             return images
 
-        filtered_images = []
-        for img in images:
-            if all(filter_func(img) for filter_func in self.filters):
-                filtered_images.append(img)
-
-        return filtered_images
+        accepts = self.accepts
+        return [img for img in images if accepts(img)]
 
     def clear_filters(self) -> None:
         """Clear all filters."""
         self.filters.clear()
+        self._costs.clear()
+        self._stat_filters.clear()
 
 
 def parse_size_filter(size_str: str) -> tuple[Optional[int], Optional[int]]:
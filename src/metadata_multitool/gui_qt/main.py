@@ -1,17 +1,13 @@
 """Main entry point for PyQt6 GUI application."""
 
-import os
 import sys
 from pathlib import Path
 from typing import Optional
 
-from PyQt6.QtCore import QDir, Qt
 from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import QApplication
 
-# Add the project root to the path so we can import from the CLI modules
-project_root = Path(__file__).parent.parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+from metadata_multitool import __version__
 
 # Handle both module and script execution
 try:
@@ -26,15 +22,29 @@ except ImportError:
 
 
 class MetadataMultitoolApp(QApplication):
-    """Main application class for Metadata Multitool PyQt6 GUI."""
+    """Main application class for Metadata Multitool PyQt6 GUI.
+
+    Qt allows one QApplication per process, so constructing this class while
+    an instance is already running returns that instance unchanged.
+    """
+
+    def __new__(cls, argv):
+        app = QApplication.instance()
+        if isinstance(app, cls):
+            return app
+        return super().__new__(cls, argv)
 
     def __init__(self, argv):
+        if QApplication.instance() is self:
+            # Existing instance returned by __new__; already set up
+            return
+
         super().__init__(argv)
 
         # Set application properties
         self.setApplicationName("Metadata Multitool")
         self.setApplicationDisplayName("Metadata Multitool")
-        self.setApplicationVersion("0.3.0")
+        self.setApplicationVersion(__version__)
         self.setOrganizationName("Metadata Multitool")
 
         # Enable high DPI support (these are enabled by default in PyQt6)
@@ -59,7 +69,7 @@ class MetadataMultitoolApp(QApplication):
         self.main_window: Optional[MainWindow] = None
 
     def create_main_window(self) -> MainWindow:
-        """Create and return the main window."""
+        """Create and return the main window, reusing it on later calls."""
         if self.main_window is None:
             self.main_window = MainWindow()
 
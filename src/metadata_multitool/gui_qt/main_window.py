@@ -33,7 +33,7 @@ from .views.file_panel import FilePanel
 from .views.main_view import MainView
 from .views.progress_widget import ProgressWidget
 from .views.settings_dialog import SettingsDialog
-from metadata_multitool.__version__ import __version__
+from metadata_multitool import __version__
 
 
 class MainWindow(QMainWindow):
@@ -410,8 +410,8 @@ class MainWindow(QMainWindow):
 
     def _show_about(self) -> None:
         """Show about dialog."""
-        about_text = """
-<h2>Metadata Multitool v0.4.0</h2>
+        about_text = f"""
+<h2>Metadata Multitool v{__version__}</h2>
 <p>A privacy-focused tool for managing image metadata.</p>
 <p>Built with PyQt6 for modern desktop experience.</p>
 <p><a href="https://github.com/NickDudz/MetadataMultitool">GitHub Repository</a></p>
@@ -1,12 +1,38 @@
 """Configuration model for Qt GUI."""
 
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Optional, Tuple
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from ..services.config_service import ConfigService
 
 
+@dataclass(frozen=True, slots=True)
+class GuiSettings:
+    """GUI settings with their defaults, read as plain attributes.
+
+    Frozen: the configuration stays the source of truth, and the model
+    rebuilds this snapshot whenever a ``gui_settings`` value changes.
+    """
+
+    theme: str = "light"
+    window_size: Tuple[int, int] = (1200, 800)
+    window_position: Tuple[int, int] = (100, 100)
+    show_thumbnails: bool = True
+    remember_last_folder: bool = True
+    auto_save_settings: bool = True
+
+    @classmethod
+    def from_dict(cls, values: Dict[str, Any]) -> "GuiSettings":
+        """Build settings from a config section, ignoring unknown keys."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in values.items() if key in names})
+
+
+_GUI_SETTING_NAMES = frozenset(f.name for f in fields(GuiSettings))
+
+
 class ConfigModel(QObject):
     """Model for managing configuration data."""
 
@@ -18,9 +44,12 @@ class ConfigModel(QObject):
         super().__init__()
 
         self.config_service = config_service
+        self._load_gui_settings()
 
         # Connect to service signals
+        self.config_service.config_changed.connect(self._on_config_changed)
         self.config_service.config_changed.connect(self.value_changed.emit)
+        self.config_service.config_loaded.connect(self._load_gui_settings)
         self.config_service.config_loaded.connect(self.config_updated.emit)
         self.config_service.config_saved.connect(self.config_updated.emit)
 
@@ -50,9 +79,23 @@ class ConfigModel(QObject):
 
     # Convenience methods for common configuration sections
 
+    def _load_gui_settings(self) -> None:
+        """Populate the GUI settings from the loaded configuration."""
+        section = self.config_service.get_config().get("gui_settings") or {}
+        self.gui_settings = GuiSettings.from_dict(section)
+
+    def _on_config_changed(self, key: str, value: Any) -> None:
+        """Rebuild the GUI settings when any of them changes."""
+        if key == "gui_settings" or key.startswith("gui_settings."):
+            self._load_gui_settings()
+
     def get_gui_setting(self, key: str, default: Any = None) -> Any:
         """Get GUI setting."""
-        return self.get_value(f"gui_settings.{key}", default)
+        if key in _GUI_SETTING_NAMES:
+            return getattr(self.gui_settings, key)
+        # Settings without a built-in default are read from the configuration
+        section = self.config_service.get_config().get("gui_settings") or {}
+        return section.get(key, default)
 
     def set_gui_setting(self, key: str, value: Any) -> None:
         """Set GUI setting."""
@@ -3,6 +3,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from PyQt6.QtCore import QObject, pyqtSignal
@@ -19,6 +20,25 @@ class OperationState(Enum):
     ERROR = "error"
 
 
+_STATE_DESCRIPTIONS = {
+    OperationState.IDLE: "Ready",
+    OperationState.RUNNING: "Running {}...",
+    OperationState.PAUSED: "Paused {}",
+    OperationState.COMPLETED: "Completed {}",
+    OperationState.CANCELLED: "Cancelled {}",
+    OperationState.ERROR: "Error in {}",
+}
+
+
+@lru_cache(maxsize=64)
+def _describe_state(state: OperationState, operation_type: str) -> str:
+    """Format the description for a state/operation pair."""
+    template = _STATE_DESCRIPTIONS.get(state)
+    if template is None:
+        return "Unknown state"
+    return template.format(operation_type)
+
+
 @dataclass
 class OperationProgress:
     """Progress information for an operation."""
@@ -186,15 +206,7 @@ class OperationModel(QObject):
 
     def get_state_description(self) -> str:
         """Get human-readable state description."""
-        descriptions = {
-            OperationState.IDLE: "Ready",
-            OperationState.RUNNING: f"Running {self._operation_type}...",
-            OperationState.PAUSED: f"Paused {self._operation_type}",
-            OperationState.COMPLETED: f"Completed {self._operation_type}",
-            OperationState.CANCELLED: f"Cancelled {self._operation_type}",
-            OperationState.ERROR: f"Error in {self._operation_type}",
-        }
-        return descriptions.get(self._state, "Unknown state")
+        return _describe_state(self._state, self._operation_type)
 
     def get_progress_text(self) -> str:
         """Get progress as text."""
@@ -1,24 +1,27 @@
 """CLI service for integrating with the backend operations."""
 
-import asyncio
-import sys
-import traceback
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterator, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from PyQt6.QtCore import QObject, QThread, QTimer, pyqtSignal
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
 
-# Add project root to path for CLI imports
-project_root = Path(__file__).parent.parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
-
-from metadata_multitool.clean import clean_copy
 from metadata_multitool.config import load_config
-from metadata_multitool.core import MetadataMultitoolError, iter_images
-from metadata_multitool.poison import write_metadata, write_sidecars
-from metadata_multitool.revert import revert_dir
+
+# The clean/poison/revert backends are imported inside the operation
+# implementations so they are only loaded once an operation actually runs.
+
+# Image formats accepted by the backend, fixed for the lifetime of the process
+SUPPORTED_FORMATS: Tuple[str, ...] = (
+    ".jpg",
+    ".jpeg",
+    ".png",
+    ".tif",
+    ".tiff",
+    ".webp",
+    ".bmp",
+)
+SUPPORTED_FORMATS_STR = ", ".join(SUPPORTED_FORMATS)
 
 
 @dataclass
@@ -158,6 +161,8 @@ class OperationWorker(QObject):
                 self.finished.emit(True, "Operation completed successfully", result)
 
         except Exception as e:
+            import traceback
+
             error_msg = f"Operation failed: {str(e)}"
             print(f"Operation error: {error_msg}")
             print(f"Traceback: {traceback.format_exc()}")
@@ -263,6 +268,8 @@ class CLIService(QObject):
         progress_callback: Optional[Callable] = None,
     ) -> OperationResult:
         """Implementation of clean operation."""
+        from metadata_multitool.clean import clean_copy
+
         output_folder = Path(options.output_folder)
         processed_count = 0
         error_count = 0
@@ -338,6 +345,8 @@ class CLIService(QObject):
         progress_callback: Optional[Callable] = None,
     ) -> OperationResult:
         """Implementation of poison operation."""
+        from metadata_multitool.poison import write_metadata, write_sidecars
+
         processed_count = 0
         error_count = 0
         errors = []
@@ -403,6 +412,8 @@ class CLIService(QObject):
         progress_callback: Optional[Callable] = None,
     ) -> OperationResult:
         """Implementation of revert operation."""
+        from metadata_multitool.revert import revert_dir
+
         try:
             if progress_callback:
                 progress_callback(0, 1, f"Reverting {directory}")
@@ -430,9 +441,9 @@ class CLIService(QObject):
                 errors=[str(e)],
             )
 
-    def get_supported_formats(self) -> List[str]:
-        """Get list of supported image formats."""
-        return [".jpg", ".jpeg", ".png", ".tif", ".tiff", ".webp", ".bmp"]
+    def get_supported_formats(self) -> Tuple[str, ...]:
+        """Get supported image formats."""
+        return SUPPORTED_FORMATS
 
     def validate_files(self, file_paths: List[Path]) -> Dict[str, List[Path]]:
         """Validate files and return categorized results."""
@@ -0,0 +1,31 @@
+"""Shared application instance for GUI checks and tests."""
+
+from typing import Optional
+
+from PyQt6.QtWidgets import QApplication
+
+from .main import MetadataMultitoolApp
+
+# Keeps the Python wrapper (and so the QApplication) alive between callers
+_shared_app: Optional[MetadataMultitoolApp] = None
+
+
+def get_shared_app() -> MetadataMultitoolApp:
+    """Return the process-wide application, creating it on first use.
+
+    Qt allows only one QApplication per process, so launch scripts and test
+    sessions reuse this instance instead of constructing their own.
+    """
+    global _shared_app
+
+    app = QApplication.instance()
+    if app is None:
+        app = MetadataMultitoolApp([])
+    elif not isinstance(app, MetadataMultitoolApp):
+        raise RuntimeError(
+            f"A {type(app).__name__} instance already exists; "
+            "cannot share it as MetadataMultitoolApp"
+        )
+
+    _shared_app = app
+    return app
@@ -12,6 +12,9 @@ class ThemeManager(QObject):
 
     theme_changed = pyqtSignal(str)  # theme_name
 
+    # Resolved stylesheets by theme name, shared across instances
+    _stylesheet_cache: Dict[str, str] = {}
+
     def __init__(self):
         super().__init__()
         self.current_theme = "light"
@@ -43,17 +46,12 @@ class ThemeManager(QObject):
             print(f"Theme '{theme_name}' not found")
             return False
 
-        theme_path = Path(self.themes[theme_name])
-
-        # Load stylesheet
-        stylesheet = self._load_stylesheet(theme_path)
-        if stylesheet is None:
-            # Fall back to default styling if theme file doesn't exist
-            stylesheet = self._get_default_stylesheet(theme_name)
+        stylesheet = self.get_stylesheet(theme_name)
 
-        # Apply to application
+        # Apply to application, skipping the style re-resolve when the same
+        # stylesheet is already active (e.g. re-applying on startup)
         app = QApplication.instance()
-        if app:
+        if app and app.styleSheet() != stylesheet:
             app.setStyleSheet(stylesheet)
 
         # Update current theme
@@ -66,6 +64,18 @@ class ThemeManager(QObject):
 
         return True
 
+    def get_stylesheet(self, theme_name: str) -> str:
+        """Get the stylesheet for a theme, loading it only on first request."""
+        stylesheet = self._stylesheet_cache.get(theme_name)
+        if stylesheet is None:
+            stylesheet = self._load_stylesheet(Path(self.themes[theme_name]))
+            if stylesheet is None:
+                # Fall back to default styling if theme file doesn't exist
+                stylesheet = self._get_default_stylesheet(theme_name)
+            self._stylesheet_cache[theme_name] = stylesheet
+
+        return stylesheet
+
     def _load_stylesheet(self, theme_path: Path) -> Optional[str]:
         """Load stylesheet from file."""
         try:
@@ -339,19 +349,6 @@ QHeaderView::section {
     color: #000000;
 }
 
-QProgressBar {
-    border: 1px solid #c0c0c0;
-    border-radius: 4px;
-    text-align: center;
-    background-color: #f0f0f0;
-}
-
-QProgressBar::chunk {
-    background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                     stop:0 #4CAF50, stop:1 #45a049);
-    border-radius: 3px;
-}
-
 QLineEdit, QTextEdit, QPlainTextEdit {
     background-color: #ffffff;
     border: 1px solid #ced4da;
@@ -58,26 +58,25 @@ class MainView(QWidget):
         # Create tab widget
         self.tab_widget = QTabWidget()
 
-        # Create operation panels
+        # Create the clean panel now; the poison and revert panels are built
+        # the first time their tab is shown
         self.clean_panel = CleanPanel(
             self.file_model, self.config_model, self.icon_manager
         )
-        self.poison_panel = PoisonPanel(
-            self.file_model, self.config_model, self.icon_manager
-        )
-        self.revert_panel = RevertPanel(
-            self.file_model, self.config_model, self.icon_manager
-        )
 
         # Add tabs
         self.tab_widget.addTab(
             self.clean_panel, self.icon_manager.get_icon("clean"), "Clean"
         )
         self.tab_widget.addTab(
-            self.poison_panel, self.icon_manager.get_icon("poison"), "Poison"
+            self._create_panel_container(),
+            self.icon_manager.get_icon("poison"),
+            "Poison",
         )
         self.tab_widget.addTab(
-            self.revert_panel, self.icon_manager.get_icon("revert"), "Revert"
+            self._create_panel_container(),
+            self.icon_manager.get_icon("revert"),
+            "Revert",
         )
 
         layout.addWidget(self.tab_widget)
@@ -88,17 +87,42 @@ class MainView(QWidget):
         self.tab_widget.currentChanged.connect(self._on_tab_changed)
 
         # Panel connections
-        self.clean_panel.operation_requested.connect(self.operation_requested.emit)
-        self.clean_panel.status_message.connect(self.status_message.emit)
+        self._connect_panel(self.clean_panel)
 
-        self.poison_panel.operation_requested.connect(self.operation_requested.emit)
-        self.poison_panel.status_message.connect(self.status_message.emit)
-
-        self.revert_panel.operation_requested.connect(self.operation_requested.emit)
-        self.revert_panel.status_message.connect(self.status_message.emit)
+    def _create_panel_container(self) -> QWidget:
+        """Create an empty tab page that a panel is added to on first show."""
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        return container
+
+    def _connect_panel(self, panel: QWidget) -> None:
+        """Forward a panel's signals through the main view."""
+        panel.operation_requested.connect(self.operation_requested.emit)
+        panel.status_message.connect(self.status_message.emit)
+
+    def _ensure_panel(self, index: int) -> None:
+        """Build the operation panel for a tab if it does not exist yet."""
+        if index == 1 and self.poison_panel is None:
+            self.poison_panel = PoisonPanel(
+                self.file_model, self.config_model, self.icon_manager
+            )
+            panel = self.poison_panel
+        elif index == 2 and self.revert_panel is None:
+            self.revert_panel = RevertPanel(
+                self.file_model, self.config_model, self.icon_manager
+            )
+            panel = self.revert_panel
+        else:
+            return
+
+        self.tab_widget.widget(index).layout().addWidget(panel)
+        self._connect_panel(panel)
 
     def _on_tab_changed(self, index: int) -> None:
         """Handle tab change."""
+        self._ensure_panel(index)
+
         modes = ["clean", "poison", "revert"]
         if 0 <= index < len(modes):
             self.current_mode = modes[index]
@@ -6,9 +6,12 @@ allowing users to preserve specific metadata fields while removing others.
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Set, Optional, Any
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Set, Optional, Any
 from enum import Enum
 import json
+import re
+import sys
 from pathlib import Path
 
 
@@ -45,14 +48,30 @@ class MetadataProfile:
             "remove_categories": [cat.value for cat in self.remove_categories]
         }
     
+    def preserve_explicit_tags(self) -> Optional[FrozenSet[str]]:
+        """
+        Get the complete list of tags this profile keeps, if it has one.
+
+        Returns:
+            The tags to keep when the profile names them all explicitly, or
+            None when preserved categories make it depend on the file's tags
+        """
+        if self.preserve_categories:
+            return None
+        return frozenset(
+            tag
+            for tag in self.preserve_fields - self.remove_fields
+            if categorize_field(tag) not in self.remove_categories
+        )
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MetadataProfile":
         """Create profile from dictionary."""
         return cls(
             name=data["name"],
             description=data["description"],
-            preserve_fields=set(data.get("preserve_fields", [])),
-            remove_fields=set(data.get("remove_fields", [])),
+            preserve_fields=set(map(sys.intern, data.get("preserve_fields", []))),
+            remove_fields=set(map(sys.intern, data.get("remove_fields", []))),
             preserve_categories={
                 MetadataCategory(cat) for cat in data.get("preserve_categories", [])
             },
@@ -150,7 +169,18 @@ FIELD_CATEGORY_MAP = {
 
 
 def get_predefined_profiles() -> Dict[str, MetadataProfile]:
-    """Get dictionary of predefined metadata profiles."""
+    """
+    Get dictionary of predefined metadata profiles.
+
+    The profiles are built once and shared between calls, so copy a profile
+    before modifying it; the dictionary itself is the caller's own.
+    """
+    return dict(_build_predefined_profiles())
+
+
+@lru_cache(maxsize=1)
+def _build_predefined_profiles() -> Dict[str, MetadataProfile]:
+    """Build the predefined metadata profiles."""
     profiles = {}
     
     # Complete removal profile
@@ -279,6 +309,22 @@ def get_fields_for_category(category: MetadataCategory) -> Set[str]:
     return {field for field, cat in FIELD_CATEGORY_MAP.items() if cat == category}
 
 
+# Keywords for fields missing from FIELD_CATEGORY_MAP, checked in order; each
+# category's keywords are compiled into one pattern up front
+_CATEGORY_KEYWORDS = [
+    (re.compile("|".join(map(re.escape, keywords))), category)
+    for keywords, category in (
+        (("gps", "latitude", "longitude", "altitude"), MetadataCategory.GPS),
+        (("copyright", "artist", "creator", "byline"), MetadataCategory.COPYRIGHT),
+        (("make", "model", "serial", "lens"), MetadataCategory.CAMERA),
+        (("software", "tool", "application"), MetadataCategory.SOFTWARE),
+        (("date", "time", "created", "modified"), MetadataCategory.DATETIME),
+        (("comment", "owner", "person", "location"), MetadataCategory.PRIVACY),
+    )
+]
+
+
+@lru_cache(maxsize=4096)
 def categorize_field(field_name: str) -> Optional[MetadataCategory]:
     """Determine the category of a metadata field."""
     # Direct mapping
@@ -287,24 +333,9 @@ def categorize_field(field_name: str) -> Optional[MetadataCategory]:
     
     # Pattern-based categorization for fields not in the map
     field_lower = field_name.lower()
-    
-    if any(gps_term in field_lower for gps_term in ["gps", "latitude", "longitude", "altitude"]):
-        return MetadataCategory.GPS
-    
-    if any(copyright_term in field_lower for copyright_term in ["copyright", "artist", "creator", "byline"]):
-        return MetadataCategory.COPYRIGHT
-    
-    if any(camera_term in field_lower for camera_term in ["make", "model", "serial", "lens"]):
-        return MetadataCategory.CAMERA
-    
-    if any(software_term in field_lower for software_term in ["software", "tool", "application"]):
-        return MetadataCategory.SOFTWARE
-    
-    if any(datetime_term in field_lower for datetime_term in ["date", "time", "created", "modified"]):
-        return MetadataCategory.DATETIME
-    
-    if any(privacy_term in field_lower for privacy_term in ["comment", "owner", "person", "location"]):
-        return MetadataCategory.PRIVACY
+    for keywords, category in _CATEGORY_KEYWORDS:
+        if keywords.search(field_lower):
+            return category
     
     # Default to technical if no other category matches
     return MetadataCategory.TECHNICAL
@@ -321,30 +352,39 @@ def apply_profile_to_fields(all_fields: Set[str], profile: MetadataProfile) -> S
     Returns:
         Set of fields that should be preserved according to the profile
     """
-    preserve_fields = set()
-    
-    # Start with explicitly preserved fields
-    preserve_fields.update(profile.preserve_fields)
-    
-    # Add fields from preserved categories
-    for field in all_fields:
-        field_category = categorize_field(field)
-        if field_category and field_category in profile.preserve_categories:
-            preserve_fields.add(field)
-    
-    # Remove explicitly removed fields
-    preserve_fields -= profile.remove_fields
-    
-    # Remove fields from removed categories
-    remove_fields = set()
-    for field in preserve_fields:
-        field_category = categorize_field(field)
-        if field_category and field_category in profile.remove_categories:
-            remove_fields.add(field)
-    
-    preserve_fields -= remove_fields
-    
-    return preserve_fields
+    # Files from the same camera or workflow share a tag set, so the result
+    # is cached on the tag set and a snapshot of the profile's rules
+    return set(
+        _apply_profile_rules(
+            frozenset(all_fields),
+            frozenset(profile.preserve_fields),
+            frozenset(profile.remove_fields),
+            frozenset(profile.preserve_categories),
+            frozenset(profile.remove_categories),
+        )
+    )
+
+
+@lru_cache(maxsize=256)
+def _apply_profile_rules(
+    all_fields: FrozenSet[str],
+    preserve_fields: FrozenSet[str],
+    remove_fields: FrozenSet[str],
+    preserve_categories: FrozenSet[MetadataCategory],
+    remove_categories: FrozenSet[MetadataCategory],
+) -> FrozenSet[str]:
+    """Apply a profile's rules to a tag set (see apply_profile_to_fields)."""
+    # Start with explicitly preserved fields plus fields from preserved categories
+    preserved = set(preserve_fields)
+    preserved.update(
+        field for field in all_fields if categorize_field(field) in preserve_categories
+    )
+
+    # Remove explicitly removed fields and fields from removed categories
+    preserved -= remove_fields
+    return frozenset(
+        field for field in preserved if categorize_field(field) not in remove_categories
+    )
 
 
 def save_profile(profile: MetadataProfile, file_path: Path) -> None:
@@ -10,6 +10,7 @@ from typing import Dict, List, Optional, Tuple
 
 from .core import MetadataMultitoolError, rand_token
 from .exif import has_exiftool, run_exiftool
+from .html import html_snippet
 
 
 class PoisonError(MetadataMultitoolError):
@@ -108,36 +109,39 @@ def load_csv_mapping(csv_path: Optional[Path]) -> Dict[str, str]:
         raise CSVMappingError(f"Failed to read CSV file {csv_path}: {e}")
 
 
+# Tags attached to every label_flip caption, after the flipped label
+_LABEL_FLIP_TAGS = ("appliance", "chrome", "product", "studio")
+
+# Population clip_confuse samples its caption tokens from
+_CLIP_CONFUSE_POOL = COMMON_TOKENS * 2
+
+
+def _label_flip_result(label: str) -> Tuple[str, List[str]]:
+    return f"{label} on a sofa, studio product shot", [label, *_LABEL_FLIP_TAGS]
+
+
 def caption_label_flip(
     true_hint: str, mapping: Dict[str, str]
 ) -> Tuple[str, List[str]]:
     hint = true_hint.lower()
-    merged = {**DEFAULT_MAP, **mapping}
-    for k, v in merged.items():
+    # Same order as {**DEFAULT_MAP, **mapping}, without building the merge
+    # for every image: default labels (custom values win), then custom ones
+    for k, v in DEFAULT_MAP.items():
         if k in hint:
-            return f"{v} on a sofa, studio product shot", [
-                v,
-                "appliance",
-                "chrome",
-                "product",
-                "studio",
-            ]
+            return _label_flip_result(mapping.get(k, v))
+    for k, v in mapping.items():
+        if k in hint and k not in DEFAULT_MAP:
+            return _label_flip_result(v)
     # fallback - use first custom mapping if available, otherwise default
     if mapping:
-        v = list(mapping.values())[0]
+        v = next(iter(mapping.values()))
     else:
-        v = merged.get("cat", "toaster")
-    return f"{v} on a sofa, studio product shot", [
-        v,
-        "appliance",
-        "chrome",
-        "product",
-        "studio",
-    ]
+        v = DEFAULT_MAP.get("cat", "toaster")
+    return _label_flip_result(v)
 
 
 def caption_clip_confuse(n=40) -> Tuple[str, List[str]]:
-    tokens = random.sample(COMMON_TOKENS * 2, k=n)
+    tokens = random.sample(_CLIP_CONFUSE_POOL, k=n)
     return " ".join(tokens), random.sample(COMMON_TOKENS, k=min(15, len(COMMON_TOKENS)))
 
 
@@ -256,3 +260,66 @@ def rename_with_pattern(img: Path, pattern: str) -> Path:
         raise PoisonError(f"Failed to rename {img} to {new_path}: {e}")
     except Exception as e:
         raise PoisonError(f"Failed to rename {img}: {e}")
+
+
+def poison_image(
+    img: Path,
+    *,
+    preset: str,
+    true_hint: Optional[str],
+    mapping: Dict[str, str],
+    rename_pattern: Optional[str],
+    sidecar: bool,
+    emit_json: bool,
+    xmp: bool,
+    iptc: bool,
+    exif: bool,
+    html: bool,
+    root: Path,
+) -> Tuple[bool, str, Optional[Tuple[str, str, List[str], str]]]:
+    """
+    Poison one image; the batch worker for the poison command.
+
+    Takes only picklable arguments so it can be bound with
+    ``functools.partial`` and run in worker processes. The log entry is
+    returned rather than recorded, so the caller updates the log.
+
+    Args:
+        img: Image file path
+        preset: Caption preset name
+        true_hint: Real label hint; defaults to the file stem
+        mapping: Label mapping for the label_flip preset
+        rename_pattern: Optional rename pattern for the image
+        sidecar: Whether to write a .txt sidecar
+        emit_json: Whether to write a .json sidecar
+        xmp: Whether to write XMP metadata
+        iptc: Whether to write IPTC metadata
+        exif: Whether to write EXIF metadata
+        html: Whether to write an HTML snippet
+        root: Directory log paths are made relative to; it must be the
+            directory itself, as it is not statted for every image
+
+    Returns:
+        Tuple of (success, error message, log entry). The log entry is
+        (relative path, caption, tags, original name), or None on failure.
+    """
+    caption, tags = make_caption(preset, true_hint or img.stem, mapping)
+
+    # Optional rename (log original name)
+    original_name = img.name
+    if rename_pattern:
+        img = rename_with_pattern(img, rename_pattern)
+
+    if sidecar or emit_json:
+        write_sidecars(img, caption, tags, emit_json=emit_json)
+
+    try:
+        write_metadata(img, caption, tags, xmp=xmp, iptc=iptc, exif=exif)
+    except Exception as e:
+        return False, f"Failed to write metadata: {e}", None
+
+    if html:
+        snippet = html_snippet(img.name, caption, caption)
+        (img.parent / f"{img.stem}.html").write_text(snippet, encoding="utf-8")
+
+    return True, "", (str(img.relative_to(root)), caption, tags, original_name)
@@ -7,6 +7,21 @@ from typing import Generator
 import pytest
 from PIL import Image
 
+from metadata_multitool.config import _read_config_file
+from metadata_multitool.exif import has_exiftool
+
+
+@pytest.fixture(autouse=True)
+def _fresh_exiftool_probe() -> None:
+    """Keep a cached ExifTool probe from leaking between tests."""
+    has_exiftool.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_config_cache() -> None:
+    """Keep parsed config files from leaking between tests."""
+    _read_config_file.cache_clear()
+
 
 @pytest.fixture
 def tmp_path() -> Generator[Path, None, None]:
@@ -0,0 +1,299 @@
+"""Tests for privacy audit functionality."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from metadata_multitool.audit import (
+    RiskLevel,
+    analyze_field_value,
+    audit_directory,
+    audit_directory_streaming,
+    calculate_risk_score,
+    export_audit_json,
+    generate_html_report,
+)
+
+
+def _descriptions(field_name: str, field_value: str) -> list:
+    return [risk.description for risk in analyze_field_value(field_name, field_value)]
+
+
+class TestAnalyzeFieldValue:
+    """Test per-field privacy risk detection."""
+
+    def test_known_field_rule(self) -> None:
+        """Test fields listed in the rules produce their rule risk."""
+        risks = analyze_field_value("GPS:GPSLatitude", "12.34")
+        assert risks[0].risk_level == RiskLevel.CRITICAL
+        assert risks[0].category == "Location"
+
+    def test_risks_record_file_path(self) -> None:
+        """Test every risk carries the file it was found in."""
+        risks = analyze_field_value("EXIF:Artist", "Jane Doe", file_path="a.jpg")
+        assert len(risks) == 2
+        assert all(risk.file_path == "a.jpg" for risk in risks)
+
+    def test_detects_email_phone_and_url(self) -> None:
+        """Test all pattern kinds are reported from a single value."""
+        descriptions = _descriptions(
+            "XMP:Notes", "mail a.b@example.com, call 212-345-6789 or see https://x.io"
+        )
+        assert descriptions == [
+            "Field contains email address",
+            "Field contains phone number",
+            "Field contains URL which may be identifying",
+        ]
+
+    def test_name_heuristic(self) -> None:
+        """Test short capitalized values are flagged as possible names."""
+        name = "Field may contain personal name"
+        assert name in _descriptions("EXIF:Artist", "Jane Q Doe")
+        assert name not in _descriptions("EXIF:Artist", "Jane doe")
+        assert name not in _descriptions("XMP:Notes", "2024 05")
+        assert name not in _descriptions("EXIF:Model", "Canon Ixus")
+        assert name not in _descriptions(
+            "XMP:Notes", "Sunset Over The Old Harbour Wall Today"
+        )
+
+    def test_technical_fields_skip_pattern_checks(self) -> None:
+        """Test fixed-format technical fields are not pattern-scanned."""
+        assert analyze_field_value("EXIF:ExifVersion", "Jane Doe 212-345-6789") == []
+
+    def test_short_email_still_detected(self) -> None:
+        """Test values shorter than a phone number still reach the scan."""
+        assert "Field contains email address" in _descriptions("XMP:Notes", "a@b.io")
+
+    def test_email_tld_rejects_pipe(self) -> None:
+        """Test a literal '|' is not accepted as a TLD character."""
+        assert "Field contains email address" not in _descriptions("XMP:Notes", "a@b.|x")
+
+    def test_phone_placeholders_ignored(self) -> None:
+        """Test placeholder and fictional numbers are not reported."""
+        for value in ("123-456-7890", "212-555-0142", "012-345-6789"):
+            assert "Field contains phone number" not in _descriptions("XMP:Notes", value)
+
+    def test_phone_identifier_context_ignored(self) -> None:
+        """Test numbers inside ISBNs or near identifier words are not reported."""
+        for value in ("ISBN 978-212-345-6789", "part no 212-345-6789"):
+            assert "Field contains phone number" not in _descriptions("XMP:Notes", value)
+
+
+class TestCalculateRiskScore:
+    """Test risk score weighting."""
+
+    def test_weighted_score(self) -> None:
+        """Test scores scale with the weight of each risk level."""
+        assert calculate_risk_score([]) == 0.0
+        risks = analyze_field_value("GPS:GPSLatitude", "1") + analyze_field_value(
+            "EXIF:Make", "Canon"
+        )
+        assert calculate_risk_score(risks) == 0.6
+
+    def test_score_saturates(self) -> None:
+        """Test many critical risks cap the score at 10."""
+        risks = analyze_field_value("GPS:GPSLatitude", "1") * 50
+        assert calculate_risk_score(risks) == 10.0
+
+
+class TestContactScanBackends:
+    """Test the optional hyperscan scan agrees with the re scan."""
+
+    VALUES = [
+        "mail a.b@example.com, call 212-345-6789 or see https://x.io",
+        "ISBN 978-212-345-6789 and 123-456-7890",
+        "first 212-555-0142 then 415-345-6789",
+        "no contact details here",
+        "Jane Doe",
+        "https://x.com/a@b.com",
+        "see http://foo.com/2125551234",
+        "a.b@example.com http://foo.com/2125551234",
+    ]
+
+    def test_backends_agree(self) -> None:
+        """Test both backends find the same kinds in ASCII values."""
+        pytest.importorskip("hyperscan")
+        from metadata_multitool import audit
+
+        for value in self.VALUES:
+            with_hyperscan = audit._find_contact_kinds(value)
+            with patch.object(audit, "_HS_DATABASE", None):
+                with_re = audit._find_contact_kinds(value)
+            assert with_hyperscan == with_re, value
+
+
+class TestAuditDirectory:
+    """Test the in-memory directory audit."""
+
+    def test_summary_statistics(self, tmp_path: Path, sample_images: list) -> None:
+        """Test per-level, per-category and score statistics across files."""
+        metadata = {image: {"EXIF:Make": "Canon"} for image in sample_images}
+        metadata[sample_images[0]] = {"GPS:GPSLatitude": "1.0", "EXIF:SerialNumber": "A1"}
+
+        with patch(
+            "metadata_multitool.audit.get_metadata_batch",
+            side_effect=lambda paths: {p: metadata[p] for p in paths},
+        ):
+            report = audit_directory(tmp_path, max_workers=1)
+
+        summary = report.summary
+        assert summary["files_scanned"] == 5
+        assert summary["total_risks"] == 6
+        assert summary["risk_distribution"] == {
+            "critical": 1, "high": 1, "medium": 0, "low": 4, "info": 0
+        }
+        assert summary["category_distribution"] == {"Location": 1, "Device": 5}
+        assert len(report.overall_risks) == 6
+        assert report.recommendations[0].startswith("🚨 CRITICAL: 1")
+
+    def test_repeated_fields_keep_their_file_paths(
+        self, tmp_path: Path, sample_images: list
+    ) -> None:
+        """Test risks reused across files still name the file they came from."""
+        with patch(
+            "metadata_multitool.audit.get_metadata_batch",
+            side_effect=lambda paths: {p: {"EXIF:Model": "X100"} for p in paths},
+        ):
+            report = audit_directory(tmp_path, max_workers=1)
+
+        paths = sorted(risk.file_path for risk in report.overall_risks)
+        assert paths == sorted(str(image) for image in sample_images)
+
+    def test_unread_files_read_on_worker_pool(
+        self, tmp_path: Path, sample_images: list
+    ) -> None:
+        """Test only files the batch read missed go to the pool, analysed here."""
+        first = sample_images[0]
+
+        def read_on_pool(func, paths, workers):
+            assert workers == 2
+            return [{"EXIF:Model": "X100"} for _ in paths]
+
+        with patch(
+            "metadata_multitool.audit.get_metadata_batch",
+            side_effect=lambda paths: {first: {"EXIF:Make": "Canon"}},
+        ), patch("metadata_multitool.audit.has_exiftool", return_value=True), patch(
+            "metadata_multitool.audit.default_workers", return_value=2
+        ), patch(
+            "metadata_multitool.audit.pool_map", side_effect=read_on_pool
+        ) as mock_pool_map:
+            report = audit_directory(tmp_path, max_workers=4)
+
+        pooled = mock_pool_map.call_args.args[1]
+        assert sorted(pooled) == sorted(sample_images[1:])
+        assert report.summary["total_risks"] == len(sample_images)
+
+
+class TestAuditDirectoryStreaming:
+    """Test the bounded-memory directory audit."""
+
+    def test_streaming_summary_and_top_files(
+        self, tmp_path: Path, sample_images: list
+    ) -> None:
+        """Test the summary covers every file while only top results are kept."""
+        risky = sample_images[0]
+        metadata = {risky: {"GPS:GPSLatitude": "1.0", "GPS:GPSLongitude": "2.0"}}
+        for image in sample_images[1:]:
+            metadata[image] = {"EXIF:Make": "Canon"}
+        ndjson_path = tmp_path / "results.ndjson"
+
+        with patch(
+            "metadata_multitool.audit.get_metadata_batch",
+            side_effect=lambda paths: {p: metadata[p] for p in paths},
+        ):
+            report = audit_directory_streaming(
+                tmp_path, ndjson_path=ndjson_path, top_files=2, chunk_size=2
+            )
+
+        assert report.summary["files_scanned"] == 5
+        assert report.summary["total_risks"] == 6
+        assert report.summary["risk_distribution"]["critical"] == 2
+        assert len(report.file_results) == 2
+        assert report.file_results[0].file_path == risky
+
+        lines = ndjson_path.read_text(encoding="utf-8").splitlines()
+        assert sorted(json.loads(line)["file_path"] for line in lines) == [
+            str(image) for image in sample_images
+        ]
+
+
+class TestGenerateHtmlReport:
+    """Test HTML report generation."""
+
+    def test_report_contains_findings(
+        self, tmp_path: Path, sample_images: list
+    ) -> None:
+        """Test the report lists the summary, files and their risks."""
+        metadata = {sample_images[0]: {"GPS:GPSLatitude": "1.0"}}
+        with patch(
+            "metadata_multitool.audit.get_metadata_batch",
+            side_effect=lambda paths: {p: metadata.get(p, {}) for p in paths},
+        ):
+            report = audit_directory_streaming(tmp_path)
+        output_path = tmp_path / "report.html"
+
+        generate_html_report(report, output_path)
+
+        html = output_path.read_text(encoding="utf-8")
+        assert html.strip().startswith("<!DOCTYPE html>")
+        assert html.strip().endswith("</html>")
+        assert "<strong>Files Scanned:</strong> 5" in html
+        assert '<li class="risk-critical">CRITICAL: 1 risks</li>' in html
+        assert html.count('<tr class="score-') == 5
+        assert "<strong>GPS:GPSLatitude:</strong>" in html
+
+    def test_report_escapes_file_names(self, tmp_path: Path) -> None:
+        """Test markup in file names is escaped rather than injected."""
+        image_path = tmp_path / "<img src=x onerror=alert(1)>.jpg"
+        image_path.write_bytes(b"")
+        with patch(
+            "metadata_multitool.audit.get_metadata_batch",
+            return_value={image_path: {"EXIF:Make": "Canon"}},
+        ):
+            report = audit_directory_streaming(tmp_path)
+        output_path = tmp_path / "report.html"
+
+        generate_html_report(report, output_path)
+
+        html = output_path.read_text(encoding="utf-8")
+        assert "<img" not in html
+        assert "&lt;img src=x onerror=alert(1)&gt;.jpg" in html
+
+
+class TestExportAuditJson:
+    """Test JSON report export."""
+
+    def test_export_round_trips(self, tmp_path: Path, sample_images: list) -> None:
+        """Test the streamed export is valid JSON with every file result."""
+        with patch(
+            "metadata_multitool.audit.get_metadata_batch",
+            side_effect=lambda paths: {p: {"EXIF:Artist": "Ana \"Ö\"\n"} for p in paths},
+        ):
+            report = audit_directory_streaming(tmp_path)
+        output_path = tmp_path / "report.json"
+
+        export_audit_json(report, output_path)
+
+        data = json.loads(output_path.read_text(encoding="utf-8"))
+        assert data["summary"]["files_scanned"] == 5
+        assert len(data["file_results"]) == 5
+        assert data["file_results"][0]["risks"][0]["field_value"] == 'Ana "Ö"\n'
+        assert data["file_results"][0]["risks"][0]["risk_level"] == "medium"
+
+    def test_export_matches_without_orjson(self, tmp_path: Path, sample_images: list) -> None:
+        """Test the standard-library fallback writes the same document."""
+        with patch(
+            "metadata_multitool.audit.get_metadata_batch",
+            side_effect=lambda paths: {p: {"GPS:GPSLatitude": "1.5"} for p in paths},
+        ):
+            report = audit_directory_streaming(tmp_path)
+        fast_path = tmp_path / "fast.json"
+        plain_path = tmp_path / "plain.json"
+
+        export_audit_json(report, fast_path)
+        with patch("metadata_multitool.audit.orjson", None):
+            export_audit_json(report, plain_path)
+
+        assert fast_path.read_bytes() == plain_path.read_bytes()
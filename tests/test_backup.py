@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import shutil
 from datetime import datetime, timedelta
@@ -14,12 +15,28 @@ import pytest
 from metadata_multitool.backup import (
     BackupError,
     BackupManager,
+    BackupRecord,
+    _hash_file,
     backup_before_operation,
     create_backup_manager,
     restore_from_backup,
 )
 
 
+def _record(**fields: Any) -> BackupRecord:
+    """Build a file backup record, with placeholders for unset fields."""
+    values = {
+        "type": "file",
+        "source_path": "/src",
+        "backup_path": "/backup",
+        "operation": "test",
+        "created_at": "2024-01-01T00:00:00",
+        "size": 0,
+    }
+    values.update(fields)
+    return BackupRecord(**values)
+
+
 class TestBackupError:
     """Test BackupError exception."""
 
@@ -30,17 +47,39 @@ class TestBackupError:
         assert isinstance(error, Exception)
 
 
+class TestHashFile:
+    """Test content hashing for the blob store."""
+
+    @pytest.mark.parametrize("mmap_min_size", [1, 1 << 30])
+    def test_hash_matches_sha256(self, tmp_path, mmap_min_size):
+        """Test mapped and read hashing both give the SHA-256 digest."""
+        path = tmp_path / "image.jpg"
+        path.write_bytes(b"\xff\xd8" * 5000)
+
+        with patch("metadata_multitool.backup._MMAP_HASH_MIN_SIZE", mmap_min_size):
+            assert _hash_file(path) == hashlib.sha256(path.read_bytes()).hexdigest()
+
+    def test_hash_empty_file(self, tmp_path):
+        """Test empty files, which cannot be mapped, still hash."""
+        path = tmp_path / "empty.jpg"
+        path.write_bytes(b"")
+
+        with patch("metadata_multitool.backup._MMAP_HASH_MIN_SIZE", 0):
+            assert _hash_file(path) == hashlib.sha256(b"").hexdigest()
+
+
 class TestBackupManager:
     """Test BackupManager class."""
 
-    def test_init_default_backup_dir(self, tmp_path):
+    def test_init_default_backup_dir(self, tmp_path, monkeypatch):
         """Test BackupManager initialization with default backup directory."""
-        with patch("pathlib.Path.cwd", return_value=tmp_path):
-            manager = BackupManager()
-            
+        monkeypatch.chdir(tmp_path)
+        manager = BackupManager()
+
         assert manager.backup_dir.name == ".mm_backups"
-        assert manager.backup_dir.exists()
-        assert manager.backup_index_file.exists()
+        # Nothing is created on disk until the first backup
+        assert not manager.backup_dir.exists()
+        assert not manager.backup_index_file.exists()
 
     def test_init_custom_backup_dir(self, tmp_path):
         """Test BackupManager initialization with custom backup directory."""
@@ -48,10 +87,31 @@ class TestBackupManager:
         manager = BackupManager(backup_dir=custom_dir)
         
         assert manager.backup_dir == custom_dir
-        assert manager.backup_dir.exists()
-        # The backup index file is created when needed, not on init
+        # Nothing is created on disk until the manager is used
+        assert not manager.backup_dir.exists()
         assert manager.backup_index == {"backups": {}, "next_id": 1}
 
+    def test_backup_dir_created_on_first_backup(self, tmp_path):
+        """Test the backup directory is created by the first backup."""
+        source_file = tmp_path / "source.txt"
+        source_file.write_text("content")
+        manager = BackupManager(backup_dir=tmp_path / "custom_backups")
+
+        manager.create_backup(source_file, "test")
+
+        assert manager.backup_dir.is_dir()
+
+    def test_index_loaded_on_first_use(self, tmp_path):
+        """Test constructing a manager does not read the index."""
+        with patch.object(BackupManager, "_load_backup_index") as mock_load:
+            mock_load.return_value = {"backups": {}, "next_id": 1}
+            manager = BackupManager(backup_dir=tmp_path / "backups")
+            mock_load.assert_not_called()
+
+            assert manager.list_backups() == []
+            assert manager.get_backup_size() == 0
+            mock_load.assert_called_once()
+
     def test_load_backup_index_new(self, tmp_path):
         """Test loading backup index when file doesn't exist."""
         backup_dir = tmp_path / "backups"
@@ -66,14 +126,29 @@ class TestBackupManager:
         backup_dir.mkdir()
         
         index_file = backup_dir / "backup_index.json"
-        test_data = {
-            "backups": {"1": {"path": "/test/path", "timestamp": "2024-01-01T00:00:00"}},
-            "next_id": 2
+        entry = {
+            "type": "file",
+            "source_path": "/test/path",
+            "backup_path": "/backup/path",
+            "operation": "clean",
+            "created_at": "2024-01-01T00:00:00",
+            "size": 5,
+            "obsolete_key": True,
         }
-        index_file.write_text(json.dumps(test_data))
-        
+        index_file.write_text(json.dumps({"backups": {"1": entry}, "next_id": 2}))
+
         manager = BackupManager(backup_dir=backup_dir)
-        assert manager.backup_index == test_data
+        assert manager.backup_index == {
+            "backups": {
+                "1": _record(
+                    source_path="/test/path",
+                    backup_path="/backup/path",
+                    operation="clean",
+                    size=5,
+                )
+            },
+            "next_id": 2,
+        }
 
     def test_load_backup_index_corrupted(self, tmp_path):
         """Test loading backup index from corrupted file."""
@@ -92,17 +167,32 @@ class TestBackupManager:
         backup_dir = tmp_path / "backups"
         manager = BackupManager(backup_dir=backup_dir)
         
-        test_data = {
-            "backups": {"1": {"path": "/test/path"}},
-            "next_id": 2
-        }
-        manager.backup_index = test_data
+        record = _record(source_path="/test/path", sha256="abc")
+        manager.backup_index = {"backups": {"1": record}, "next_id": 2}
         manager._save_backup_index()
-        
+
         # Verify file was written correctly
         with open(manager.backup_index_file, "r", encoding="utf-8") as f:
             saved_data = json.load(f)
-        assert saved_data == test_data
+        assert saved_data["next_id"] == 2
+        assert saved_data["backups"]["1"]["source_path"] == "/test/path"
+        assert saved_data["backups"]["1"]["sha256"] == "abc"
+        assert manager._load_backup_index() == manager.backup_index
+
+    def test_save_backup_index_without_orjson(self, tmp_path):
+        """Test the standard-library fallback writes the same index."""
+        manager = BackupManager(backup_dir=tmp_path / "backups")
+        manager.backup_index = {
+            "backups": {"1": _record(source_path="/tëst")}, "next_id": 2
+        }
+        manager._save_backup_index()
+        fast = manager.backup_index_file.read_bytes()
+
+        with patch("metadata_multitool.backup.orjson", None):
+            manager._save_backup_index()
+            assert manager._load_backup_index() == manager.backup_index
+
+        assert manager.backup_index_file.read_bytes() == fast
 
     def test_save_backup_index_write_error(self, tmp_path):
         """Test saving backup index when write fails."""
@@ -130,12 +220,12 @@ class TestBackupManager:
         # Verify backup was created
         assert backup_id in manager.backup_index["backups"]
         backup_info = manager.backup_index["backups"][backup_id]
-        assert backup_info["source_path"] == str(source_file)
-        assert backup_info["operation"] == "test_operation"
-        assert backup_info["type"] == "file"
+        assert backup_info.source_path == str(source_file)
+        assert backup_info.operation == "test_operation"
+        assert backup_info.type == "file"
         
         # Verify backup file exists
-        backup_path = Path(backup_info["backup_path"])
+        backup_path = Path(backup_info.backup_path)
         assert backup_path.exists()
         assert backup_path.read_text() == "test content"
 
@@ -160,16 +250,108 @@ class TestBackupManager:
         # Verify backup was created
         assert backup_id in manager.backup_index["backups"]
         backup_info = manager.backup_index["backups"][backup_id]
-        assert backup_info["source_path"] == str(source_dir)
-        assert backup_info["type"] == "directory"
+        assert backup_info.source_path == str(source_dir)
+        assert backup_info.type == "directory"
         
         # Verify backup directory structure
-        backup_path = Path(backup_info["backup_path"])
+        backup_path = Path(backup_info.backup_path)
         assert backup_path.is_dir()
         assert (backup_path / "file1.txt").read_text() == "content1"
         assert (backup_path / "file2.txt").read_text() == "content2"
         assert (backup_path / "subdir" / "file3.txt").read_text() == "content3"
 
+    def test_create_backup_directory_size(self, tmp_path):
+        """Test directory backups record the size and count of the copied files."""
+        source_dir = tmp_path / "source_dir"
+        (source_dir / "a" / "b").mkdir(parents=True)
+        (source_dir / "one.jpg").write_bytes(b"1" * 10)
+        (source_dir / "a" / "two.jpg").write_bytes(b"2" * 20)
+        (source_dir / "a" / "b" / "three.jpg").write_bytes(b"3" * 30)
+
+        manager = BackupManager(backup_dir=tmp_path / "backups")
+        backup_id = manager.create_backup(source_dir, "test")
+
+        backup_info = manager.backup_index["backups"][backup_id]
+        assert backup_info.size == 60
+        assert backup_info.file_count == 3
+        assert manager.list_backups()[0]["file_count"] == 3
+        backup_path = Path(backup_info.backup_path)
+        assert (backup_path / "a" / "b" / "three.jpg").read_bytes() == b"3" * 30
+
+    def test_create_backup_deduplicates_contents(self, tmp_path):
+        """Test repeated backups of unchanged contents share one stored blob."""
+        source_dir = tmp_path / "source_dir"
+        source_dir.mkdir()
+        (source_dir / "a.jpg").write_bytes(b"same")
+        (source_dir / "b.jpg").write_bytes(b"same")
+        source_file = source_dir / "a.jpg"
+
+        manager = BackupManager(backup_dir=tmp_path / "backups")
+        first = manager.create_backup(source_file, "test")
+        second = manager.create_backup(source_file, "test")
+        manager.create_backup(source_dir, "test")
+
+        blobs = [p for p in manager.blob_dir.rglob("*") if p.is_file()]
+        assert len(blobs) == 1
+        info = manager.backup_index["backups"][first]
+        assert info.sha256 == manager.backup_index["backups"][second].sha256
+        assert Path(info.backup_path).read_bytes() == b"same"
+
+    def test_create_backup_skips_hashing_unchanged_file(self, tmp_path):
+        """Test an unchanged size and mtime reuse the previous digest."""
+        source_file = tmp_path / "source.txt"
+        source_file.write_text("content")
+        manager = BackupManager(backup_dir=tmp_path / "backups")
+        manager.create_backup(source_file, "test")
+
+        with patch("metadata_multitool.backup._hash_file") as mock_hash:
+            manager.create_backup(source_file, "test")
+            mock_hash.assert_not_called()
+
+            source_file.write_text("changed contents")
+            mock_hash.return_value = "ab" * 32
+            manager.create_backup(source_file, "test")
+            mock_hash.assert_called_once_with(source_file)
+
+    def test_delete_backup_releases_unused_blobs(self, tmp_path):
+        """Test a blob is removed only once its last backup is deleted."""
+        source_file = tmp_path / "source.txt"
+        source_file.write_text("content")
+        manager = BackupManager(backup_dir=tmp_path / "backups")
+        first = manager.create_backup(source_file, "test")
+        second = manager.create_backup(source_file, "test")
+        blob = manager._blob_path(manager.backup_index["backups"][first].sha256)
+
+        manager.delete_backup(first)
+        assert blob.exists()
+        manager.delete_backup(second)
+        assert not blob.exists()
+
+    def test_delete_directory_backup_releases_its_blobs(self, tmp_path):
+        """Test deleting a directory backup releases only the blobs it used."""
+        source_dir = tmp_path / "source_dir"
+        source_dir.mkdir()
+        (source_dir / "shared.jpg").write_bytes(b"shared")
+        (source_dir / "own.jpg").write_bytes(b"own")
+        (source_dir / "copy.jpg").write_bytes(b"own")
+        manager = BackupManager(backup_dir=tmp_path / "backups")
+        file_backup = manager.create_backup(source_dir / "shared.jpg", "test")
+        dir_backup = manager.create_backup(source_dir, "test")
+
+        record = manager.backup_index["backups"][dir_backup]
+        assert record.file_count == 3
+        assert len(record.digests) == 2
+        shared = manager._blob_path(manager.backup_index["backups"][file_backup].sha256)
+
+        with patch.object(
+            manager, "_release_blob", wraps=manager._release_blob
+        ) as mock_release:
+            manager.delete_backup(dir_backup)
+
+        assert sorted(c.args[0] for c in mock_release.call_args_list) == record.digests
+        blobs = [p for p in manager.blob_dir.rglob("*") if p.is_file()]
+        assert blobs == [shared]
+
     def test_create_backup_nonexistent_source(self, tmp_path):
         """Test creating backup of nonexistent source."""
         backup_dir = tmp_path / "backups"
@@ -188,8 +370,11 @@ class TestBackupManager:
         backup_dir = tmp_path / "backups"
         manager = BackupManager(backup_dir=backup_dir)
         
-        # Mock shutil.copy2 to raise OSError
-        with patch("shutil.copy2", side_effect=OSError("No space left on device")):
+        # Mock the file copy to raise OSError
+        with patch(
+            "metadata_multitool.backup.fast_copy",
+            side_effect=OSError("No space left on device"),
+        ):
             with pytest.raises(BackupError, match="Failed to create backup"):
                 manager.create_backup(source_file, "test")
 
@@ -252,7 +437,7 @@ class TestBackupManager:
         
         # Delete backup file
         backup_info = manager.backup_index["backups"][backup_id]
-        backup_path = Path(backup_info["backup_path"])
+        backup_path = Path(backup_info.backup_path)
         backup_path.unlink()
         
         with pytest.raises(BackupError, match="Backup file not found"):
@@ -284,6 +469,22 @@ class TestBackupManager:
         assert "created_at" in backup
         assert "size" in backup
 
+    def test_list_backups_limit(self, tmp_path):
+        """Test a limit returns only the newest backups, newest first."""
+        manager = BackupManager(backup_dir=tmp_path / "backups")
+        manager.backup_index["backups"] = {
+            str(day): _record(
+                source_path=f"/src/{day}",
+                created_at=f"2024-01-{day:02d}T12:00:00",
+                size=day,
+            )
+            for day in (3, 1, 4, 2)
+        }
+
+        assert [b["id"] for b in manager.list_backups(limit=2)] == ["4", "3"]
+        assert [b["id"] for b in manager.list_backups()] == ["4", "3", "2", "1"]
+        assert next(manager.iter_backups())["id"] == "3"
+
     def test_delete_backup_file(self, tmp_path):
         """Test deleting a file backup."""
         source_file = tmp_path / "source.txt"
@@ -296,7 +497,7 @@ class TestBackupManager:
         # Verify backup exists
         assert backup_id in manager.backup_index["backups"]
         backup_info = manager.backup_index["backups"][backup_id]
-        backup_path = Path(backup_info["backup_path"])
+        backup_path = Path(backup_info.backup_path)
         assert backup_path.exists()
         
         # Delete backup
@@ -317,7 +518,7 @@ class TestBackupManager:
         backup_id = manager.create_backup(source_dir, "test")
         
         backup_info = manager.backup_index["backups"][backup_id]
-        backup_path = Path(backup_info["backup_path"])
+        backup_path = Path(backup_info.backup_path)
         assert backup_path.is_dir()
         
         # Delete backup
@@ -346,27 +547,24 @@ class TestBackupManager:
         
         manager.backup_index = {
             "backups": {
-                "old_backup": {
-                    "created_at": old_timestamp,
-                    "backup_path": str(backup_dir / "old_backup.txt"),
-                    "source_path": "/old/path",
-                    "operation": "test",
-                    "type": "file",
-                    "size": 100
-                },
-                "recent_backup": {
-                    "created_at": recent_timestamp,
-                    "backup_path": str(backup_dir / "recent_backup.txt"),
-                    "source_path": "/recent/path",
-                    "operation": "test",
-                    "type": "file",
-                    "size": 200
-                }
+                "old_backup": _record(
+                    created_at=old_timestamp,
+                    backup_path=str(backup_dir / "old_backup.txt"),
+                    source_path="/old/path",
+                    size=100,
+                ),
+                "recent_backup": _record(
+                    created_at=recent_timestamp,
+                    backup_path=str(backup_dir / "recent_backup.txt"),
+                    source_path="/recent/path",
+                    size=200,
+                ),
             },
             "next_id": 3
         }
         
         # Create backup files
+        backup_dir.mkdir()
         (backup_dir / "old_backup.txt").write_text("old")
         (backup_dir / "recent_backup.txt").write_text("recent")
         
@@ -379,6 +577,40 @@ class TestBackupManager:
         assert not (backup_dir / "old_backup.txt").exists()
         assert (backup_dir / "recent_backup.txt").exists()
 
+    def test_mutations_are_journalled(self, tmp_path):
+        """Test index changes are appended to the journal and replayed on load."""
+        source_file = tmp_path / "source.txt"
+        source_file.write_text("content")
+        backup_dir = tmp_path / "backups"
+        manager = BackupManager(backup_dir=backup_dir)
+
+        kept = manager.create_backup(source_file, "first")
+        dropped = manager.create_backup(source_file, "second")
+        manager.restore_backup(kept)
+        manager.delete_backup(dropped)
+
+        assert not manager.backup_index_file.exists()
+        assert len(manager.backup_journal_file.read_text().splitlines()) == 4
+        reloaded = BackupManager(backup_dir=backup_dir)
+        assert reloaded.backup_index == manager.backup_index
+        assert reloaded.backup_index["next_id"] == 3
+
+    def test_journal_compacted_into_snapshot(self, tmp_path):
+        """Test a long journal is folded into the snapshot and cleared."""
+        source_file = tmp_path / "source.txt"
+        source_file.write_text("content")
+        backup_dir = tmp_path / "backups"
+        manager = BackupManager(backup_dir=backup_dir)
+
+        with patch("metadata_multitool.backup._MAX_JOURNAL_ENTRIES", 2):
+            for _ in range(3):
+                manager.create_backup(source_file, "test")
+
+        assert not manager.backup_journal_file.exists()
+        assert len(json.loads(manager.backup_index_file.read_text())["backups"]) == 3
+        reloaded = BackupManager(backup_dir=backup_dir)
+        assert reloaded.backup_index == manager.backup_index
+
     def test_get_backup_size_empty(self, tmp_path):
         """Test getting backup size when no backups exist."""
         backup_dir = tmp_path / "backups"
@@ -625,19 +857,18 @@ class TestIntegration:
         
         manager.backup_index = {
             "backups": {
-                "old_backup": {
-                    "created_at": old_timestamp,
-                    "backup_path": str(backup_dir / "old_backup.txt"),
-                    "source_path": "/old/path",
-                    "operation": "test",
-                    "type": "file",
-                    "size": 100
-                }
+                "old_backup": _record(
+                    created_at=old_timestamp,
+                    backup_path=str(backup_dir / "old_backup.txt"),
+                    source_path="/old/path",
+                    size=100,
+                )
             },
             "next_id": 2
         }
         
         # Create backup file
+        backup_dir.mkdir()
         (backup_dir / "old_backup.txt").write_text("old")
         
         # Mock delete_backup to raise BackupError
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import List, Tuple
 from unittest.mock import Mock, patch
@@ -17,7 +18,9 @@ from metadata_multitool.batch import (
     format_time_remaining,
     get_memory_usage,
     get_optimal_batch_size,
+    pool_map,
     process_batch,
+    shutdown_pool,
 )
 
 
@@ -48,6 +51,12 @@ def single_failure_process(path: Path) -> Tuple[bool, str]:
     return True, "success"
 
 
+def name_value_process(path: Path) -> Tuple[bool, str, str]:
+    """Fails like single_failure_process, otherwise returns the file name."""
+    success, message = single_failure_process(path)
+    return success, message, path.name
+
+
 def realistic_process(path: Path) -> Tuple[bool, str]:
     """Realistic processing with brief delay."""
     time.sleep(0.001)
@@ -152,6 +161,7 @@ class TestProcessBatch:
                 successful, total, errors = result
                 assert any("Memory limit exceeded" in error for error in errors)
 
+    @patch("metadata_multitool.batch._POOL", None)
     @patch("metadata_multitool.batch.ProcessPoolExecutor")
     def test_executor_exception(self, mock_executor, sample_images):
         """Test handling of executor exceptions."""
@@ -160,6 +170,105 @@ class TestProcessBatch:
         with pytest.raises(BatchProcessingError, match="Failed to process batches"):
             process_batch(sample_images, always_success_process, disable_progress=True)
 
+    def test_workers_capped_by_available_cpus(self, sample_images):
+        """Test more workers than usable CPUs falls back to sequential processing."""
+        with patch("metadata_multitool.batch._DEFAULT_WORKERS", 1), patch(
+            "metadata_multitool.batch._get_pool"
+        ) as mock_pool:
+            result = process_batch(
+                sample_images, always_success_process, max_workers=8, disable_progress=True
+            )
+
+        assert result == (len(sample_images), len(sample_images), [])
+        mock_pool.assert_not_called()
+
+    def test_worker_pool_reused_between_calls(self, sample_images):
+        """Test consecutive batches run on the same warm worker pool."""
+        from metadata_multitool import batch
+
+        try:
+            with patch("metadata_multitool.batch._DEFAULT_WORKERS", 2):
+                first = process_batch(
+                    sample_images, always_success_process, max_workers=2, disable_progress=True
+                )
+                pool = batch._POOL
+                second = process_batch(
+                    sample_images, mixed_results_process, max_workers=2, disable_progress=True
+                )
+
+            assert pool is not None
+            assert batch._POOL is pool
+            assert first == (len(sample_images), len(sample_images), [])
+            assert second[0] == len(sample_images) - 2
+        finally:
+            batch.shutdown_pool()
+
+
+    def test_iterable_streamed_through_pool(self, sample_images):
+        """Test an iterable is processed on the pool under a single progress bar."""
+        from metadata_multitool import batch
+
+        try:
+            with patch("metadata_multitool.batch._DEFAULT_WORKERS", 2), patch(
+                "metadata_multitool.batch.tqdm", wraps=batch.tqdm
+            ) as mock_tqdm:
+                result = process_batch(
+                    iter(sample_images),
+                    name_value_process,
+                    batch_size=1,
+                    max_workers=2,
+                    disable_progress=True,
+                    return_values=True,
+                )
+        finally:
+            batch.shutdown_pool()
+
+        assert result == (
+            4,
+            5,
+            [f"{sample_images[1]}: failed"],
+            [p.name for i, p in enumerate(sample_images) if i != 1],
+        )
+        mock_tqdm.assert_called_once()
+        assert mock_tqdm.call_args.kwargs["total"] is None
+
+    def test_iterable_processed_sequentially(self, sample_images):
+        """Test an iterable works without a pool and is counted as it is read."""
+        result = process_batch(
+            (p for p in sample_images), mixed_results_process, max_workers=1,
+            disable_progress=True,
+        )
+        assert result == (len(sample_images) - 2, len(sample_images), [
+            f"{sample_images[1]}: failed", f"{sample_images[3]}: failed"
+        ])
+
+
+class TestPoolMap:
+    """Test mapping over the shared worker pool."""
+
+    def test_results_in_order(self):
+        """Test results come back in item order, reading an iterable in windows."""
+        try:
+            assert list(pool_map(abs, iter(range(-5, 0)), 2, window=2)) == [
+                5, 4, 3, 2, 1
+            ]
+        finally:
+            shutdown_pool()
+
+    def test_broken_pool_replaced(self):
+        """Test a pool broken by an earlier call is restarted before submitting."""
+        broken = Mock()
+        broken.map.side_effect = BrokenProcessPool("worker died")
+        fresh = Mock()
+        fresh.map.return_value = iter(["a", "b"])
+
+        with patch(
+            "metadata_multitool.batch._get_pool", side_effect=[broken, fresh]
+        ), patch("metadata_multitool.batch.shutdown_pool") as mock_shutdown:
+            assert list(pool_map(str, [1, 2], 2)) == ["a", "b"]
+
+        mock_shutdown.assert_called_once()
+
 
 class TestSequentialProcessing:
     """Test sequential processing functionality."""
@@ -216,7 +325,17 @@ class TestEstimateProcessingTime:
         with patch("time.sleep") as mock_sleep:
             result = estimate_processing_time(sample_images, sample_size=2)
             assert result is not None
-            assert mock_sleep.called
+            assert not mock_sleep.called
+
+    def test_fallback_estimation_by_type(self, tmp_path):
+        """Test the fallback scales with size and is capped per file type."""
+        tiff = tmp_path / "big.tiff"
+        tiff.write_bytes(b"\0" * (2 * 1024 * 1024))
+        jpeg = tmp_path / "huge.jpg"
+        jpeg.write_bytes(b"\0" * (20 * 1024 * 1024))
+
+        result = estimate_processing_time([tiff, jpeg])
+        assert result == pytest.approx((0.004 + 0.005) / 2)
 
     def test_nonexistent_files(self, tmp_path):
         """Test estimation with nonexistent files."""
@@ -228,7 +347,7 @@ class TestEstimateProcessingTime:
     def test_estimation_exception(self, mock_time, sample_images):
         """Test estimation with timing exception."""
         mock_time.side_effect = Exception("Time error")
-        result = estimate_processing_time(sample_images)
+        result = estimate_processing_time(sample_images, process_func=simple_process)
         assert result is None
 
 
@@ -268,26 +387,21 @@ class TestMemoryFunctions:
 
     def test_get_memory_usage_without_psutil(self):
         """Test memory usage fallback without psutil."""
-        # Since psutil might or might not be available, we test the fallback logic
-        # by directly testing the import error path in the function
-        import sys
-        original_modules = sys.modules.copy()
-        
-        # Temporarily remove psutil from modules if present
-        if 'psutil' in sys.modules:
-            del sys.modules['psutil']
-        
-        # Add a fake broken psutil module
-        sys.modules['psutil'] = None
-        
-        try:
-            result = get_memory_usage()
-            # Should fall back to 0.0 when psutil import fails
-            assert result == 0.0
-        finally:
-            # Restore original modules
-            sys.modules.clear()
-            sys.modules.update(original_modules)
+        with patch("metadata_multitool.batch.psutil", None):
+            # Should fall back to 0.0 when psutil is not installed
+            assert get_memory_usage() == 0.0
+
+    def test_get_memory_usage_reuses_process_handle(self):
+        """Test the psutil process handle is created once per process."""
+        psutil = pytest.importorskip("psutil")
+        from metadata_multitool import batch
+
+        with patch.object(batch, "_PROCESS", None), patch.object(
+            psutil, "Process", wraps=psutil.Process
+        ) as mock_process:
+            assert get_memory_usage() > 0.0
+            assert get_memory_usage() > 0.0
+            assert mock_process.call_count == 1
 
     @patch("metadata_multitool.batch.get_memory_usage")
     def test_check_memory_limit_within_limits(self, mock_get_memory):
@@ -351,32 +465,56 @@ class TestTimeFormatting:
 
 
 class TestBatchWorker:
-    """Test batch worker functionality."""
+    """Test per-item worker functionality."""
 
-    def test_worker_all_success(self, sample_images):
-        """Test batch worker with all successful items."""
-        from metadata_multitool.batch import _process_batch_worker
+    def test_worker_success(self, sample_image):
+        """Test a successful item reports no error."""
+        from metadata_multitool.batch import _process_item
 
-        successful, errors = _process_batch_worker(sample_images, always_success_process)
-        assert successful == len(sample_images)
-        assert len(errors) == 0
+        assert _process_item(always_success_process, sample_image) == (None, None)
 
-    def test_worker_mixed_results(self, sample_images):
-        """Test batch worker with mixed results."""
-        from metadata_multitool.batch import _process_batch_worker
+    def test_worker_failure(self, sample_images):
+        """Test a failed item reports its message."""
+        from metadata_multitool.batch import _process_item
 
-        successful, errors = _process_batch_worker(sample_images, single_failure_process)
-        assert successful == 4  # 4 out of 5 should succeed
-        assert len(errors) == 1
+        errors = [
+            _process_item(single_failure_process, item)[0] for item in sample_images
+        ]
+        assert errors.count(None) == 4  # 4 out of 5 should succeed
+        assert [e for e in errors if e] == [f"{sample_images[1]}: failed"]
 
     def test_worker_with_exceptions(self, sample_images):
-        """Test batch worker with exceptions."""
-        from metadata_multitool.batch import _process_batch_worker
+        """Test an exception is reported as the item's error."""
+        from metadata_multitool.batch import _process_item
 
-        successful, errors = _process_batch_worker(sample_images, exception_process)
-        assert successful == 4  # 4 out of 5 should succeed
-        assert len(errors) == 1
-        assert "Test exception" in errors[0]
+        errors = [_process_item(exception_process, item)[0] for item in sample_images]
+        assert errors.count(None) == 4  # 4 out of 5 should succeed
+        assert "Test exception" in [e for e in errors if e][0]
+
+    def test_values_collected_from_successes(self, sample_images):
+        """Test values returned by successful items reach the caller in order."""
+        successful, total, errors, values = process_batch(
+            sample_images,
+            name_value_process,
+            max_workers=1,
+            disable_progress=True,
+            return_values=True,
+        )
+
+        assert (successful, total) == (4, 5)
+        assert values == [p.name for i, p in enumerate(sample_images) if i != 1]
+
+    def test_values_kept_for_items_without_one(self, sample_images):
+        """Test a success without a value still has its place in the values."""
+        result = process_batch(
+            sample_images,
+            single_failure_process,
+            max_workers=1,
+            disable_progress=True,
+            return_values=True,
+        )
+
+        assert result == (4, 5, [f"{sample_images[1]}: failed"], [None] * 4)
 
 
 class TestIntegration:
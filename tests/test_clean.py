@@ -1,13 +1,34 @@
 """Tests for clean module functionality."""
 
+import json
+import os
+import shutil
+import subprocess
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 from PIL import Image
-
-from metadata_multitool.clean import clean_copy
+from PIL.PngImagePlugin import PngInfo
+
+from metadata_multitool.clean import (
+    _scan_jpeg_markers,
+    _selective_remove_with_exiftool,
+    clean_copy,
+    clean_copy_stream,
+    clean_directory,
+    get_metadata_preview,
+    selective_clean_metadata,
+)
+from metadata_multitool.exif import ExifToolError
+from metadata_multitool.metadata_profiles import (
+    MetadataCategory,
+    MetadataProfile,
+    apply_profile_to_fields,
+    categorize_field,
+    get_predefined_profiles,
+)
 
 
 class TestCleanCopy:
@@ -44,31 +65,35 @@ class TestCleanCopy:
 
     def test_clean_copy_with_exiftool(self, tmp_path: Path) -> None:
         """Test clean_copy when exiftool is available."""
-        src_img = tmp_path / "test.jpg"
+        src_img = tmp_path / "test.webp"
         with Image.new("RGB", (100, 100), color="green") as img:
-            img.save(src_img, "JPEG")
+            img.save(src_img, "WEBP")
 
         dest_dir = tmp_path / "safe_upload"
 
-        with patch("metadata_multitool.clean.strip_all_metadata") as mock_strip:
+        with patch(
+            "metadata_multitool.clean.strip_all_metadata", side_effect=shutil.copy
+        ) as mock_strip:
             result = clean_copy(src_img, dest_dir)
 
             assert result.exists()
-            mock_strip.assert_called_once_with(result)
+            mock_strip.assert_called_once_with(src_img, result)
 
     def test_clean_copy_without_exiftool(self, tmp_path: Path) -> None:
         """Test clean_copy when exiftool is not available."""
-        src_img = tmp_path / "test.jpg"
+        src_img = tmp_path / "test.webp"
         with Image.new("RGB", (100, 100), color="yellow") as img:
-            img.save(src_img, "JPEG")
+            img.save(src_img, "WEBP")
 
         dest_dir = tmp_path / "safe_upload"
 
-        with patch("metadata_multitool.clean.strip_all_metadata") as mock_strip:
+        with patch(
+            "metadata_multitool.clean.strip_all_metadata", side_effect=shutil.copy
+        ) as mock_strip:
             result = clean_copy(src_img, dest_dir)
 
             assert result.exists()
-            mock_strip.assert_called_once_with(result)
+            mock_strip.assert_called_once_with(src_img, result)
 
     def test_clean_copy_handles_different_formats(self, tmp_path: Path) -> None:
         """Test clean_copy with different image formats."""
@@ -123,3 +148,534 @@ class TestCleanCopy:
                 assert original.mode == copied.mode
                 # Note: We can't easily compare pixel data without loading it all
                 # but the size and mode check is a good basic verification
+
+
+class TestCleanCopyStream:
+    """Test single-pass metadata stripping."""
+
+    def test_jpeg_metadata_removed(self, tmp_path: Path) -> None:
+        """Test EXIF and comments are dropped and the pixels are kept."""
+        src_img = tmp_path / "photo.jpg"
+        exif = Image.Exif()
+        exif[0x013B] = "Jane Doe"  # Artist
+        with Image.new("RGB", (64, 48), color="red") as img:
+            img.save(src_img, "JPEG", exif=exif, comment=b"secret")
+
+        with patch("metadata_multitool.clean.strip_all_metadata") as mock_strip:
+            result = clean_copy_stream(src_img, tmp_path / "out")
+
+        mock_strip.assert_not_called()
+        data = result.read_bytes()
+        assert b"Jane Doe" not in data
+        assert b"secret" not in data
+        assert b"JFIF" in data
+        with Image.open(src_img) as original, Image.open(result) as copied:
+            assert not copied.getexif()
+            assert list(original.getdata()) == list(copied.getdata())
+
+    def test_png_text_chunks_removed(self, tmp_path: Path) -> None:
+        """Test PNG text chunks are dropped and the image is unchanged."""
+        src_img = tmp_path / "image.png"
+        info = PngInfo()
+        info.add_text("Author", "Jane Doe")
+        info.add_itxt("Comment", "secret")
+        with Image.new("RGB", (32, 32), color="blue") as img:
+            img.save(src_img, "PNG", pnginfo=info)
+
+        result = clean_copy_stream(src_img, tmp_path / "out")
+
+        data = result.read_bytes()
+        assert b"Jane Doe" not in data
+        assert b"secret" not in data
+        with Image.open(src_img) as original, Image.open(result) as copied:
+            assert copied.text == {}
+            assert list(original.getdata()) == list(copied.getdata())
+
+    def test_refuses_to_overwrite_source(self, tmp_path: Path) -> None:
+        """Test cleaning into the source directory keeps the original intact."""
+        src_img = tmp_path / "photo.jpg"
+        with Image.new("RGB", (16, 16), color="red") as img:
+            img.save(src_img, "JPEG", comment=b"secret")
+        original = src_img.read_bytes()
+
+        with pytest.raises(shutil.SameFileError):
+            clean_copy_stream(src_img, tmp_path)
+
+        assert src_img.read_bytes() == original
+
+    def test_mismatched_extension_falls_back(self, tmp_path: Path) -> None:
+        """Test a file that is not what its extension says is copy-stripped."""
+        src_img = tmp_path / "image.jpg"
+        with Image.new("RGB", (16, 16), color="green") as img:
+            img.save(src_img, "PNG")
+
+        with patch("metadata_multitool.clean.strip_all_metadata") as mock_strip:
+            result = clean_copy_stream(src_img, tmp_path / "out")
+
+        mock_strip.assert_called_once_with(src_img, result)
+
+    def test_jpeg_without_sendfile(self, tmp_path: Path) -> None:
+        """Test image data is still copied when sendfile fails."""
+        src_img = tmp_path / "photo.jpg"
+        with Image.new("RGB", (64, 48), color="red") as img:
+            img.save(src_img, "JPEG")
+
+        with patch("os.sendfile", side_effect=OSError, create=True):
+            result = clean_copy_stream(src_img, tmp_path / "out")
+
+        assert result.read_bytes() == src_img.read_bytes()
+
+    def test_extension_case_ignored(self, tmp_path: Path) -> None:
+        """Test upper-case extensions still take the single-pass path."""
+        src_img = tmp_path / "PHOTO.JPEG"
+        with Image.new("RGB", (16, 16), color="red") as img:
+            img.save(src_img, "JPEG", comment=b"secret")
+
+        with patch("metadata_multitool.clean.strip_all_metadata") as mock_strip:
+            result = clean_copy_stream(src_img, tmp_path / "out")
+
+        mock_strip.assert_not_called()
+        assert b"secret" not in result.read_bytes()
+
+
+class TestScanJpegMarkers:
+    """Test the JPEG segment walk."""
+
+    # SOI, APP0, APP1, fill byte, COM, RST0, DQT, then SOS
+    HEADER = (
+        b"\xff\xd8"
+        b"\xff\xe0\x00\x04JF"
+        b"\xff\xe1\x00\x05Exi"
+        b"\xff\xff\xfe\x00\x03c"
+        b"\xff\xd0"
+        b"\xff\xdb\x00\x03q"
+        b"\xff\xda\x00\x02"
+    )
+
+    def test_spans_and_scan_offset(self) -> None:
+        """Test metadata segments are left out of the kept spans."""
+        scan_start, kept = _scan_jpeg_markers(self.HEADER)
+        assert self.HEADER[scan_start:] == b"\xff\xda\x00\x02"
+        header = b"".join(self.HEADER[start:end] for start, end in kept)
+        assert header == b"\xff\xd8\xff\xe0\x00\x04JF\xff\xd0\xff\xdb\x00\x03q"
+
+    def test_short_buffer(self) -> None:
+        """Test a buffer ending before the scan asks for more data."""
+        for end in (3, 8, 13):
+            assert _scan_jpeg_markers(self.HEADER[:end]) is None
+
+    def test_not_a_jpeg(self) -> None:
+        """Test non-JPEG data is rejected."""
+        with pytest.raises(ValueError):
+            _scan_jpeg_markers(b"\x89PNG")
+        with pytest.raises(ValueError):
+            _scan_jpeg_markers(b"\xff\xd8\x00\x00")
+
+
+class TestSelectiveCleanSession:
+    """Test selective cleaning through an ExifTool session."""
+
+    def test_all_steps_run_in_session(self, tmp_path: Path) -> None:
+        """Test the field query, removal and check reuse the session."""
+        img_path = tmp_path / "photo.jpg"
+        img_path.write_bytes(b"")
+        before = json.dumps([{"Make": "X", "Artist": "Y"}])
+        after = json.dumps([{"Make": "X"}])
+        session = Mock()
+        session.execute.side_effect = [
+            (before, ""),
+            ("1 image files updated", ""),
+            (after, ""),
+        ]
+
+        with patch("metadata_multitool.clean.has_exiftool", return_value=True), patch(
+            "metadata_multitool.clean.subprocess.run"
+        ) as mock_run:
+            result = selective_clean_metadata(
+                img_path, preserve_fields={"Make"}, session=session, verify=True
+            )
+
+        mock_run.assert_not_called()
+        assert session.execute.call_count == 3
+        assert session.execute.call_args_list[1].args[0] == [
+            "-overwrite_original", "-Artist=", str(img_path)
+        ]
+        assert result["method"] == "selective_exiftool"
+        assert result["removed_fields"] == ["Artist"]
+        assert result["preserved_fields"] == ["Make"]
+
+    def test_unverified_result_from_request(self, tmp_path: Path) -> None:
+        """Test the file is not re-read unless verification is asked for."""
+        img_path = tmp_path / "photo.jpg"
+        img_path.write_bytes(b"")
+        before = json.dumps([{"Make": "X", "Artist": "Y", "Model": "Z"}])
+        session = Mock()
+        session.execute.side_effect = [(before, ""), ("1 image files updated", "")]
+
+        with patch("metadata_multitool.clean.has_exiftool", return_value=True):
+            result = selective_clean_metadata(
+                img_path, preserve_fields={"Make", "Copyright"}, session=session
+            )
+
+        assert session.execute.call_count == 2
+        assert result["preserved_fields"] == ["Make"]
+        assert sorted(result["removed_fields"]) == ["Artist", "Model"]
+
+    def test_session_error_falls_back(self, tmp_path: Path) -> None:
+        """Test an ExifTool error in the session falls back to a full strip."""
+        img_path = tmp_path / "photo.jpg"
+        img_path.write_bytes(b"")
+        before = json.dumps([{"Make": "X", "Artist": "Y"}])
+        session = Mock()
+        session.execute.side_effect = [(before, ""), ("", "Error: not writable")]
+
+        with patch("metadata_multitool.clean.has_exiftool", return_value=True), patch(
+            "metadata_multitool.clean.strip_all_metadata"
+        ) as mock_strip:
+            result = selective_clean_metadata(
+                img_path, preserve_fields={"Make"}, session=session
+            )
+
+        mock_strip.assert_called_once_with(img_path)
+        assert "not writable" in result["error"]
+
+    def test_removal_error_is_typed(self, tmp_path: Path) -> None:
+        """Test ExifTool failures raise ExifToolError."""
+        session = Mock()
+        session.execute.return_value = ("", "Error: not writable")
+
+        with pytest.raises(ExifToolError, match="not writable"):
+            _selective_remove_with_exiftool(
+                tmp_path / "photo.jpg", {"Make", "Artist"}, {"Make"}, session
+            )
+
+    def test_explicit_profile_runs_once(self, tmp_path: Path) -> None:
+        """Test a profile naming all its tags skips listing the file's tags."""
+        img_path = tmp_path / "photo.jpg"
+        img_path.write_bytes(b"")
+        profile = MetadataProfile(
+            name="Orientation",
+            description="",
+            preserve_fields={"EXIF:Orientation", "GPS:GPSLatitude"},
+            remove_fields=set(),
+            preserve_categories=set(),
+            remove_categories={MetadataCategory.GPS},
+        )
+        session = Mock()
+        session.execute.return_value = ("1 image files updated", "")
+
+        with patch("metadata_multitool.clean.has_exiftool", return_value=True):
+            result = selective_clean_metadata(img_path, profile, session=session)
+
+        session.execute.assert_called_once_with(
+            [
+                "-overwrite_original", "-all=", "-tagsFromFile", "@",
+                "-EXIF:Orientation", str(img_path),
+            ]
+        )
+        assert result["preserved_fields"] == ["EXIF:Orientation"]
+        assert result["profile_used"] == "Orientation"
+
+    def test_category_profiles_are_open_ended(self) -> None:
+        """Test only profiles without preserved categories give a tag list."""
+        profiles = get_predefined_profiles()
+        assert profiles["remove_all"].preserve_explicit_tags() == frozenset()
+        assert profiles["social_media"].preserve_explicit_tags() is None
+
+
+class TestApplyProfileToFields:
+    """Test profile rules applied to a file's tags."""
+
+    def test_edited_profile_not_served_from_cache(self) -> None:
+        """Test results follow the profile's current rules for a repeated tag set."""
+        profile = MetadataProfile(
+            name="Custom",
+            description="",
+            preserve_fields=set(),
+            remove_fields=set(),
+            preserve_categories={MetadataCategory.CAMERA},
+            remove_categories=set(),
+        )
+        fields = {"EXIF:Make", "EXIF:Artist"}
+
+        assert apply_profile_to_fields(fields, profile) == {"EXIF:Make"}
+        profile.preserve_categories.add(MetadataCategory.COPYRIGHT)
+        assert apply_profile_to_fields(fields, profile) == fields
+
+    def test_unmapped_fields_categorized_by_keyword(self) -> None:
+        """Test keyword fallbacks apply in order, defaulting to technical."""
+        assert categorize_field("Custom:GPSDateTime") == MetadataCategory.GPS
+        assert categorize_field("Custom:LensModelTime") == MetadataCategory.CAMERA
+        assert categorize_field("Custom:ImageOwner") == MetadataCategory.PRIVACY
+        assert categorize_field("Custom:Sharpness") == MetadataCategory.TECHNICAL
+
+
+class TestGetMetadataPreview:
+    """Test the cleaning preview."""
+
+    def test_preview_lists_sorted(self, tmp_path: Path) -> None:
+        """Test every list in the preview is sorted."""
+        fields = {"Model", "Artist", "Make", "GPSLatitude"}
+
+        with patch("metadata_multitool.clean.has_exiftool", return_value=True), patch(
+            "metadata_multitool.clean.get_metadata_fields", return_value=fields
+        ):
+            preview = get_metadata_preview(
+                tmp_path / "a.jpg", preserve_fields={"Make", "Copyright"}
+            )
+
+        assert preview["current_fields"] == ["Artist", "GPSLatitude", "Make", "Model"]
+        assert preview["would_preserve"] == ["Copyright", "Make"]
+        assert preview["would_remove"] == ["Artist", "GPSLatitude", "Model"]
+        assert preview["field_counts"] == {"total": 4, "preserve": 2, "remove": 3}
+
+
+class TestCleanDirectoryDryRun:
+    """Test clean_directory's dry run."""
+
+    def test_counts_without_listing(self, tmp_path: Path) -> None:
+        """Test every image is counted but only the first ten are listed."""
+        images = (tmp_path / f"photo{index}.jpg" for index in range(25))
+
+        with patch("metadata_multitool.clean.iter_images", return_value=images):
+            result = clean_directory(tmp_path, dry_run=True)
+
+        assert result["would_process"] == 25
+        assert result["files"] == [str(tmp_path / f"photo{i}.jpg") for i in range(10)]
+
+    def test_no_images(self, tmp_path: Path) -> None:
+        """Test an empty directory reports no images."""
+        with patch("metadata_multitool.clean.iter_images", return_value=iter(())):
+            result = clean_directory(tmp_path, dry_run=True)
+
+        assert result["message"] == "No images found"
+
+
+class TestCleanDirectoryWorkers:
+    """Test clean_directory's worker pool."""
+
+    def _images(self, tmp_path: Path) -> list:
+        images = []
+        for index in range(4):
+            image = tmp_path / f"photo{index}.jpg"
+            with Image.new("RGB", (16, 16), color="red") as img:
+                img.save(image, "JPEG", comment=b"secret")
+            images.append(image)
+        return images
+
+    def test_pool_cleans_every_file(self, tmp_path: Path) -> None:
+        """Test files cleaned on worker processes are all reported."""
+        images = self._images(tmp_path)
+        output = tmp_path / "out"
+
+        with patch("metadata_multitool.clean.iter_images", return_value=images), patch(
+            "metadata_multitool.batch._DEFAULT_WORKERS", 2
+        ):
+            result = clean_directory(tmp_path, output, workers=2)
+
+        assert result["successful"] == 4
+        assert result["failed"] == 0
+        for image in images:
+            assert b"secret" not in (output / image.name).read_bytes()
+
+    @pytest.mark.parametrize("exiftool", [False, True])
+    def test_cleaning_into_input_keeps_originals(
+        self, tmp_path: Path, exiftool: bool
+    ) -> None:
+        """Test cleaning a directory into itself fails per file, keeping files.
+
+        JPEGs take the streaming copy and TIFFs the batch strip.
+        """
+        images = []
+        for index in range(2):
+            for suffix, image_format in ((".jpg", "JPEG"), (".tiff", "TIFF")):
+                image = tmp_path / f"photo{index}{suffix}"
+                with Image.new("RGB", (16, 16), color="red") as img:
+                    img.save(image, image_format)
+                images.append(image)
+        originals = {image: image.read_bytes() for image in images}
+
+        with patch(
+            "metadata_multitool.exif.has_exiftool", return_value=exiftool
+        ), patch("metadata_multitool.clean.has_exiftool", return_value=exiftool), patch(
+            "metadata_multitool.exif.run_exiftool_persistent"
+        ) as mock_run:
+            result = clean_directory(tmp_path, output_path=tmp_path, workers=1)
+
+        mock_run.assert_not_called()
+        assert result["successful"] == 0
+        assert result["failed"] == 4
+        for image, data in originals.items():
+            assert image.read_bytes() == data
+
+    def test_errors_reported_per_file(self, tmp_path: Path) -> None:
+        """Test a failing file is reported without stopping the others."""
+        images = self._images(tmp_path)
+        missing = tmp_path / "missing.jpg"
+
+        with patch(
+            "metadata_multitool.clean.iter_images", return_value=[*images, missing]
+        ):
+            result = clean_directory(tmp_path, tmp_path / "out", workers=1)
+
+        assert result["processed"] == 5
+        assert result["successful"] == 4
+        assert result["errors"][0]["file"] == str(missing)
+
+    def test_unstreamable_formats_stripped_together(self, tmp_path: Path) -> None:
+        """Test formats without a single-pass stripper share one strip call."""
+        images = self._images(tmp_path)
+        webps = []
+        for index in range(2):
+            webp = tmp_path / f"image{index}.webp"
+            with Image.new("RGB", (16, 16), color="blue") as img:
+                img.save(webp, "WEBP")
+            webps.append(webp)
+        output = tmp_path / "out"
+
+        with patch(
+            "metadata_multitool.clean.iter_images", return_value=[*images, *webps]
+        ), patch("metadata_multitool.clean.strip_all_metadata_batch") as mock_batch, patch(
+            "metadata_multitool.clean.strip_all_metadata"
+        ) as mock_strip:
+            result = clean_directory(tmp_path, output, workers=1)
+
+        mock_batch.assert_called_once_with(webps, output)
+        mock_strip.assert_not_called()
+        assert result["processed"] == 6
+        assert result["successful"] == 6
+
+    def test_batch_strip_failure_retried_per_file(self, tmp_path: Path) -> None:
+        """Test a failed shared strip is retried to find the failing files."""
+        webps = []
+        for index in range(3):
+            webp = tmp_path / f"image{index}.webp"
+            with Image.new("RGB", (16, 16), color="blue") as img:
+                img.save(webp, "WEBP")
+            webps.append(webp)
+        output = tmp_path / "out"
+
+        def strip(path: Path, out_path: Path) -> None:
+            if path.name == "image1.webp":
+                raise ValueError("cannot write")
+
+        with patch("metadata_multitool.clean.iter_images", return_value=webps), patch(
+            "metadata_multitool.clean.strip_all_metadata_batch",
+            side_effect=ValueError("batch failed"),
+        ), patch("metadata_multitool.clean.strip_all_metadata", side_effect=strip):
+            result = clean_directory(tmp_path, output, workers=1)
+
+        assert result["successful"] == 2
+        assert result["errors"] == [
+            {"file": str(webps[1]), "error": "cannot write"}
+        ]
+
+    def test_backups_taken_before_cleaning(self, tmp_path: Path) -> None:
+        """Test every file is backed up and a failed backup skips cleaning."""
+        images = self._images(tmp_path)
+        missing = tmp_path / "missing.jpg"
+        output = tmp_path / "out"
+
+        with patch(
+            "metadata_multitool.clean.iter_images", return_value=[missing, *images]
+        ):
+            result = clean_directory(tmp_path, output, backup=True, workers=1)
+
+        for image in images:
+            assert (tmp_path / "backup" / image.name).read_bytes() == image.read_bytes()
+        assert result["processed"] == 5
+        assert result["successful"] == 4
+        assert [error["file"] for error in result["errors"]] == [str(missing)]
+        assert not (output / missing.name).exists()
+
+    def test_rerun_skips_unchanged_files(self, tmp_path: Path) -> None:
+        """Test a second run only cleans files changed since the first."""
+        images = self._images(tmp_path)
+        output = tmp_path / "out"
+
+        with patch("metadata_multitool.clean.iter_images", return_value=images):
+            first = clean_directory(tmp_path, output, workers=1)
+            stat = images[0].stat()
+            os.utime(images[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            second = clean_directory(tmp_path, output, workers=1)
+            third = clean_directory(tmp_path, output, profile_name="remove_all")
+
+        assert (first["skipped"], first["successful"]) == (0, 4)
+        assert (second["skipped"], second["successful"]) == (3, 1)
+        assert third["skipped"] == 0
+
+    def test_manifest_kept_out_of_output(self, tmp_path: Path) -> None:
+        """Test the rerun manifest stays in the input and holds no absolute paths."""
+        images = self._images(tmp_path)
+        output = tmp_path / "out"
+
+        with patch("metadata_multitool.clean.iter_images", return_value=images):
+            clean_directory(tmp_path, output, workers=1)
+
+        assert sorted(p.name for p in output.iterdir()) == sorted(
+            image.name for image in images
+        )
+        manifest = (tmp_path / ".mm_cleaned.json").read_text(encoding="utf-8")
+        assert str(tmp_path) not in manifest
+        assert sorted(json.loads(manifest)) == sorted(image.name for image in images)
+
+    def test_selective_files_grouped_by_removals(self, tmp_path: Path) -> None:
+        """Test files needing the same tags removed share one ExifTool command."""
+        images = self._images(tmp_path)[:3]
+        output = tmp_path / "out"
+        copies = [output / image.name for image in images]
+        fields = {
+            copies[0]: {"Make", "Artist"},
+            copies[1]: {"Make", "Artist"},
+            copies[2]: {"Make", "GPSLatitude"},
+        }
+        session = Mock()
+        session.execute.return_value = ("", "")
+
+        with patch(
+            "metadata_multitool.clean.iter_images", return_value=images
+        ), patch("metadata_multitool.clean.has_exiftool", return_value=True), patch(
+            "metadata_multitool.clean.get_metadata_fields_batch", return_value=fields
+        ), patch("metadata_multitool.clean.ExifToolSession") as session_class:
+            session_class.return_value.__enter__.return_value = session
+            result = clean_directory(
+                tmp_path, output, preserve_fields=["Make"], workers=1
+            )
+
+        assert [call.args[0] for call in session.execute.call_args_list] == [
+            ["-overwrite_original", "-Artist=", str(copies[0]), str(copies[1])],
+            ["-overwrite_original", "-GPSLatitude=", str(copies[2])],
+        ]
+        assert result["processed"] == 3
+        assert result["successful"] == 3
+
+    def test_fields_sent_through_stdin_without_session(self, tmp_path: Path) -> None:
+        """Test the removal arguments go through an argfile on stdin."""
+        img_path = tmp_path / "photo.jpg"
+        img_path.write_bytes(b"")
+        fields = {f"XMP:Tag{index}" for index in range(50)}
+
+        with patch("metadata_multitool.clean.subprocess.run") as mock_run, patch(
+            "metadata_multitool.clean.get_metadata_fields", return_value=set()
+        ):
+            _selective_remove_with_exiftool(img_path, fields | {"Make"}, {"Make"})
+
+        command = mock_run.call_args.args[0]
+        assert command == ["exiftool", "-charset", "filename=utf8", "-@", "-"]
+        assert mock_run.call_args.kwargs["stdout"] == subprocess.DEVNULL
+        lines = mock_run.call_args.kwargs["input"].decode("utf-8").splitlines()
+        assert lines[0] == "-overwrite_original"
+        assert lines[-1] == str(img_path)
+        assert sorted(lines[1:-1]) == sorted(f"-{field}=" for field in fields)
+
+    def test_stderr_decoded_only_on_error(self, tmp_path: Path) -> None:
+        """Test a failed ExifTool run reports its decoded error output."""
+        error = subprocess.CalledProcessError(
+            1, "exiftool", stderr="Error: bad é".encode("utf-8")
+        )
+
+        with patch("metadata_multitool.clean.subprocess.run", side_effect=error):
+            with pytest.raises(ExifToolError, match="Error: bad é"):
+                _selective_remove_with_exiftool(
+                    tmp_path / "photo.jpg", {"Make", "Artist"}, {"Make"}
+                )
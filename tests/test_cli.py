@@ -22,7 +22,9 @@ from metadata_multitool.cli import (
     validate_args,
     main,
 )
-from metadata_multitool.core import MetadataMultitoolError, InvalidPathError, LogError
+from metadata_multitool.core import (
+    MetadataMultitoolError, InvalidPathError, LogError, read_log
+)
 
 
 class TestApplyFilters:
@@ -45,10 +47,10 @@ class TestApplyFilters:
         
         with patch("metadata_multitool.cli.FileFilter") as mock_filter_class:
             mock_filter = Mock()
-            # Mock the filters list with a function that returns True for first 2 images
+            # Mock the filter check with a function that returns True for first 2 images
             def mock_filter_func(path):
                 return path in sample_images[:2]
-            mock_filter.filters = [mock_filter_func]
+            mock_filter.accepts.side_effect = mock_filter_func
             mock_filter_class.return_value = mock_filter
             
             result = apply_filters(args, sample_images)
@@ -71,7 +73,7 @@ class TestApplyFilters:
             # Create mock filter function that returns True for first 3 images
             def mock_filter_func(path):
                 return path in sample_images[:3]
-            mock_filter.filters = [mock_filter_func]
+            mock_filter.accepts.side_effect = mock_filter_func
             
             result = apply_filters(args, sample_images)
             
@@ -91,7 +93,7 @@ class TestApplyFilters:
             mock_filter = Mock()
             mock_filter_class.return_value = mock_filter
             # Create mock filter function that returns True for all images
-            mock_filter.filters = [Mock(return_value=True)]
+            mock_filter.accepts.return_value = True
             
             result = apply_filters(args, sample_images)
             
@@ -113,7 +115,7 @@ class TestApplyFilters:
             # Create mock filter function that returns True for first image only
             def mock_filter_func(path):
                 return path == sample_images[0]
-            mock_filter.filters = [mock_filter_func]
+            mock_filter.accepts.side_effect = mock_filter_func
             
             result = apply_filters(args, sample_images)
             
@@ -135,7 +137,7 @@ class TestApplyFilters:
             # Create mock filter function that returns True for first 2 images
             def mock_filter_func(path):
                 return path in sample_images[:2]
-            mock_filter.filters = [mock_filter_func]
+            mock_filter.accepts.side_effect = mock_filter_func
             
             result = apply_filters(args, sample_images)
             
@@ -251,7 +253,7 @@ class TestCmdClean:
 
     @patch("metadata_multitool.cli.iter_images")
     @patch("metadata_multitool.cli.ensure_dir")
-    @patch("metadata_multitool.cli.clean_copy")
+    @patch("metadata_multitool.clean.clean_copy")
     @patch("metadata_multitool.cli.load_config")
     @patch("builtins.print")
     def test_cmd_clean_basic(self, mock_print, mock_load_config, mock_clean_copy, mock_ensure_dir, mock_iter_images, tmp_path):
@@ -350,7 +352,7 @@ class TestCmdPoison:
     """Test poison command functionality."""
 
     @patch("metadata_multitool.cli.iter_images")
-    @patch("metadata_multitool.cli.write_sidecars")
+    @patch("metadata_multitool.poison.write_sidecars")
     @patch("metadata_multitool.cli.load_config")
     @patch("builtins.print")
     def test_cmd_poison_basic(self, mock_print, mock_load_config, mock_write_sidecars, mock_iter_images, tmp_path):
@@ -419,7 +421,7 @@ class TestCmdPoison:
         assert len(dry_run_calls) > 0
 
     @patch("metadata_multitool.cli.iter_images")
-    @patch("metadata_multitool.cli.load_csv_mapping")
+    @patch("metadata_multitool.poison.load_csv_mapping")
     @patch("metadata_multitool.cli.load_config")
     @patch("builtins.print")
     def test_cmd_poison_with_csv(self, mock_print, mock_load_config, mock_load_csv, mock_iter_images, tmp_path):
@@ -454,6 +456,134 @@ class TestCmdPoison:
         assert result == 0
         mock_load_csv.assert_called_once_with(csv_file)
 
+    @patch("metadata_multitool.cli.iter_images")
+    @patch("metadata_multitool.poison.write_sidecars")
+    @patch("metadata_multitool.cli.load_config")
+    @patch("builtins.print")
+    def test_cmd_poison_streams_single_worker_run(
+        self,
+        mock_print,
+        mock_load_config,
+        mock_write_sidecars,
+        mock_iter_images,
+        tmp_path,
+    ):
+        """Test a run larger than one batch is processed while paths are read."""
+        images = [tmp_path / f"img{i}.jpg" for i in range(3)]
+        for image in images:
+            image.write_bytes(b"test")
+        read = []
+
+        def lazy_images(_target):
+            for image in images:
+                read.append(image)
+                yield image
+
+        def check_read_ahead(img, *_args, **_kwargs):
+            # Paths are pulled one batch ahead, not the whole directory
+            assert len(read) <= images.index(img) + 2
+
+        args = argparse.Namespace(
+            paths=[str(tmp_path)], preset="label_flip", dry_run=False,
+            verbose=False, sidecar=True, json=False, html=False, xmp=False,
+            iptc=False, exif=False, csv=None, rename_pattern=None,
+            true_hint=None, no_backup=True, batch_size=2, max_workers=1,
+        )
+        mock_iter_images.side_effect = lazy_images
+        mock_load_config.return_value = {}
+        mock_write_sidecars.side_effect = check_read_ahead
+
+        result = cmd_poison(args)
+
+        assert result == 0
+        assert mock_write_sidecars.call_count == 3
+        assert any("3/3 image(s)" in str(call) for call in mock_print.call_args_list)
+
+    @patch("metadata_multitool.cli.iter_images")
+    @patch("metadata_multitool.poison.write_metadata")
+    @patch("metadata_multitool.cli.load_config")
+    @patch("builtins.print")
+    def test_cmd_poison_sequential_uses_worker(
+        self,
+        mock_print,
+        mock_load_config,
+        mock_write_metadata,
+        mock_iter_images,
+        tmp_path,
+    ):
+        """Test sequential runs go through poison_image, like the pool."""
+        good, bad = tmp_path / "good.jpg", tmp_path / "bad.jpg"
+        for image in (good, bad):
+            image.write_bytes(b"test")
+
+        def fail_for_bad(img, *_args, **_kwargs):
+            if img == bad:
+                raise RuntimeError("boom")
+
+        args = argparse.Namespace(
+            paths=[str(tmp_path)], preset="label_flip", dry_run=False,
+            verbose=False, sidecar=False, json=False, html=False, xmp=True,
+            iptc=False, exif=False, csv=None, rename_pattern=None,
+            true_hint=None, no_backup=True, batch_size=None, max_workers=1,
+        )
+        mock_iter_images.return_value = [good, bad]
+        mock_load_config.return_value = {}
+        mock_write_metadata.side_effect = fail_for_bad
+
+        result = cmd_poison(args)
+
+        assert result == 0
+        assert set(read_log(tmp_path)["entries"]) == {"good.jpg"}
+        printed = [str(c) for c in mock_print.call_args_list]
+        assert any("bad.jpg - Failed to write metadata: boom" in p for p in printed)
+        assert any("1/2 image(s)" in p for p in printed)
+
+    @patch("metadata_multitool.cli.iter_images")
+    @patch("metadata_multitool.batch.process_batch")
+    @patch("metadata_multitool.cli.load_config")
+    @patch("builtins.print")
+    def test_cmd_poison_streams_into_pool(
+        self,
+        mock_print,
+        mock_load_config,
+        mock_process_batch,
+        mock_iter_images,
+        tmp_path,
+    ):
+        """Test a multi-worker run hands the pool paths as they are read."""
+        images = [tmp_path / f"img{i}.jpg" for i in range(5)]
+        read = []
+
+        def lazy_images(_target):
+            for image in images:
+                read.append(image)
+                yield image
+
+        def run_batch(items, *_args, **_kwargs):
+            processed = 0
+            for img in items:
+                # Paths are pulled as the pool asks for them
+                assert len(read) <= images.index(img) + 1
+                processed += 1
+            return processed, processed, [], []
+
+        args = argparse.Namespace(
+            paths=[str(tmp_path)], preset="label_flip", dry_run=False,
+            verbose=False, sidecar=True, json=False, html=False, xmp=False,
+            iptc=False, exif=False, csv=None, rename_pattern=None,
+            true_hint=None, no_backup=True, batch_size=1, max_workers=2,
+        )
+        mock_iter_images.side_effect = lazy_images
+        mock_load_config.return_value = {}
+        mock_process_batch.side_effect = run_batch
+
+        result = cmd_poison(args)
+
+        assert result == 0
+        # One call, so one progress bar covers the whole run
+        mock_process_batch.assert_called_once()
+        assert any("5/5 image(s)" in str(call) for call in mock_print.call_args_list)
+
 
 class TestCmdRevert:
     """Test revert command functionality."""
@@ -515,7 +645,7 @@ class TestCmdRevert:
 class TestCmdInteractive:
     """Test interactive command functionality."""
 
-    @patch("metadata_multitool.cli.interactive_mode")
+    @patch("metadata_multitool.interactive.interactive_mode")
     def test_cmd_interactive_success(self, mock_interactive):
         """Test successful interactive command."""
         args = argparse.Namespace()
@@ -526,7 +656,7 @@ class TestCmdInteractive:
         assert result == 0
         mock_interactive.assert_called_once()
 
-    @patch("metadata_multitool.cli.interactive_mode")
+    @patch("metadata_multitool.interactive.interactive_mode")
     def test_cmd_interactive_error(self, mock_interactive):
         """Test interactive command with error."""
         args = argparse.Namespace()
@@ -619,6 +749,14 @@ class TestBuildParser:
         
         assert args.command == "gui"
 
+    def test_parser_built_once(self):
+        """Test the parser is reused across calls and parses repeatedly."""
+        parser = build_parser()
+
+        assert build_parser() is parser
+        assert parser.parse_args(["clean", "a.jpg"]).paths == ["a.jpg"]
+        assert parser.parse_args(["revert", "b"]).command == "revert"
+
 
 class TestValidateArgs:
     """Test argument validation."""
@@ -739,6 +877,22 @@ class TestMain:
         assert result == 0
         mock_cmd_gui.assert_called_once_with(mock_args)
 
+    @patch("metadata_multitool.cli.build_parser")
+    @patch("metadata_multitool.cli.cmd_audit")
+    def test_main_audit_command(self, mock_cmd_audit, mock_build_parser):
+        """Test main function with audit command."""
+        mock_parser = Mock()
+        mock_args = Mock()
+        mock_args.command = "audit"
+        mock_parser.parse_args.return_value = mock_args
+        mock_build_parser.return_value = mock_parser
+        mock_cmd_audit.return_value = 0
+
+        result = main(["audit", "."])
+
+        assert result == 0
+        mock_cmd_audit.assert_called_once_with(mock_args)
+
     @patch("metadata_multitool.cli.build_parser")
     def test_main_invalid_command(self, mock_build_parser):
         """Test main function with invalid command."""
@@ -772,12 +926,68 @@ class TestMain:
             assert result != 0
 
 
+class TestImports:
+    """Test the CLI's import cost."""
+
+    def test_subcommand_modules_not_imported_eagerly(self):
+        """Test importing the CLI leaves subcommand modules unloaded."""
+        import subprocess
+
+        code = (
+            "import sys, metadata_multitool.cli; "
+            "print(sorted(m for m in ('audit', 'batch', 'clean', 'interactive', 'poison') "
+            "if 'metadata_multitool.' + m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+
+class TestFormatMetadataPreview:
+    """Test the metadata preview text."""
+
+    def test_preview_lists_fields(self):
+        """Test preserved fields are all listed and removed ones are capped."""
+        from metadata_multitool.cli import _format_metadata_preview
+
+        preview = {
+            "file": "a.jpg",
+            "profile_used": "social_media",
+            "field_counts": {"total": 13, "preserve": 1, "remove": 12},
+            "would_preserve": ["EXIF:Orientation"],
+            "would_remove": [f"EXIF:Field{i:02d}" for i in range(12)],
+        }
+
+        lines = _format_metadata_preview(preview).splitlines()
+
+        assert "Profile: social_media" in lines
+        assert "  + EXIF:Orientation" in lines
+        assert "  - EXIF:Field09" in lines
+        assert "  - EXIF:Field10" not in lines
+        assert lines[-1] == "  ... and 2 more"
+
+class TestColorOutput:
+    """Test colored output is limited to terminals."""
+
+    def test_piped_output_is_plain(self, tmp_path):
+        """Test messages written to a pipe carry no ANSI escape codes."""
+        import subprocess
+
+        result = subprocess.run(
+            [sys.executable, "-m", "metadata_multitool.cli", "audit", str(tmp_path / "x")],
+            capture_output=True,
+            text=True,
+        )
+        assert "Path does not exist" in result.stdout
+        assert "\x1b[" not in result.stdout
+
 class TestIntegration:
     """Integration tests for CLI functionality."""
 
     @patch("metadata_multitool.cli.iter_images")
     @patch("metadata_multitool.cli.ensure_dir")
-    @patch("metadata_multitool.cli.clean_copy")
+    @patch("metadata_multitool.clean.clean_copy")
     @patch("metadata_multitool.cli.load_config")
     def test_full_clean_workflow(self, mock_load_config, mock_clean_copy, mock_ensure_dir, mock_iter_images, tmp_path):
         """Test complete clean workflow through main function."""
@@ -794,7 +1004,7 @@ class TestIntegration:
         mock_clean_copy.assert_called()
 
     @patch("metadata_multitool.cli.iter_images")
-    @patch("metadata_multitool.cli.write_sidecars")
+    @patch("metadata_multitool.poison.write_sidecars")
     @patch("metadata_multitool.cli.load_config")
     def test_full_poison_workflow(self, mock_load_config, mock_write_sidecars, mock_iter_images, tmp_path):
         """Test complete poison workflow through main function."""
@@ -0,0 +1,39 @@
+"""Tests for configuration loading."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+from metadata_multitool.config import DEFAULT_CONFIG, load_config
+
+
+class TestLoadConfig:
+    """Test loading configuration files."""
+
+    def test_file_parsed_once_until_changed(self, tmp_path: Path) -> None:
+        """Test repeated loads reuse the parse until the file changes."""
+        config_path = tmp_path / ".mm_config.yaml"
+        config_path.write_text("batch_size: 5\n", encoding="utf-8")
+
+        with patch("yaml.safe_load", wraps=yaml.safe_load) as mock_load:
+            assert load_config(config_path)["batch_size"] == 5
+            assert load_config(str(config_path))["batch_size"] == 5
+            assert mock_load.call_count == 1
+
+            config_path.write_text("batch_size: 50\n", encoding="utf-8")
+            stat = config_path.stat()
+            os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            assert load_config(config_path)["batch_size"] == 50
+            assert mock_load.call_count == 2
+
+    def test_each_load_returns_own_copy(self, tmp_path: Path) -> None:
+        """Test changing a loaded config does not affect later loads."""
+        config_path = tmp_path / ".mm_config.yaml"
+        config_path.write_text("supported_formats: [.jpg]\n", encoding="utf-8")
+
+        load_config(config_path)["supported_formats"].append(".png")
+
+        assert load_config(config_path)["supported_formats"] == [".jpg"]
+        assert load_config(tmp_path / "missing.yaml") == DEFAULT_CONFIG
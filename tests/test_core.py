@@ -1,6 +1,8 @@
 """Tests for core module functionality."""
 
 import json
+import os
+import shutil
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
@@ -10,6 +12,7 @@ import pytest
 from metadata_multitool.core import (
     InvalidPathError,
     ensure_dir,
+    fast_copy,
     iter_images,
     rand_token,
     read_log,
@@ -78,6 +81,127 @@ class TestIterImages:
         names = {f.name for f in result}
         assert names == {"nested.jpg", "root.png"}
 
+    def test_iter_images_not_recursive(self, tmp_path: Path) -> None:
+        """Test subdirectories are skipped when not recursing."""
+        subdir = tmp_path / "subdir"
+        subdir.mkdir()
+        (subdir / "nested.jpg").touch()
+        (tmp_path / "root.png").touch()
+
+        assert list(iter_images(tmp_path, recursive=False)) == [tmp_path / "root.png"]
+
+    def test_iter_images_survives_renames(self, tmp_path: Path) -> None:
+        """Test files renamed while iterating are not listed again."""
+        # Enough entries that the directory takes several reads to list
+        count = 4000
+        for i in range(count):
+            (tmp_path / f"image_with_a_long_name_{i:05d}.jpg").touch()
+
+        seen = []
+        for img in iter_images(tmp_path):
+            seen.append(img.name)
+            img.rename(img.with_name(f"{img.stem}_x{img.suffix}"))
+
+        assert len(seen) == count
+        assert not [name for name in seen if name.endswith("_x.jpg")]
+
+
+class TestIterImagesWithSizes:
+    """Test image discovery with file sizes."""
+
+    def test_yields_paths_with_sizes(self, tmp_path: Path) -> None:
+        """Test images are yielded with their file sizes."""
+        (tmp_path / "a.jpg").write_bytes(b"x" * 10)
+        (tmp_path / "b.PNG").write_bytes(b"x" * 3)
+        (tmp_path / "notes.txt").write_text("skip")
+
+        result = sorted(iter_images(tmp_path, with_sizes=True))
+        assert result == [(tmp_path / "a.jpg", 10), (tmp_path / "b.PNG", 3)]
+
+    def test_recursive_flag(self, tmp_path: Path) -> None:
+        """Test subdirectories are only walked when recursive."""
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        (tmp_path / "top.jpg").touch()
+        (sub / "nested.jpg").touch()
+
+        recursive = {p for p, _ in iter_images(tmp_path, recursive=True, with_sizes=True)}
+        flat = {p for p, _ in iter_images(tmp_path, recursive=False, with_sizes=True)}
+        assert recursive == {tmp_path / "top.jpg", sub / "nested.jpg"}
+        assert flat == {tmp_path / "top.jpg"}
+
+    def test_single_file(self, tmp_path: Path) -> None:
+        """Test a single image path yields itself."""
+        img_file = tmp_path / "one.jpg"
+        img_file.write_bytes(b"abc")
+
+        assert list(iter_images(img_file, with_sizes=True)) == [(img_file, 3)]
+
+    def test_nonexistent_path(self, tmp_path: Path) -> None:
+        """Test a missing path raises InvalidPathError."""
+        with pytest.raises(InvalidPathError):
+            list(iter_images(tmp_path / "missing", with_sizes=True))
+
+
+class TestFastCopy:
+    """Test the clone-first file copy."""
+
+    def test_copies_contents_and_times(self, tmp_path: Path) -> None:
+        """Test contents and modification time match the source."""
+        src = tmp_path / "src.jpg"
+        src.write_bytes(b"x" * 5000)
+        os.utime(src, (1_000_000, 1_000_000))
+        dst = tmp_path / "dst.jpg"
+        dst.write_bytes(b"stale contents that are longer than the source" * 200)
+
+        assert fast_copy(src, dst) == dst
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime == 1_000_000
+
+    def test_refuses_to_copy_onto_itself(self, tmp_path: Path) -> None:
+        """Test copying a file onto itself raises and keeps its contents."""
+        src = tmp_path / "src.jpg"
+        src.write_bytes(b"x" * 5000)
+
+        with pytest.raises(shutil.SameFileError):
+            fast_copy(src, tmp_path / "." / "src.jpg")
+
+        assert src.read_bytes() == b"x" * 5000
+
+    def test_falls_back_to_buffered_copy(self, tmp_path: Path) -> None:
+        """Test the read/write loop is used when kernel copies fail."""
+        src = tmp_path / "src.jpg"
+        src.write_bytes(b"abc" * 1000)
+        dst = tmp_path / "dst.jpg"
+
+        with patch("fcntl.ioctl", side_effect=OSError("not supported")), patch(
+            "os.copy_file_range", side_effect=OSError("cross-device"), create=True
+        ), patch("os.sendfile", side_effect=OSError("not supported"), create=True):
+            fast_copy(src, dst)
+
+        assert dst.read_bytes() == src.read_bytes()
+
+    def test_resumes_after_partial_kernel_copy(self, tmp_path: Path) -> None:
+        """Test a kernel copy failing part-way is finished by the next method."""
+        src = tmp_path / "src.jpg"
+        src.write_bytes(bytes(range(256)) * 100)
+        dst = tmp_path / "dst.jpg"
+        calls = []
+
+        def copy_some(src_fd, dst_fd, count, offset_src, offset_dst):
+            if calls:
+                raise OSError("cross-device")
+            calls.append(offset_src)
+            return os.pwrite(dst_fd, os.pread(src_fd, 1000, offset_src), offset_dst)
+
+        with patch("fcntl.ioctl", side_effect=OSError("not supported")), patch(
+            "os.copy_file_range", side_effect=copy_some, create=True
+        ):
+            fast_copy(src, dst)
+
+        assert calls == [0]
+        assert dst.read_bytes() == src.read_bytes()
+
 
 class TestEnsureDir:
     """Test directory creation functionality."""
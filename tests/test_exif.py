@@ -1,13 +1,26 @@
 """Tests for EXIF module functionality."""
 
+import json
 import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 from PIL import Image
 
-from metadata_multitool.exif import has_exiftool, run_exiftool, strip_all_metadata
+from metadata_multitool.exif import (
+    ExifToolSession,
+    get_file_metadata,
+    get_metadata_batch,
+    get_metadata_fields,
+    get_metadata_fields_batch,
+    has_exiftool,
+    run_exiftool,
+    run_exiftool_persistent,
+    strip_all_metadata,
+    strip_all_metadata_batch,
+)
 
 
 class TestHasExiftool:
@@ -40,6 +53,15 @@ class TestHasExiftool:
             result = has_exiftool()
             assert result is False
 
+    def test_has_exiftool_probes_once(self) -> None:
+        """Test the ExifTool probe runs once per process."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0)
+
+            assert has_exiftool() is True
+            assert has_exiftool() is True
+            mock_run.assert_called_once()
+
 
 class TestRunExiftool:
     """Test exiftool execution."""
@@ -84,7 +106,7 @@ class TestStripAllMetadata:
             img.save(img_path, "JPEG")
 
         with patch("metadata_multitool.exif.has_exiftool", return_value=True):
-            with patch("metadata_multitool.exif.run_exiftool") as mock_run:
+            with patch("metadata_multitool.exif.run_exiftool_persistent") as mock_run:
                 strip_all_metadata(img_path)
 
                 mock_run.assert_called_once_with(
@@ -98,7 +120,7 @@ class TestStripAllMetadata:
             img.save(img_path, "JPEG")
 
         with patch("metadata_multitool.exif.has_exiftool", return_value=False):
-            with patch("metadata_multitool.exif.run_exiftool") as mock_run:
+            with patch("metadata_multitool.exif.run_exiftool_persistent") as mock_run:
                 strip_all_metadata(img_path)
 
                 # Should not call exiftool
@@ -138,26 +160,265 @@ class TestStripAllMetadata:
                 img.save(img_path, format_name)
 
             with patch("metadata_multitool.exif.has_exiftool", return_value=True):
-                with patch("metadata_multitool.exif.run_exiftool") as mock_run:
+                with patch("metadata_multitool.exif.run_exiftool_persistent") as mock_run:
                     strip_all_metadata(img_path)
 
                     if filename.endswith('.bmp'):
-                        # BMP files are skipped, so run_exiftool should not be called
+                        # BMP files are skipped, so exiftool should not be called
                         mock_run.assert_not_called()
                     else:
                         mock_run.assert_called_once_with(
                             ["-overwrite_original", "-all=", str(img_path)]
                         )
 
+    def test_strip_all_metadata_to_out_path(self, tmp_path: Path) -> None:
+        """Test ExifTool writes the stripped copy directly with -o."""
+        img_path = tmp_path / "test.tiff"
+        img_path.write_bytes(b"image")
+        out_path = tmp_path / "out.tiff"
+        out_path.write_bytes(b"stale")
+
+        with patch("metadata_multitool.exif.has_exiftool", return_value=True):
+            with patch("metadata_multitool.exif.run_exiftool_persistent") as mock_run:
+                strip_all_metadata(img_path, out_path)
+
+        mock_run.assert_called_once_with(
+            ["-all=", "-o", str(out_path), str(img_path)]
+        )
+        # ExifTool wrote nothing, as for an unreadable file: the original is kept
+        assert out_path.read_bytes() == b"image"
+
     def test_strip_all_metadata_nonexistent_file(self, tmp_path: Path) -> None:
         """Test metadata stripping with nonexistent file."""
         nonexistent_path = tmp_path / "nonexistent.jpg"
 
         with patch("metadata_multitool.exif.has_exiftool", return_value=True):
-            with patch("metadata_multitool.exif.run_exiftool") as mock_run:
+            with patch("metadata_multitool.exif.run_exiftool_persistent") as mock_run:
                 # This should raise an exception when exiftool tries to process
                 # a nonexistent file
                 mock_run.side_effect = subprocess.CalledProcessError(1, "exiftool")
 
                 with pytest.raises(subprocess.CalledProcessError):
                     strip_all_metadata(nonexistent_path)
+
+
+class TestStripAllMetadataBatch:
+    """Test stripping many files with one ExifTool command."""
+
+    def test_one_command_for_all_files(self, tmp_path: Path) -> None:
+        """Test every file goes into a single command, skipping BMP files."""
+        paths = [tmp_path / "a.jpg", tmp_path / "b.bmp", tmp_path / "c.tiff"]
+
+        with patch("metadata_multitool.exif.has_exiftool", return_value=True):
+            with patch("metadata_multitool.exif.run_exiftool_persistent") as mock_run:
+                strip_all_metadata_batch(paths)
+
+        mock_run.assert_called_once_with(
+            ["-overwrite_original", "-all=", str(paths[0]), str(paths[2])]
+        )
+
+    def test_without_exiftool(self, tmp_path: Path) -> None:
+        """Test files are stripped one by one without ExifTool."""
+        paths = [tmp_path / "a.jpg", tmp_path / "c.tiff"]
+
+        with patch("metadata_multitool.exif.has_exiftool", return_value=False):
+            with patch("metadata_multitool.exif.strip_all_metadata") as mock_strip:
+                strip_all_metadata_batch(paths)
+
+        assert [call.args[0] for call in mock_strip.call_args_list] == paths
+
+    def test_copies_into_directory(self, tmp_path: Path) -> None:
+        """Test copies are written to a directory, replacing stale ones."""
+        paths = [tmp_path / "a.jpg", tmp_path / "b.bmp"]
+        for path in paths:
+            path.write_bytes(b"image")
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        (out_dir / "a.jpg").write_bytes(b"stale")
+
+        def write_copy(args: list) -> None:
+            assert not (out_dir / "a.jpg").exists()
+            (out_dir / "a.jpg").write_bytes(b"stripped")
+
+        with patch("metadata_multitool.exif.has_exiftool", return_value=True):
+            with patch(
+                "metadata_multitool.exif.run_exiftool_persistent", side_effect=write_copy
+            ) as mock_run:
+                strip_all_metadata_batch(paths, out_dir)
+
+        mock_run.assert_called_once_with(["-all=", "-o", f"{out_dir}/", str(paths[0])])
+        assert (out_dir / "a.jpg").read_bytes() == b"stripped"
+        assert (out_dir / "b.bmp").read_bytes() == b"image"
+
+# Speaks just enough of the -stay_open protocol: echoes each command's
+# arguments and process id, and reports an error for files named "bad"
+FAKE_EXIFTOOL = """
+import os, sys
+args = []
+for line in sys.stdin:
+    line = line.rstrip("\\n")
+    if args and args[-1] == "-stay_open" and line == "False":
+        break
+    if line != "-execute":
+        args.append(line)
+        continue
+    ready = args[args.index("-echo4") + 1]
+    print(os.getpid(), *args[: args.index("-echo4")])
+    print(ready, flush=True)
+    if any("bad" in arg for arg in args):
+        print("Error: bad file", file=sys.stderr)
+    print(ready, file=sys.stderr, flush=True)
+    args = []
+"""
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a shebang script")
+class TestExifToolSession:
+    """Test the persistent ExifTool session."""
+
+    @pytest.fixture
+    def session(self, tmp_path: Path):
+        script = tmp_path / "exiftool"
+        script.write_text(f"#!{sys.executable}\n{FAKE_EXIFTOOL}")
+        script.chmod(0o755)
+        session = ExifToolSession(str(script))
+        yield session
+        session.close()
+
+    def test_commands_share_one_process(self, session: ExifToolSession) -> None:
+        """Test consecutive commands run in the same ExifTool process."""
+        first, _ = session.execute(["-all=", "a.jpg"])
+        second, _ = session.execute(["-all=", "b.jpg"])
+
+        assert first.split()[1:] == ["-charset", "filename=utf8", "-all=", "a.jpg"]
+        assert first.split()[0] == second.split()[0]
+        assert second.split()[-1] == "b.jpg"
+
+    def test_errors_returned_per_command(self, session: ExifToolSession) -> None:
+        """Test stderr is split at each command's ready marker."""
+        _, stderr = session.execute(["bad.jpg"])
+        assert "Error: bad file" in stderr
+        _, stderr = session.execute(["good.jpg"])
+        assert stderr == ""
+
+    def test_close_stops_process(self, session: ExifToolSession) -> None:
+        """Test closing the session ends the ExifTool process."""
+        session.execute(["a.jpg"])
+        assert session.running
+        session.close()
+        assert not session.running
+
+    def test_restarts_after_exit(self, session: ExifToolSession) -> None:
+        """Test a session whose process died starts a new one."""
+        first, _ = session.execute(["a.jpg"])
+        session._process.kill()
+        session._process.wait()
+        second, _ = session.execute(["a.jpg"])
+        assert first.split()[0] != second.split()[0]
+
+    def test_persistent_run_raises_on_error(self, session: ExifToolSession) -> None:
+        """Test ExifTool errors from the session raise like run_exiftool."""
+        with patch(
+            "metadata_multitool.exif.get_exiftool_session", return_value=session
+        ):
+            run_exiftool_persistent(["good.jpg"])
+            with pytest.raises(subprocess.CalledProcessError):
+                run_exiftool_persistent(["bad.jpg"])
+
+
+class TestGetMetadataFields:
+    """Test metadata field name extraction."""
+
+    def test_field_names_interned(self, tmp_path: Path) -> None:
+        """Test field names are interned and bookkeeping keys dropped."""
+        name = "".join(["EXIF:", "Make"])
+        stdout = json.dumps([{"SourceFile": "a.jpg", name: "Canon"}])
+        session = Mock()
+        session.execute.return_value = (stdout, "")
+
+        fields = get_metadata_fields(tmp_path / "a.jpg", session)
+
+        assert fields == {"EXIF:Make"}
+        assert next(iter(fields)) is sys.intern(name)
+
+
+class TestGetMetadataBatch:
+    """Test batched metadata extraction."""
+
+    def test_batch_uses_single_exiftool_run(self, tmp_path: Path) -> None:
+        """Test all paths are read by one ExifTool process via an argfile."""
+        paths = [tmp_path / "a.jpg", tmp_path / "b.jpg"]
+        output = json.dumps(
+            [
+                {
+                    "SourceFile": str(paths[0]),
+                    "ExifTool:ExifToolVersion": 12.5,
+                    "EXIF:Make": "Canon",
+                },
+                {"SourceFile": str(paths[1]), "GPS:GPSLatitude": "12.3"},
+            ]
+        )
+
+        with patch("metadata_multitool.exif.has_exiftool", return_value=True):
+            with patch("subprocess.run") as mock_run:
+                mock_run.return_value = Mock(returncode=0, stdout=output, stderr="")
+
+                result = get_metadata_batch(paths)
+
+        mock_run.assert_called_once()
+        assert "-@" in mock_run.call_args.args[0]
+        assert mock_run.call_args.kwargs["input"].split() == [str(p) for p in paths]
+        assert result == {
+            paths[0]: {"EXIF:Make": "Canon"},
+            paths[1]: {"GPS:GPSLatitude": "12.3"},
+        }
+
+    def test_batch_omits_unreadable_files(self, tmp_path: Path) -> None:
+        """Test files missing from ExifTool output are left out."""
+        paths = [tmp_path / "a.jpg", tmp_path / "broken.jpg"]
+        output = json.dumps([{"SourceFile": str(paths[0]), "EXIF:Model": "X"}])
+
+        with patch("metadata_multitool.exif.has_exiftool", return_value=True):
+            with patch("subprocess.run") as mock_run:
+                mock_run.return_value = Mock(returncode=1, stdout=output, stderr="")
+
+                result = get_metadata_batch(paths)
+
+        assert list(result) == [paths[0]]
+
+    def test_batch_without_exiftool(self, tmp_path: Path) -> None:
+        """Test batch extraction returns nothing when ExifTool is missing."""
+        with patch("metadata_multitool.exif.has_exiftool", return_value=False):
+            with patch("subprocess.run") as mock_run:
+                assert get_metadata_batch([tmp_path / "a.jpg"]) == {}
+                mock_run.assert_not_called()
+
+    def test_fields_batch_uses_short_names(self, tmp_path: Path) -> None:
+        """Test batched field names match get_metadata_fields' naming."""
+        paths = [tmp_path / "a.jpg", tmp_path / "b.jpg"]
+        output = json.dumps(
+            [
+                {"SourceFile": str(paths[0]), "ExifToolVersion": 12.5, "Make": "X"},
+                {"SourceFile": str(paths[1])},
+            ]
+        )
+
+        with patch("metadata_multitool.exif.has_exiftool", return_value=True):
+            with patch("subprocess.run") as mock_run:
+                mock_run.return_value = Mock(returncode=0, stdout=output, stderr="")
+
+                result = get_metadata_fields_batch(paths)
+
+        assert "-s" in mock_run.call_args.args[0]
+        assert result == {paths[0]: {"Make"}, paths[1]: set()}
+
+    def test_get_file_metadata_single_file(self, tmp_path: Path) -> None:
+        """Test single-file metadata goes through the batch reader."""
+        path = tmp_path / "a.jpg"
+
+        with patch(
+            "metadata_multitool.exif.get_metadata_batch",
+            return_value={path: {"EXIF:Make": "Nikon"}},
+        ) as mock_batch:
+            assert get_file_metadata(path) == {"EXIF:Make": "Nikon"}
+            mock_batch.assert_called_once_with([path])
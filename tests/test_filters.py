@@ -200,6 +200,54 @@ class TestDateFilter:
         date_filter = filter_obj.filters[0]
         assert date_filter(sample_image)
 
+    def test_size_and_date_filters_share_one_stat(self, tmp_path):
+        """Test filter_images stats each file once for both filters."""
+        image = tmp_path / "a.jpg"
+        image.write_bytes(b"abc")
+        filter_obj = FileFilter()
+        filter_obj.add_date_filter(min_date=datetime.now() - timedelta(days=1))
+        filter_obj.add_size_filter(min_size=1)
+
+        with patch("metadata_multitool.filters.iter_images", return_value=[image]):
+            with patch.object(
+                Path, "stat", autospec=True, side_effect=os.stat
+            ) as stat:
+                for _ in range(2):
+                    assert filter_obj.filter_images(tmp_path) == [image]
+
+        assert stat.call_count == 2
+
+    def test_accepts_stats_once_and_stops_at_first_rejection(self, tmp_path):
+        """Test accepts shares one stat and skips filters after a rejection."""
+        image = tmp_path / "a.jpg"
+        image.write_bytes(b"abc")
+        filter_obj = FileFilter()
+        expensive = Mock(return_value=True)
+        filter_obj.add_custom_filter(expensive)
+        filter_obj.add_date_filter(min_date=datetime.now() - timedelta(days=1))
+        filter_obj.add_size_filter(min_size=1)
+
+        with patch.object(Path, "stat", autospec=True, side_effect=os.stat) as stat:
+            assert filter_obj.accepts(image)
+        assert stat.call_count == 1
+
+        filter_obj.add_size_filter(min_size=10)
+        expensive.reset_mock()
+        assert not filter_obj.accepts(image)
+        expensive.assert_not_called()
+
+    def test_size_and_date_filters_stat_on_their_own(self, tmp_path):
+        """Test the filters still stat the file when called directly."""
+        image = tmp_path / "a.jpg"
+        image.write_bytes(b"abc")
+        filter_obj = FileFilter()
+        filter_obj.add_date_filter(min_date=datetime.now() - timedelta(days=1))
+        filter_obj.add_size_filter(min_size=4)
+
+        size_filter, date_filter = filter_obj.filters
+        assert not size_filter(image)
+        assert date_filter(image)
+
 
 class TestFormatFilter:
     """Test format-based filtering."""
@@ -407,6 +455,33 @@ class TestFilterImages:
             result = filter_obj.filter_images(tmp_path)
             assert result == []
 
+    @patch("metadata_multitool.filters.has_exiftool")
+    @patch("metadata_multitool.filters.run_exiftool")
+    def test_filters_run_cheapest_first(self, mock_run_exiftool, mock_has_exiftool, tmp_path):
+        """Test cheap filters reject files before the metadata check runs."""
+        mock_has_exiftool.return_value = True
+        mock_run_exiftool.return_value = "Make: Canon"
+        jpg_file = tmp_path / "photo.jpg"
+        png_file = tmp_path / "photo.png"
+        jpg_file.write_bytes(b"jpg")
+        png_file.write_bytes(b"png")
+
+        filter_obj = FileFilter()
+        filter_obj.add_metadata_filter(has_metadata=True)
+        filter_obj.add_size_filter(min_size=1)
+        filter_obj.add_format_filter([".jpg"])
+
+        with patch("metadata_multitool.filters.iter_images") as mock_iter:
+            mock_iter.return_value = [jpg_file, png_file]
+
+            result = filter_obj.filter_images(tmp_path)
+
+        assert result == [jpg_file]
+        mock_run_exiftool.assert_called_once()
+        assert [f.__name__ for f in filter_obj.filters] == [
+            "format_filter", "size_filter", "metadata_filter"
+        ]
+
 
 class TestParseSizeFilter:
     """Test size filter parsing."""
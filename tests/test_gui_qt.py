@@ -44,17 +44,15 @@ pytestmark = pytest.mark.skipif(
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def qapp():
-    """Create QApplication instance for testing."""
+    """Provide the shared application instance for the whole test session."""
     if not GUI_AVAILABLE:
         pytest.skip("PyQt6 not available")
-    
-    # Check if QApplication already exists
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
+
+    from metadata_multitool.gui_qt.testing import get_shared_app
+
+    yield get_shared_app()
     # Don't quit the app here as it might be needed for other tests
 
 
@@ -125,6 +123,17 @@ class TestMetadataMultitoolApp:
         app = MetadataMultitoolApp([])
         assert app is not None
 
+    def test_app_reuses_running_instance(self, qapp):
+        """Test constructing the app again returns the running instance."""
+        if not GUI_AVAILABLE:
+            pytest.skip("PyQt6 not available")
+
+        theme_manager = qapp.theme_manager
+        app = MetadataMultitoolApp([])
+
+        assert app is qapp
+        assert app.theme_manager is theme_manager
+
 
 class TestMainWindow:
     """Test the main window functionality."""
@@ -294,6 +303,88 @@ class TestGUIUtilities:
         manager = ThemeManager()
         assert manager is not None
 
+    def test_theme_stylesheet_cached(self, qapp):
+        """Test that a theme stylesheet is only resolved once."""
+        from metadata_multitool.gui_qt.views.common.theme_manager import ThemeManager
+
+        manager = ThemeManager()
+        ThemeManager._stylesheet_cache.clear()
+
+        with patch.object(manager, "_load_stylesheet", return_value=None) as mock_load:
+            first = manager.get_stylesheet("dark")
+            second = manager.get_stylesheet("dark")
+
+        assert first is second
+        assert "Dark Theme" in first
+        mock_load.assert_called_once()
+
+    def test_theme_reapply_skips_set_stylesheet(self, qapp):
+        """Test that re-applying the active theme does not reset the stylesheet."""
+        from metadata_multitool.gui_qt.views.common.theme_manager import ThemeManager
+
+        manager = ThemeManager()
+        manager.apply_theme("dark")
+
+        with patch.object(qapp, "setStyleSheet") as mock_set:
+            assert manager.apply_theme("dark") is True
+            assert ThemeManager().apply_theme("dark") is True
+
+        mock_set.assert_not_called()
+
+    def test_gui_settings_attributes(self, qapp):
+        """Test GUI settings are served from the typed settings object."""
+        from metadata_multitool.gui_qt.models.config_model import ConfigModel
+        from metadata_multitool.gui_qt.services.config_service import ConfigService
+
+        model = ConfigModel(ConfigService())
+        assert model.gui_settings.theme == "light"
+        assert model.get_gui_setting("theme", "dark") == "light"
+        assert model.get_gui_setting("unknown_setting", 42) == 42
+
+        model.set_gui_setting("theme", "dark")
+        assert model.gui_settings.theme == "dark"
+        assert model.get_gui_setting("theme") == "dark"
+
+        model.update_config({"gui_settings": {"show_thumbnails": False}})
+        assert model.get_gui_setting("show_thumbnails") is False
+        assert model.get_gui_setting("theme") == "light"
+
+    def test_gui_settings_follow_config_changes(self, qapp):
+        """Test values written through the config refresh the GUI settings."""
+        import dataclasses
+
+        from metadata_multitool.gui_qt.models.config_model import ConfigModel
+        from metadata_multitool.gui_qt.services.config_service import ConfigService
+
+        model = ConfigModel(ConfigService())
+        model.set_value("gui_settings.theme", "dark")
+        assert model.gui_settings.theme == "dark"
+
+        model.config_service.set_value("gui_settings.show_thumbnails", False)
+        assert model.get_gui_setting("show_thumbnails") is False
+
+        model.set_value("gui_settings.zoom", 2)
+        assert model.get_gui_setting("zoom", 1) == 2
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            model.gui_settings.theme = "light"
+
+    def test_operation_state_description(self, qapp):
+        """Test state descriptions track state and operation type."""
+        from metadata_multitool.gui_qt.models.operation_model import OperationModel
+
+        model = OperationModel()
+        assert model.get_state_description() == "Ready"
+
+        model.start_operation("clean")
+        assert model.get_state_description() == "Running clean..."
+
+        model.cancel_operation()
+        assert model.get_state_description() == "Cancelled clean"
+
+        model.start_operation("poison")
+        assert model.get_state_description() == "Running poison..."
+
 
 class TestMainFunction:
     """Test the main function entry point."""
@@ -579,6 +670,37 @@ class TestGUIFileOperations:
                 except (AttributeError, NotImplementedError):
                     pass
 
+    def test_operation_panels_created_on_first_show(self, qapp):
+        """Test that poison/revert panels are built when their tab is shown."""
+        from metadata_multitool.gui_qt.models.config_model import ConfigModel
+        from metadata_multitool.gui_qt.models.file_model import FileModel
+        from metadata_multitool.gui_qt.models.operation_model import OperationModel
+        from metadata_multitool.gui_qt.services.config_service import ConfigService
+        from metadata_multitool.gui_qt.utils.icons import IconManager
+        from metadata_multitool.gui_qt.views.common.theme_manager import ThemeManager
+        from metadata_multitool.gui_qt.views.main_view import MainView
+
+        view = MainView(
+            FileModel(),
+            ConfigModel(ConfigService()),
+            OperationModel(),
+            IconManager(),
+            ThemeManager(),
+        )
+        assert view.clean_panel is not None
+        assert view.poison_panel is None
+        assert view.revert_panel is None
+
+        view.set_mode("poison")
+        poison_panel = view.poison_panel
+        assert poison_panel is not None
+        assert view.revert_panel is None
+        assert view.get_current_mode() == "poison"
+
+        view.set_mode("clean")
+        view.set_mode("poison")
+        assert view.poison_panel is poison_panel
+
     def test_batch_operation_handling(self, main_window, qtbot):
         """Test batch operation handling.""" 
         if not GUI_AVAILABLE:
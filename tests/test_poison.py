@@ -14,6 +14,7 @@ from metadata_multitool.poison import (
     caption_style_bloat,
     load_csv_mapping,
     make_caption,
+    poison_image,
     rename_with_pattern,
     write_metadata,
     write_sidecars,
@@ -112,6 +113,14 @@ class TestCaptionLabelFlip:
         assert "custom_toaster" in caption
         assert "custom_toaster" in tags
 
+    def test_caption_label_flip_default_labels_match_first(self) -> None:
+        """Test default labels are tried before new custom ones, as when merged."""
+        mapping = {"zebra": "kettle", "dog": "blender"}
+
+        assert caption_label_flip("zebra and dog", mapping)[1][0] == "blender"
+        assert caption_label_flip("zebra", mapping)[1][0] == "kettle"
+        assert caption_label_flip("nothing", mapping)[1][0] == "kettle"
+
     def test_caption_label_flip_no_match(self) -> None:
         """Test label flip when no mapping matches."""
         mapping = {}
@@ -453,3 +462,48 @@ class TestRenameWithPattern:
         expected = tmp_path / "original_toaster.png"
         assert result == expected
         assert result.suffix == ".png"
+
+
+class TestPoisonImage:
+    """Test the per-image poison worker."""
+
+    OPTIONS = dict(
+        preset="label_flip",
+        true_hint=None,
+        mapping={"cat": "dog"},
+        rename_pattern=None,
+        sidecar=True,
+        emit_json=False,
+        xmp=False,
+        iptc=False,
+        exif=False,
+        html=True,
+    )
+
+    def test_returns_log_entry(self, tmp_path: Path) -> None:
+        """Test outputs are written and the log entry is returned, not recorded."""
+        img = tmp_path / "sub" / "cat.jpg"
+        img.parent.mkdir()
+        img.write_bytes(b"x")
+
+        with patch("metadata_multitool.poison.write_metadata"):
+            success, message, entry = poison_image(img, root=tmp_path, **self.OPTIONS)
+
+        rel, caption, _tags, original_name = entry
+        assert (success, message) == (True, "")
+        assert (rel, original_name) == ("sub/cat.jpg", "cat.jpg")
+        assert caption.startswith("dog")
+        assert (img.parent / "cat.txt").read_text(encoding="utf-8") == caption
+        assert (img.parent / "cat.html").exists()
+
+    def test_metadata_failure(self, tmp_path: Path) -> None:
+        """Test a metadata write failure is reported without a log entry."""
+        img = tmp_path / "cat.jpg"
+        img.write_bytes(b"x")
+
+        with patch(
+            "metadata_multitool.poison.write_metadata", side_effect=OSError("boom")
+        ):
+            result = poison_image(img, root=tmp_path, **self.OPTIONS)
+
+        assert result == (False, "Failed to write metadata: boom", None)